@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Measure writing and reading of the columnar history export
+
+Usage: python benchmarks/bench_export.py [--days 30] [--file month.hlcx]
+"""
+from __future__ import print_function
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from hilink.export import ColumnarWriter, ColumnarReader  # noqa: E402
+
+
+def snapshots(count, seed=1):
+    """Synthetic 1 second samples with a slowly drifting signal"""
+    rnd = random.Random(seed)
+    rssi, sinr = -70, 10
+    for _ in range(count):
+        rssi = min(-50, max(-110, rssi + rnd.choice((-1, 0, 0, 0, 1))))
+        sinr = min(30, max(-5, sinr + rnd.choice((-1, 0, 1))))
+        yield {"level": 4, "status": "Connected", "network": "LTE",
+               "values": {"rssi": rssi, "rsrp": rssi - 28, "rsrq": -11,
+                          "sinr": sinr},
+               "params": OrderedDict((("cell_id", "CELL_ID: 20542467"),
+                                      ("pci", "PCI: 283")))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--file")
+    args = parser.parse_args()
+
+    path = args.file or os.path.join(tempfile.mkdtemp(), "bench.hlcx")
+    rows = int(args.days * 86400)
+    begin = 1500000000.0
+
+    if not os.path.exists(path):
+        started = time.time()
+        writer = ColumnarWriter(path, "bench")
+        for index, snapshot in enumerate(snapshots(rows)):
+            writer.append(begin + index, snapshot)
+        writer.close()
+        print("write      %8.2f s  %d rows, %.1f MB" % (
+            time.time() - started, rows, os.path.getsize(path) / 1e6))
+
+    started = time.time()
+    reader = ColumnarReader(path)
+    print("open       %8.1f ms  %d chunks" % (
+        (time.time() - started) * 1000, len(reader.chunks)))
+
+    started = time.time()
+    result = reader.read()
+    print("read all   %8.1f ms  %d rows" % (
+        (time.time() - started) * 1000, len(result["time"])))
+
+    started = time.time()
+    result = reader.read(columns=("rssi",))
+    print("read rssi  %8.1f ms" % ((time.time() - started) * 1000))
+
+    started = time.time()
+    result = reader.read(begin + 86400 * 10, begin + 86400 * 11)
+    print("read a day %8.1f ms  %d rows" % (
+        (time.time() - started) * 1000, len(result["time"])))
+    reader.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Compare flat response parser with ElementTree on recorded responses
+
+Usage: python benchmarks/bench_parser.py [-n NUMBER]
+"""
+from __future__ import print_function
+import os
+import sys
+import timeit
+import argparse
+from xml.etree import ElementTree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from hilink.parser import parseFlat  # noqa: E402
+
+
+RESPONSES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "responses")
+
+# fields read by hilink.client from every response
+FIELDS = {
+    "status.xml": ("SignalIcon", "ConnectionStatus", "CurrentNetworkType",
+                   "CurrentNetworkTypeEx"),
+    "current-plmn.xml": ("ShortName", "FullName"),
+    "signal.xml": ("rssi", "rsrp", "rsrq", "rscp", "ecio", "sinr",
+                   "cell_id", "pci"),
+    "check-notifications.xml": ("UnreadMessage",),
+    "SesTokInfo.xml": ("SesInfo", "TokInfo"),
+}
+
+
+def elementTree(data, fields):
+    xml = ElementTree.fromstring(data)
+    return dict((key, xml.findtext(key)) for key in fields)
+
+
+def flat(data, fields):
+    response = parseFlat(data)
+    return dict((key, response.findtext(key)) for key in fields)
+
+
+def main(number):
+    parsers = (("ElementTree", elementTree), ("flat", flat))
+
+    print("%-26s %14s %14s" % (("response",) + tuple(
+        name for name, _ in parsers)))
+    totals = [0.0] * len(parsers)
+    for name in sorted(FIELDS):
+        with open(os.path.join(RESPONSES, name), "rb") as f:
+            data = f.read()
+        fields = FIELDS[name]
+
+        expected = elementTree(data, fields)
+        row = []
+        for i, (_, parser) in enumerate(parsers):
+            assert parser(data, fields) == expected, name
+            best = min(timeit.repeat(lambda: parser(data, fields),
+                                     number=number, repeat=3))
+            usec = best / number * 1e6
+            totals[i] += usec
+            row.append(usec)
+        print("%-26s %11.2f us %11.2f us" % ((name,) + tuple(row)))
+
+    print("%-26s %11.2f us %11.2f us" % (("tick",) + tuple(totals)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10000,
+                        help="parses per measurement")
+    main(parser.parse_args().number)
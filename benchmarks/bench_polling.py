@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Measure the polling engine against a fake HiLink modem
+
+Usage: python benchmarks/bench_polling.py [--modems 1 10 100 500] ...
+
+The fake modem runs in its own process, so CPU time reported here is
+spent by the client only.
+"""
+from __future__ import print_function
+import argparse
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+from multiprocessing.pool import ThreadPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from hilink.client import ModemClient, pollMany  # noqa: E402
+
+
+FAKE_MODEM = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "fakemodem.py")
+
+
+def freePort():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def startFakeModem(args):
+    port = freePort()
+    server = subprocess.Popen([
+        sys.executable, FAKE_MODEM, "--port", str(port),
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--timeout-rate", str(args.timeout_rate),
+        "--error-rate", str(args.error_rate)],
+        stdout=subprocess.PIPE)
+    # wait until it listens
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 0.1).close()
+            break
+        except socket.error:
+            time.sleep(0.05)
+    return server, "127.0.0.1:%d" % port
+
+
+def percentile(values, part):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * part))]
+
+
+def cpuTime():
+    if hasattr(time, "process_time"):
+        return time.process_time()
+    times = os.times()  # 2.x
+    return times[0] + times[1]
+
+
+def bench(ip, modems, ticks, concurrency):
+    clients = [ModemClient(ip, 2) for _ in range(modems)]
+    pool = ThreadPool(min(concurrency, modems * len(ModemClient.sections)))
+    # first tick opens connections and fetches tokens
+    pollMany(clients, pool)
+
+    latencies = []
+    started, cpuStarted = time.time(), cpuTime()
+    for _ in range(ticks):
+        tick = time.time()
+        pollMany(clients, pool)
+        latencies.append(time.time() - tick)
+    wall, cpu = time.time() - started, cpuTime() - cpuStarted
+
+    pool.close()
+    for client in clients:
+        client.close()
+
+    requests = modems * len(ModemClient.sections) * ticks
+    return {"p50": percentile(latencies, 0.5) * 1000,
+            "p95": percentile(latencies, 0.95) * 1000,
+            "rps": requests / wall,
+            "cpu": cpu / (modems * ticks) * 1000,
+            # kilobytes on Linux
+            "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modems", type=int, nargs="+",
+                        default=[1, 10, 100, 500])
+    parser.add_argument("--ticks", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, ip = startFakeModem(args)
+    try:
+        print("%7s %12s %12s %10s %14s %10s" % (
+            "modems", "tick p50", "tick p95", "req/s", "cpu/poll", "max rss"))
+        for modems in args.modems:
+            result = bench(ip, modems, args.ticks, args.concurrency)
+            print("%7d %9.1f ms %9.1f ms %10.0f %11.3f ms %7.1f MB" % (
+                modems, result["p50"], result["p95"], result["rps"],
+                result["cpu"], result["rss"]))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
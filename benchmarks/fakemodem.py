@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Local stand-in for the HiLink web API used by hilink.client
+
+Usage: python benchmarks/fakemodem.py [--port 8080] [--latency 0.05] ...
+then run hilink-tray -ip 127.0.0.1:8080
+"""
+from __future__ import print_function
+import argparse
+import random
+import re
+import socket
+import threading
+import time
+
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+except ImportError:  # >= 3.x
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+
+
+RESPONSE = '<?xml version="1.0" encoding="UTF-8"?>\n<response>\n%s</response>\n'
+ERROR = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+         '<error>\n<code>%s</code>\n<message></message>\n</error>\n')
+
+WRONG_SESSION = "125002"
+WRONG_TOKEN = "125003"
+NO_SUCH_API = "100002"
+
+
+def _fields(values):
+    return "".join("<%s>%s</%s>\n" % (key, value, key)
+                   for key, value in values)
+
+
+class FakeModem(object):
+    """FakeModem - state and responses of a simulated HiLink modem
+
+    latency, jitter - seconds added to every answer (jitter is +-uniform)
+    timeoutRate - part of requests that hang for `hang` seconds
+    errorRate, errorCode - part of requests answered with <error>
+    checkTokens - reject requests without a valid session cookie
+    messages - number of unread messages in inbox
+    legacy - old firmware without device/signal and CurrentNetworkTypeEx
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, timeoutRate=0.0,
+                 errorRate=0.0, errorCode=NO_SUCH_API, hang=5.0,
+                 checkTokens=True, seed=None, messages=0, legacy=False):
+        self.latency = latency
+        self.jitter = jitter
+        self.timeoutRate = timeoutRate
+        self.errorRate = errorRate
+        self.errorCode = errorCode
+        self.hang = hang
+        self.checkTokens = checkTokens
+        self.legacy = legacy
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions = set()
+        self._dataswitch = 1
+        self._rebootUntil = 0
+        self._rssi = -70
+        self._sinr = 10
+        self._connected = time.time()
+        self._uploaded = 0
+        self._downloaded = 0
+        self._inbox = []
+        for _ in range(messages):
+            self.receiveMessage()
+
+        self._handlers = {
+            "/api/webserver/SesTokInfo": self._tokens,
+            "/api/monitoring/status": self._status,
+            "/api/net/current-plmn": self._plmn,
+            "/api/device/signal": self._signal,
+            "/api/monitoring/check-notifications": self._notifications,
+            "/api/dialup/mobile-dataswitch": self._dataswitchHandler,
+            "/api/device/control": self._control,
+            "/api/sms/sms-list": self._smsList,
+            "/api/monitoring/traffic-statistics": self._traffic,
+            "/api/device/information": self._information,
+        }
+        if legacy:
+            del self._handlers["/api/device/signal"]
+
+    def receiveMessage(self, phone="+70000000000", content=None):
+        """Put new unread message into inbox"""
+        index = 40000 + len(self._inbox)
+        date = time.strftime("%Y-%m-%d %H:%M:%S",
+                             time.localtime(1500000000 + index))
+        self._inbox.insert(0, {"Smstat": 0, "Index": index, "Phone": phone,
+                               "Content": content or "Message %d" % index,
+                               "Date": date})
+
+    def respond(self, method, path, headers, body):
+        """Return (delay, response body), body None means drop connection"""
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency +
+                        self._random.uniform(-self.jitter, self.jitter))
+            if time.time() < self._rebootUntil:
+                return (delay, None)
+            if self._random.random() < self.timeoutRate:
+                return (self.hang, None)
+            if self._random.random() < self.errorRate:
+                return (delay, ERROR % self.errorCode)
+
+            handler = self._handlers.get(path)
+            if handler is None:
+                return (delay, ERROR % NO_SUCH_API)
+            if (self.checkTokens and handler != self._tokens and
+                    headers.get("Cookie") not in self._sessions):
+                return (delay, ERROR % WRONG_SESSION)
+            return (delay, handler(method, body))
+
+    def _tokens(self, method, body):
+        session = "SessionID=%032x" % self._random.getrandbits(128)
+        self._sessions.add(session)
+        return RESPONSE % _fields((("SesInfo", session),
+                                   ("TokInfo", "%032x" % self._random.getrandbits(128))))
+
+    def _status(self, method, body):
+        # signal level follows rssi random walk
+        self._rssi = min(-50, max(-110, self._rssi +
+                                  self._random.choice((-1, 0, 0, 0, 1))))
+        level = min(5, max(0, (self._rssi + 115) // 10))
+        fields = [("ConnectionStatus", 901 if self._dataswitch else 902),
+                  ("SignalIcon", level),
+                  ("CurrentNetworkType", 9 if self.legacy else 19),
+                  ("CurrentNetworkTypeEx", 101),
+                  ("RoamingStatus", 0),
+                  ("SimStatus", 1),
+                  ("ServiceStatus", 2)]
+        if self.legacy:
+            del fields[3]
+        return RESPONSE % _fields(fields)
+
+    def _information(self, method, body):
+        return RESPONSE % _fields((
+            ("DeviceName", "E3372"), ("SerialNumber", "FAKE00000001"),
+            ("SoftwareVersion", "21.180.01.00.00" if self.legacy
+             else "22.328.62.00.00")))
+
+    def _plmn(self, method, body):
+        return RESPONSE % _fields((("State", 0), ("FullName", "Fake Mobile"),
+                                   ("ShortName", "Fake"), ("Numeric", 25099),
+                                   ("Rat", 7)))
+
+    def _signal(self, method, body):
+        self._sinr = min(30, max(-5, self._sinr +
+                                 self._random.choice((-1, 0, 1))))
+        return RESPONSE % _fields((
+            ("pci", 283), ("sc", ""), ("cell_id", 20542467),
+            ("rsrq", "-11dB"), ("rsrp", "%ddBm" % (self._rssi - 28)),
+            ("rssi", "%ddBm" % self._rssi), ("sinr", "%ddB" % self._sinr),
+            ("rscp", ""), ("ecio", ""), ("mode", 7)))
+
+    def _notifications(self, method, body):
+        unread = sum(1 for msg in self._inbox if msg["Smstat"] == 0)
+        return RESPONSE % _fields((("UnreadMessage", unread),
+                                   ("SmsStorageFull", 0),
+                                   ("OnlineUpdateStatus", 10)))
+
+    def _traffic(self, method, body):
+        if self._dataswitch:
+            self._uploaded += self._random.randint(0, 50000)
+            self._downloaded += self._random.randint(0, 500000)
+        rate = self._random.randint(0, 250000)
+        return RESPONSE % _fields((
+            ("CurrentConnectTime", int(time.time() - self._connected)),
+            ("CurrentUpload", self._uploaded),
+            ("CurrentDownload", self._downloaded),
+            ("CurrentDownloadRate", rate),
+            ("CurrentUploadRate", rate // 10),
+            ("TotalUpload", self._uploaded),
+            ("TotalDownload", self._downloaded),
+            ("TotalConnectTime", int(time.time() - self._connected))))
+
+    def _dataswitchHandler(self, method, body):
+        match = re.search(r"<dataswitch>(\d)</dataswitch>", body or "")
+        if method == "POST" and match:
+            self._dataswitch = int(match.group(1))
+            return RESPONSE % "OK"
+        return RESPONSE % _fields((("dataswitch", self._dataswitch),))
+
+    def _smsList(self, method, body):
+        page = int(re.search(r"<PageIndex>(\d+)<", body).group(1))
+        count = int(re.search(r"<ReadCount>(\d+)<", body).group(1))
+        messages = self._inbox[(page - 1) * count:page * count]
+        return RESPONSE % ("<Count>%d</Count>\n<Messages>\n%s</Messages>\n" % (
+            len(messages), "".join(
+                "<Message>\n%s</Message>\n" % _fields(
+                    (key, msg[key]) for key in
+                    ("Smstat", "Index", "Phone", "Content", "Date"))
+                for msg in messages)))
+
+    def _control(self, method, body):
+        if method == "POST" and "<Control>1</Control>" in (body or ""):
+            self._rebootUntil = time.time() + self.hang
+            self._sessions.clear()
+        return RESPONSE % "OK"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        # headers and body are written separately, don't let Nagle delay them
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self._answer("GET", None)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._answer("POST", self.rfile.read(length).decode("utf-8"))
+
+    def _answer(self, method, body):
+        delay, response = self.server.modem.respond(method, self.path,
+                                                    self.headers, body)
+        if delay:
+            time.sleep(delay)
+        if response is None:
+            self.close_connection = True
+            return
+
+        data = response.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeModemServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    # simulated fleets open many connections at once
+    request_queue_size = 1024
+
+    def __init__(self, address, modem):
+        HTTPServer.__init__(self, address, _Handler)
+        self.modem = modem
+
+    @property
+    def ip(self):
+        """Address to pass to ModemClient"""
+        return "%s:%d" % self.server_address[:2]
+
+
+def start(modem=None, address=("127.0.0.1", 0)):
+    """Serve modem in a background thread, returns server"""
+    server = FakeModemServer(address, modem or FakeModem())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-code", default=NO_SUCH_API)
+    parser.add_argument("--messages", type=int, default=0)
+    parser.add_argument("--legacy", action="store_true",
+                        help="old firmware without device/signal")
+    args = parser.parse_args()
+
+    modem = FakeModem(args.latency, args.jitter, args.timeout_rate,
+                      args.error_rate, args.error_code,
+                      messages=args.messages, legacy=args.legacy)
+    server = FakeModemServer((args.host, args.port), modem)
+    print("fake modem at %s" % server.ip)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -3,28 +3,57 @@
 # Copyright: 2016, Wasylews
 # Author: Wasylews
 # License: MIT
+import time
+startTime = time.time()
+
 import sys
 import signal
 import argparse
-from PySide import QtGui
-from hilink.tray import Tray
 
 
-# load resources based on interpreter version
-if sys.hexversion >= 0x3000000:
-    import hilink.res3_rc
-else:
-    import hilink.res_rc
+class StartupProfile(object):
+    """Time of startup phases up to the first shown icon"""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self._marks = [("interpreter", startTime)]
+
+    def mark(self, phase):
+        if self.enabled:
+            self._marks.append((phase, time.time()))
 
+    def report(self):
+        if not self.enabled:
+            return
+        self.mark("first icon")
+        last = self._marks[0][1]
+        for phase, when in self._marks[1:]:
+            sys.stderr.write("%-16s %8.1f ms\n" % (phase, (when - last) * 1000))
+            last = when
+        sys.stderr.write("%-16s %8.1f ms\n" % (
+            "time to icon", (last - startTime) * 1000))
+
+
+def main(ip, timeout, fleet, profileStartup=False, record=None, replay=None,
+         speed=1.0):
+    profile = StartupProfile(profileStartup)
+    from PySide import QtCore, QtGui
+    profile.mark("import PySide")
+    from hilink.tray import Tray
+    profile.mark("import hilink")
 
-def main(ip, timeout):
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     app = QtGui.QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    profile.mark("QApplication")
 
-    tray = Tray(ip, timeout)
+    tray = Tray(ip, timeout, fleet, record, replay, speed)
+    profile.mark("Tray")
     tray.show()
+    profile.mark("show")
 
+    # icon is on screen once event loop handled the first events
+    QtCore.QTimer.singleShot(0, profile.report)
     return app.exec_()
 
 
@@ -44,6 +73,98 @@ def parseArgs():
         help="modem's ip address",
         nargs="?")
 
+    parser.add_argument(
+        "-f", "--fleet",
+        help="monitor many modems, ip addresses or subnets like 10.0.0.0/24",
+        nargs="+")
+
+    parser.add_argument(
+        "--headless",
+        help="poll modem without GUI and serve metrics over HTTP",
+        action="store_true")
+
+    parser.add_argument(
+        "--listen",
+        help="[HOST:]PORT of headless metrics endpoint (default: %(default)s)",
+        default="127.0.0.1:9700")
+
+    parser.add_argument(
+        "--export",
+        help="with --headless, append polled snapshots to a columnar file")
+
+    parser.add_argument(
+        "--csv",
+        help="print a file written by --export as CSV")
+
+    parser.add_argument(
+        "--since",
+        help="first time printed by --csv, YYYY-MM-DD[ HH:MM[:SS]]")
+
+    parser.add_argument(
+        "--until",
+        help="last time printed by --csv, YYYY-MM-DD[ HH:MM[:SS]]")
+
+    parser.add_argument(
+        "--watch",
+        help="print snapshots published by a running hilink-tray",
+        action="store_true")
+
+    parser.add_argument(
+        "--json",
+        help="print --watch snapshots as JSON",
+        action="store_true")
+
+    parser.add_argument(
+        "--socket",
+        help="local socket of --watch (default: per user socket)")
+
+    parser.add_argument(
+        "--bulk",
+        help="run command on every modem of --targets and --fleet, then exit",
+        choices=("connect", "disconnect", "reboot"))
+
+    parser.add_argument(
+        "--targets",
+        help="file with ip addresses or subnets of --bulk, one per line")
+
+    parser.add_argument(
+        "--concurrency",
+        help="modems of --bulk commanded at once (default: %(default)s)",
+        type=int,
+        default=16)
+
+    parser.add_argument(
+        "--stagger",
+        help="seconds between starts of --bulk commands (default: %(default)s)",
+        type=float,
+        default=0.0)
+
+    parser.add_argument(
+        "--timeout",
+        help="seconds a modem of --bulk may take in total "
+             "(default: %(default)s)",
+        type=float,
+        default=5.0)
+
+    parser.add_argument(
+        "--record",
+        help="append raw modem responses to a log file")
+
+    parser.add_argument(
+        "--replay",
+        help="answer requests from a --record log instead of the modem")
+
+    parser.add_argument(
+        "--speed",
+        help="replay speed, 100 replays 100 seconds a second (default: %(default)s)",
+        type=float,
+        default=1.0)
+
+    parser.add_argument(
+        "--profile-startup",
+        help="print time of startup phases to stderr",
+        action="store_true")
+
     parser.add_argument(
         "-v", "--version",
         action="version", version="%(prog)s 4.1.1")
@@ -53,4 +174,23 @@ def parseArgs():
 
 if __name__ == '__main__':
     args = parseArgs()
-    sys.exit(main(args.ip, args.interval))
+    if args.csv:
+        from hilink import export
+        sys.exit(export.main(args.csv, args.since, args.until))
+    if args.watch:
+        from hilink import broadcast
+        sys.exit(broadcast.watch(args.socket, args.json))
+    if args.bulk:
+        from hilink import bulk
+        from hilink.targets import expandTargets, readTargets
+        targets = expandTargets(args.fleet or ([args.ip] if args.ip else []))
+        if args.targets:
+            targets += readTargets(args.targets)
+        sys.exit(bulk.main(args.bulk, targets, args.concurrency,
+                           args.timeout, args.stagger))
+    if args.headless:
+        from hilink import daemon
+        sys.exit(daemon.main(args.ip or "192.168.8.1", args.interval,
+                             args.listen, args.export))
+    sys.exit(main(args.ip, args.interval, args.fleet, args.profile_startup,
+                  args.record, args.replay, args.speed))
@@ -0,0 +1,60 @@
+import time
+
+
+class CircuitBreaker(object):
+    """CircuitBreaker - stops polling a modem that doesn't answer
+
+    After `threshold` failed polls in a row the breaker opens: instead of
+    full polls, which wait for a timeout on every endpoint, the modem is
+    probed with a TCP connect. The delay between probes starts at `delay`
+    and doubles after each failed probe up to `maxDelay`. A successful probe
+    lets one poll through; if that fails too (the web server of a booting
+    modem accepts connections long before it answers) the breaker opens
+    again with a doubled delay.
+    """
+
+    def __init__(self, threshold=3, delay=1.0, maxDelay=60.0):
+        self.threshold = threshold
+        self.delay = delay
+        self.maxDelay = maxDelay
+        self.failures = 0
+        self.nextProbe = 0
+        self._open = False
+        self._halfOpen = False
+        self._delay = delay
+
+    @property
+    def isOpen(self):
+        return self._open
+
+    def probeDue(self, now=None):
+        now = time.time() if now is None else now
+        return self._open and self.nextProbe <= now
+
+    def succeeded(self):
+        """Record answered poll"""
+        self.failures = 0
+        self._open = self._halfOpen = False
+        self._delay = self.delay
+
+    def failed(self, now=None):
+        """Record failed poll, True if the breaker has just opened"""
+        self.failures += 1
+        if self._open or self.failures < self.threshold:
+            return False
+        if self._halfOpen:
+            self._delay = min(self._delay * 2, self.maxDelay)
+        self._open = True
+        self._halfOpen = False
+        self.nextProbe = (time.time() if now is None else now) + self._delay
+        return True
+
+    def probeSucceeded(self):
+        """Let the next poll through, its failure opens the breaker again"""
+        self._open = False
+        self._halfOpen = True
+        self.failures = self.threshold - 1
+
+    def probeFailed(self, now=None):
+        self._delay = min(self._delay * 2, self.maxDelay)
+        self.nextProbe = (time.time() if now is None else now) + self._delay
@@ -0,0 +1,182 @@
+"""Local broadcast of modem snapshots over a Unix domain socket
+
+A consumer connects and sends a single line: "subscribe" streams the latest
+snapshot and then every following one, "get" returns the latest snapshot and
+closes the connection. Snapshots are JSON objects, one per line. Imports
+nothing heavy, so `hilink-tray --watch` starts at once.
+"""
+from __future__ import print_function
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+
+def defaultPath():
+    """Socket of the current user"""
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if directory:
+        return os.path.join(directory, "hilink-tray.sock")
+    return "/tmp/hilink-tray-%d.sock" % os.getuid()
+
+
+def supported():
+    return hasattr(socket, "AF_UNIX")
+
+
+class SnapshotBroadcaster(object):
+    """SnapshotBroadcaster - streams published snapshots to local consumers
+
+    Each snapshot is encoded once and written to every subscriber without
+    blocking, so consumers add no modem requests and a stuck consumer can't
+    stall the monitor thread: it is disconnected once its socket buffer is
+    full.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or defaultPath()
+        self._latest = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._server = self._listen()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _listen(self):
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except socket.error:
+                # left by a crashed process
+                os.unlink(self.path)
+            else:
+                raise socket.error("%s is used by another process" % self.path)
+            finally:
+                probe.close()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.path)
+        os.chmod(self.path, 0o600)
+        server.listen(16)
+        # lets _serve notice close()
+        server.settimeout(0.5)
+        return server
+
+    @property
+    def subscribers(self):
+        return len(self._subscribers)
+
+    def publish(self, snapshot):
+        line = (json.dumps(snapshot, separators=(",", ":")) + "\n").encode()
+        with self._lock:
+            self._latest = line
+            self._subscribers = [conn for conn in self._subscribers
+                                 if self._send(conn, line)]
+
+    def close(self):
+        self._closed = True
+        self._thread.join()
+        self._server.close()
+        with self._lock:
+            for conn in self._subscribers:
+                conn.close()
+            self._subscribers = []
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _send(self, conn, line):
+        """Write line without blocking, False if conn was closed"""
+        try:
+            if conn.send(line) == len(line):
+                return True
+        except socket.error:
+            pass
+        # a partly written line can't be completed later
+        conn.close()
+        return False
+
+    def _serve(self):
+        while not self._closed:
+            try:
+                conn = self._server.accept()[0]
+            except socket.timeout:
+                continue
+            except socket.error:
+                return
+            self._answer(conn)
+
+    def _answer(self, conn):
+        conn.settimeout(1)
+        try:
+            request = conn.recv(64).strip()
+        except socket.error:
+            conn.close()
+            return
+
+        with self._lock:
+            conn.setblocking(False)
+            if request == b"subscribe":
+                if self._latest is None or self._send(conn, self._latest):
+                    self._subscribers.append(conn)
+                return
+            if request == b"get" and self._latest is not None:
+                self._send(conn, self._latest)
+        conn.close()
+
+
+def subscribe(path=None):
+    """Iterate over published snapshots, the latest one first"""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path or defaultPath())
+    try:
+        conn.sendall(b"subscribe\n")
+        stream = conn.makefile("rb")
+        for line in iter(stream.readline, b""):
+            yield json.loads(line.decode("utf-8"))
+    finally:
+        conn.close()
+
+
+def latest(path=None):
+    """The latest published snapshot, None if there is none yet"""
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path or defaultPath())
+    try:
+        conn.sendall(b"get\n")
+        line = conn.makefile("rb").readline()
+    finally:
+        conn.close()
+    return json.loads(line.decode("utf-8")) if line else None
+
+
+def formatSnapshot(snapshot):
+    """Single line summary of a published snapshot"""
+    values = snapshot.get("values") or {}
+    fields = [time.strftime("%H:%M:%S", time.localtime(snapshot["time"])),
+              snapshot["status"], snapshot["operator"],
+              "%d/5" % snapshot["level"]]
+    fields.extend("%s %g" % (key.upper(), values[key])
+                  for key in ("rssi", "rsrp", "sinr") if key in values)
+    if snapshot.get("unread"):
+        fields.append("%d unread" % snapshot["unread"])
+    return "  ".join(field for field in fields if field)
+
+
+def watch(path=None, raw=False):
+    """Print published snapshots until interrupted"""
+    try:
+        for snapshot in subscribe(path):
+            print(json.dumps(snapshot) if raw else formatSnapshot(snapshot))
+            # consumers often read through a pipe
+            sys.stdout.flush()
+    except socket.error as e:
+        print("hilink-tray: no monitor at %s: %s" % (path or defaultPath(), e))
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,119 @@
+"""Run a command on many modems at once, doesn't import Qt"""
+from __future__ import print_function
+from multiprocessing.pool import ThreadPool
+from hilink.client import ModemClient
+from hilink.transport import ConnectionPool, TransportError, \
+    TransportTimeout
+import time
+
+
+class BulkResult(object):
+    """Outcome of a command on a single modem"""
+    __slots__ = ("ip", "error", "duration")
+
+    def __init__(self, ip, error, duration):
+        self.ip = ip
+        self.error = error
+        self.duration = duration
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+class DeadlineTransport(object):
+    """DeadlineTransport - ConnectionPool whose requests share a deadline
+
+    Every request waits at most until `deadline`, so token fetches, token
+    refreshes and the command itself can't add up to more than that.
+    """
+
+    def __init__(self, transport, deadline):
+        self._transport = transport
+        self.deadline = deadline
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        remaining = self.deadline - time.time()
+        if remaining <= 0:
+            raise TransportTimeout("%s %s timed out" % (method, path))
+        timeout = min(timeout or self._transport.timeout, remaining)
+        return self._transport.request(method, path, body, headers, timeout)
+
+    def reachable(self, timeout=None):
+        return self._transport.reachable(timeout)
+
+    def stats(self):
+        return self._transport.stats()
+
+    def close(self):
+        self._transport.close()
+
+
+def runCommand(ip, command, timeout=5):
+    """Run command on modem ip, giving up after timeout seconds"""
+    started = time.time()
+    client = ModemClient(ip, 1, timeout)
+    client.commandTimeout = timeout
+    client.setTransport(DeadlineTransport(ConnectionPool(ip, 1, timeout),
+                                          started + timeout))
+    try:
+        client.command(command)
+        error = None
+    except TransportError as e:
+        error = str(e)
+    finally:
+        client.close()
+    return BulkResult(ip, error, time.time() - started)
+
+
+def runBulk(targets, command, concurrency=16, timeout=5, stagger=0.0,
+            callback=None):
+    """Run command on every target, at most `concurrency` at once
+
+    Starts are spread `stagger` seconds apart, so a rack of modems doesn't
+    go down and register in the network all at the same moment. callback
+    is called with every BulkResult as soon as it is known. Returns results
+    in order of targets.
+    """
+    pool = ThreadPool(max(1, min(concurrency, len(targets))))
+    try:
+        started = time.time()
+        pending = []
+        for index, ip in enumerate(targets):
+            delay = started + index * stagger - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            pending.append(pool.apply_async(runCommand,
+                                            (ip, command, timeout),
+                                            callback=callback))
+        return [result.get() for result in pending]
+    finally:
+        pool.close()
+
+
+def formatResult(result):
+    if result.succeeded:
+        return "%-21s ok     %6.2f s" % (result.ip, result.duration)
+    return "%-21s FAILED %6.2f s  %s" % (result.ip, result.duration,
+                                        result.error)
+
+
+def formatSummary(command, results, elapsed):
+    failed = [result for result in results if not result.succeeded]
+    lines = ["%s: %d succeeded, %d failed in %.1f s" % (
+        command, len(results) - len(failed), len(failed), elapsed)]
+    if failed:
+        lines.append("failed: " + " ".join(result.ip for result in failed))
+    return "\n".join(lines)
+
+
+def main(command, targets, concurrency=16, timeout=5, stagger=0.0):
+    if not targets:
+        print("hilink-tray: no targets")
+        return 2
+
+    started = time.time()
+    results = runBulk(targets, command, concurrency, timeout, stagger,
+                      lambda result: print(formatResult(result)))
+    print(formatSummary(command, results, time.time() - started))
+    return 0 if all(result.succeeded for result in results) else 1
@@ -0,0 +1,87 @@
+import re
+from hilink.client import ModemClient, STATUS
+
+
+# status fields missing in older firmwares
+OPTIONAL_FIELDS = ("CurrentNetworkTypeEx",)
+
+
+class Capabilities(object):
+    """Capabilities - endpoints and fields a modem firmware lacks
+
+    `key` identifies the firmware of a device (serial number and software
+    version), it is None when the modem didn't tell them.
+    """
+
+    def __init__(self, key, unsupported=(), missingFields=()):
+        self.key = key
+        self.unsupported = frozenset(unsupported)
+        self.missingFields = frozenset(missingFields)
+
+    def supports(self, section):
+        return section not in self.unsupported
+
+    def __repr__(self):
+        return "Capabilities(%r, unsupported=%s, missingFields=%s)" % (
+            self.key, sorted(self.unsupported), sorted(self.missingFields))
+
+
+def firmwareKey(info):
+    """Key of device information, None if modem didn't answer"""
+    serial = info.findtext("SerialNumber", "")
+    software = info.findtext("SoftwareVersion", "")
+    if not serial and not software:
+        return None
+    return re.sub(r"\W", "_", "%s_%s" % (serial, software))
+
+
+def discover(client, key, sections=ModemClient.sections):
+    """Probe every section of client once
+
+    Status is never probed, it is the endpoint every firmware has. Sections
+    that didn't answer at all (timeout, modem busy) are not marked as
+    unsupported.
+    """
+    unsupported = [section for section in sections
+                   if section != STATUS and client.probe(section) is False]
+    status = client.fetch(STATUS)
+    missingFields = [field for field in OPTIONAL_FIELDS
+                     if len(status) and field not in status]
+    return Capabilities(key, unsupported, missingFields)
+
+
+class CapabilityCache(object):
+    """CapabilityCache - capabilities of known firmwares kept in QSettings
+
+    createSettings returns a QSettings, a new one is used by every call so
+    the cache may be used from the monitor thread.
+    """
+
+    def __init__(self, createSettings):
+        self._createSettings = createSettings
+
+    def load(self, key):
+        """Saved capabilities of firmware, None if it wasn't probed yet"""
+        settings = self._createSettings()
+        group = "capabilities/%s/" % key
+        if not settings.contains(group + "unsupported"):
+            return None
+        return Capabilities(key,
+                            _split(settings.value(group + "unsupported")),
+                            _split(settings.value(group + "missingFields")))
+
+    def save(self, capabilities):
+        if capabilities.key is None:
+            return
+        settings = self._createSettings()
+        group = "capabilities/%s/" % capabilities.key
+        settings.setValue(group + "unsupported",
+                          ",".join(sorted(capabilities.unsupported)))
+        settings.setValue(group + "missingFields",
+                          ",".join(sorted(capabilities.missingFields)))
+
+
+def _split(value):
+    if isinstance(value, list):
+        return value
+    return [item for item in (value or "").split(",") if item]
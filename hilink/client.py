@@ -0,0 +1,371 @@
+from collections import OrderedDict
+import re
+from hilink.parser import FlatResponse, parseFlat, parseRecords
+from hilink.transport import ConnectionPool, TransportError, \
+    TransportTimeout
+from hilink.tokens import TokenCache, isTokenError
+from hilink.stats import Instrumentation, OK, TIMEOUT, ERROR, API_ERROR, \
+    PARSE_FAILURE
+from hilink.commands import CONNECT, DISCONNECT, REBOOT
+from hilink.recording import FAILED, TIMED_OUT
+import time
+
+
+TOKENS = "/api/webserver/SesTokInfo"
+NOTIFICATIONS = "/api/monitoring/check-notifications"
+STATUS = "/api/monitoring/status"
+PLMN = "/api/net/current-plmn"
+SIGNAL = "/api/device/signal"
+TRAFFIC = "/api/monitoring/traffic-statistics"
+SMS_LIST = "/api/sms/sms-list"
+DEVICE_INFO = "/api/device/information"
+
+OFFLINE = "Modem offline"
+
+# api error of endpoints missing in firmware
+NO_SUCH_API = "100002"
+
+NETWORK_TYPES_EX = {
+    "0": "No service", "1": "GSM", "2": "GPRS", "3": "EDGE",
+    "21": "IS-95A", "22": "IS-95B", "23": "CDMA 1X",
+    "24": "EVDO Rev.0", "25": "EVDO Rev.A",
+    "26": "EVDO Rev.B", "27": "Hybrid CDMA 1X",
+    "28": "Hybrid EVDO Rev.0", "29": "Hybrid EVDO Rev.A",
+    "30": "Hybrid EVDO Rev.B", "31": "eHPRD Rel.0",
+    "32": "eHPRD Rel.A", "33": "eHPRD Rel.B",
+    "34": "Hybrid eHPRD Rel.0", "35": "Hybrid eHPRD Rel.A",
+    "36": "Hybrid eHPRD Rel.B", "41": "WCDMA", "42": "HSDPA",
+    "43": "HSUPA", "44": "HSPA", "45": "HSPA+", "46": "DC-HSPA+",
+    "61": "TD-SCDMA", "62": "TD-HSDPA", "63": "TD-HSUPA",
+    "64": "TD-HSPA", "65": "TD-HSPA+", "81": "802.16e",
+    "101": "LTE"}
+
+NETWORK_TYPES = {
+    "0": "No service", "1": "GSM", "2": "GPRS", "3": "EDGE",
+    "4": "WCDMA", "5": "HSDPA", "6": "HSUPA", "7": "HSPA",
+    "8": "TD-SCDMA", "9": "HSPA+", "10": "EVDO Rev.0",
+    "11": "EVDO Rev.A", "12": "EVDO Rev.B",
+    "13": "1XRTT", "14": "UMB", "15": "1XEVDV",
+    "16": "3XRTT", "17": "HSPA+ 64QAM", "18": "HSPA+ MIMO"}
+
+CONNECTION_STATES = {"900": "Connecting...", "901": "Connected",
+                     "902": "Disconnected", "903": "Disconnecting...",
+                     "904": "Connection failed", "905": "No signal",
+                     "112": "No autoconnect", "113": "No autoconnect",
+                     "114": "No reconnect", "115": "No reconnect",
+                     "201": "Data limit reached"}
+
+SIGNAL_PARAMS = ("rssi", "rsrp", "rsrq", "rscp", "ecio", "sinr",
+                 "cell_id", "pci")
+# display names of signal parameters
+SIGNAL_LABELS = dict((key, key.upper() + ": ") for key in SIGNAL_PARAMS)
+# signal parameters with a measured value
+SIGNAL_METRICS = ("rssi", "rsrp", "rsrq", "rscp", "ecio", "sinr")
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+# snapshot fields filled from every section
+SECTION_FIELDS = {STATUS: ("level", "status", "network"),
+                  PLMN: ("plmn",),
+                  SIGNAL: ("params",),
+                  TRAFFIC: ("traffic",),
+                  NOTIFICATIONS: ("unread",)}
+
+
+def emptySnapshot():
+    return {"level": 0, "status": OFFLINE, "network": "", "plmn": "",
+            "operator": "", "params": OrderedDict(), "values": {},
+            "traffic": None, "unread": 0}
+
+
+def changedFields(previous, snapshot):
+    """Names of snapshot fields that differ from previous snapshot"""
+    if previous is None:
+        return set(snapshot)
+    return set(key for key, value in snapshot.items()
+               if previous.get(key) != value)
+
+
+class ModemClient(object):
+    """ModemClient - HiLink web API of a single modem, without Qt"""
+    # endpoints polled for a snapshot
+    sections = (NOTIFICATIONS, STATUS, PLMN, SIGNAL, TRAFFIC)
+    # seconds to wait for an answer to connect, disconnect and reboot
+    commandTimeout = 5
+    # hilink.recording.Recorder of raw responses
+    recorder = None
+
+    def __init__(self, ip, poolSize=len(sections), timeout=1):
+        self._transport = None
+        self._poolSize = poolSize
+        self._timeout = timeout
+        self._tokens = TokenCache(self._getTokens)
+        self.stats = Instrumentation()
+        self.ip = ip
+
+    @property
+    def ip(self):
+        return self._ip
+
+    @ip.setter
+    def ip(self, value):
+        self._ip = value
+        if self._transport is not None:
+            self._transport.close()
+        self._transport = ConnectionPool(value, self._poolSize,
+                                         self._timeout)
+        self._tokens.invalidate()
+
+    @property
+    def poolSize(self):
+        return self._poolSize
+
+    def setTransport(self, transport):
+        """Send requests through transport, e.g. a ReplayTransport"""
+        self._transport.close()
+        self._transport = transport
+        self._tokens.invalidate()
+
+    def reachable(self):
+        """Whether modem accepts connections, cheaper than any request"""
+        return self._transport.reachable()
+
+    def connectionStats(self):
+        """Number of new and reused keep-alive connections"""
+        return self._transport.stats()
+
+    def tokenStats(self):
+        """Number of token cache hits and refreshes"""
+        return self._tokens.stats()
+
+    def close(self):
+        self._transport.close()
+
+    def connect_(self):
+        msg = """<?xml version="1.0" encoding="UTF-8"?><request><dataswitch>1</dataswitch></request>"""
+
+        return self._post("/api/dialup/mobile-dataswitch", msg,
+                          timeout=self.commandTimeout)
+
+    def disconnect(self):
+        msg = """<?xml version="1.0" encoding="UTF-8"?><request><dataswitch>0</dataswitch></request>"""
+
+        return self._post("/api/dialup/mobile-dataswitch", msg,
+                          timeout=self.commandTimeout)
+
+    def reboot(self):
+        msg = """<?xml version="1.0" encoding="UTF-8"?><request><Control>1</Control></request>"""
+        return self._post("/api/device/control", msg,
+                          timeout=self.commandTimeout)
+
+    def command(self, name):
+        """Run connect, disconnect or reboot, raises TransportError if failed"""
+        methods = {CONNECT: self.connect_, DISCONNECT: self.disconnect,
+                   REBOOT: self.reboot}
+        xml = methods[name]()
+        if xml.tag != "response":
+            raise TransportError("%s: %s" % (
+                name, xml.findtext("code") or "invalid answer"))
+
+    def getSmsPage(self, page, count, box=1):
+        """Messages of a page of sms box (1 - inbox), newest first"""
+        msg = ("""<?xml version="1.0" encoding="UTF-8"?><request>"""
+               """<PageIndex>{}</PageIndex><ReadCount>{}</ReadCount>"""
+               """<BoxType>{}</BoxType><SortType>0</SortType>"""
+               """<Ascending>0</Ascending><UnreadPreferred>0</UnreadPreferred>"""
+               """</request>""").format(page, count, box)
+        xml = self._post(SMS_LIST, msg,
+                         lambda data: parseRecords(data, "Message"))
+        if xml.tag != "response":
+            raise TransportError("%s: %s" % (SMS_LIST, xml.findtext("code")))
+        return xml.records
+
+    def _post(self, section, msg, parse=parseFlat, timeout=None):
+        # verification token is single use on some firmwares
+        self._tokens.refresh()
+        return self._request("POST", section, msg.encode(), parse, timeout)
+
+    def _getXml(self, section):
+        try:
+            return self._request("GET", section)
+        except TransportError:
+            return FlatResponse()
+
+    def _request(self, method, section, body=None, parse=parseFlat,
+                 timeout=None):
+        """Send request, retry once if tokens are stale"""
+        headers = self._tokens.headers()
+        xml = self._send(method, section, body, headers, parse, timeout)
+        if isTokenError(xml):
+            headers = self._tokens.refresh(stale=headers)
+            xml = self._send(method, section, body, headers, parse, timeout)
+        return xml
+
+    def _send(self, method, section, body, headers, parse, timeout=None):
+        if body is not None:
+            headers = dict(headers)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        return self._exchange(method, section, body, headers, parse, timeout)
+
+    def _exchange(self, method, section, body=None, headers=None,
+                  parse=parseFlat, timeout=None):
+        """Send request and parse response, recording its statistics"""
+        sent = len(body) if body else 0
+        started = time.time()
+        try:
+            response = self._transport.request(method, section, body, headers,
+                                               timeout)
+        except TransportTimeout as e:
+            self.stats.record(section, time.time() - started, sent, 0, TIMEOUT)
+            self._record(method, section, started, str(e).encode(), TIMED_OUT)
+            raise
+        except TransportError as e:
+            self.stats.record(section, time.time() - started, sent, 0, ERROR)
+            self._record(method, section, started, str(e).encode(), FAILED)
+            raise
+        self._record(method, section, started, response)
+
+        xml = parse(response)
+        outcome = OK
+        if xml.tag == "error":
+            outcome = API_ERROR
+        elif not xml.tag:
+            outcome = PARSE_FAILURE
+        self.stats.record(section, time.time() - started, sent,
+                          len(response), outcome)
+        return xml
+
+    def _record(self, method, section, started, data, flags=0):
+        if self.recorder is not None:
+            self.recorder.write(started, time.time() - started, method,
+                                section, data, flags)
+
+    def fetch(self, section):
+        """Request single section, empty element if modem didn't answer"""
+        return self._getXml(section)
+
+    def fetchAll(self, pool, sections=None):
+        """Request all sections at once using pool, returns {section: xml}"""
+        if sections is None:
+            sections = self.sections
+        return dict(zip(sections, pool.map(self._getXml, sections)))
+
+    def _getTokens(self):
+        """Get access tokens"""
+        xml = self._exchange("GET", TOKENS)
+        return (xml.findtext("SesInfo", ""), xml.findtext("TokInfo", ""))
+
+    def getDeviceInformation(self):
+        """Device information, empty if modem didn't answer"""
+        return self._getXml(DEVICE_INFO)
+
+    def probe(self, section):
+        """Whether firmware has section, None if modem didn't tell"""
+        try:
+            xml = self._request("GET", section)
+        except TransportError as e:
+            return False if e.status == 404 else None
+        if xml.tag == "response":
+            return True
+        if xml.tag == "error" and xml.findtext("code") == NO_SUCH_API:
+            return False
+        return None
+
+    def getSignalLevel(self, xml):
+        return int(xml.findtext("SignalIcon") or "0")
+
+    def getNetworkTypeEx(self, xml):
+        """None if firmware doesn't report it or the code is unknown"""
+        return NETWORK_TYPES_EX.get(xml.findtext("CurrentNetworkTypeEx", ""))
+
+    def getNetworkTypeCur(self, xml):
+        return NETWORK_TYPES.get(xml.findtext("CurrentNetworkType", ""), "")
+
+    def getNetworkType(self, xml):
+        return self.getNetworkTypeEx(xml) or self.getNetworkTypeCur(xml)
+
+    def getStatus(self, xml):
+        code = xml.findtext("ConnectionStatus", "902")
+        # firmwares have more codes than the ones known here
+        return CONNECTION_STATES.get(code, "Unknown (%s)" % code)
+
+    def getOperator(self, xml):
+        return xml.findtext("ShortName") or xml.findtext("FullName") or ""
+
+    def getSignalParams(self, xml):
+        values = OrderedDict()
+
+        for key in SIGNAL_PARAMS:
+            value = xml.findtext(key, "")
+            if value:
+                values[key] = SIGNAL_LABELS[key] + value
+        return values
+
+    def getSignalValues(self, xml):
+        """Numbers of signal parameters, units like dBm are stripped"""
+        values = {}
+        for key in SIGNAL_METRICS:
+            match = _NUMBER.search(xml.findtext(key, ""))
+            if match is not None:
+                values[key] = float(match.group())
+        return values
+
+    def getTraffic(self, xml):
+        """Bytes (uploaded, downloaded) during current connection"""
+        upload = xml.findtext("CurrentUpload")
+        download = xml.findtext("CurrentDownload")
+        if not upload or not download:
+            return None
+        return (int(upload), int(download))
+
+    def getUnreadMessageCount(self, xml):
+        """Get number of unreaded messages"""
+        return int(xml.findtext("UnreadMessage") or "0")
+
+    def getSnapshot(self, responses, previous=None):
+        """Build modem state from responses
+
+        Sections missing in responses keep their values from previous
+        snapshot.
+        """
+        snapshot = dict(previous or emptySnapshot())
+        if STATUS in responses:
+            statusXml = responses[STATUS]
+            if not len(statusXml):
+                # status is the only endpoint every firmware answers
+                return emptySnapshot()
+            snapshot["level"] = self.getSignalLevel(statusXml)
+            snapshot["status"] = self.getStatus(statusXml)
+            snapshot["network"] = self.getNetworkType(statusXml)
+        if PLMN in responses:
+            snapshot["plmn"] = self.getOperator(responses[PLMN])
+        if SIGNAL in responses:
+            snapshot["params"] = self.getSignalParams(responses[SIGNAL])
+            snapshot["values"] = self.getSignalValues(responses[SIGNAL])
+        if TRAFFIC in responses:
+            snapshot["traffic"] = self.getTraffic(responses[TRAFFIC])
+        if NOTIFICATIONS in responses:
+            snapshot["unread"] = self.getUnreadMessageCount(
+                responses[NOTIFICATIONS])
+
+        # fix space if we don't have op name
+        snapshot["operator"] = snapshot["network"]
+        if snapshot["plmn"]:
+            snapshot["operator"] = "%s %s" % (snapshot["plmn"],
+                                              snapshot["network"])
+        return snapshot
+
+
+def pollMany(clients, pool, sections=ModemClient.sections):
+    """Poll many modems at once, returns their snapshots
+
+    Requests of all modems go through a single pool, so its size bounds
+    the number of requests in flight.
+    """
+    tasks = [(client, section) for client in clients for section in sections]
+    responses = pool.map(lambda task: task[0].fetch(task[1]), tasks)
+
+    step = len(sections)
+    return [client.getSnapshot(
+                dict(zip(sections, responses[i * step:(i + 1) * step])))
+            for i, client in enumerate(clients)]
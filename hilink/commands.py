@@ -0,0 +1,54 @@
+import threading
+
+
+# commands accepted by ModemClient.command
+CONNECT = "connect"
+DISCONNECT = "disconnect"
+REBOOT = "reboot"
+COMMANDS = (CONNECT, DISCONNECT, REBOOT)
+
+# a queued command is cancelled by a later opposite one
+_OPPOSITE = {CONNECT: DISCONNECT, DISCONNECT: CONNECT}
+
+
+class CommandQueue(object):
+    """CommandQueue - commands waiting for or running on the monitor thread
+
+    Commands are keyed by (target, command). A command that is already
+    waiting or running is not queued again, so clicking Connect five times
+    sends a single request.
+    """
+
+    def __init__(self):
+        self._waiting = set()
+        self._running = set()
+        self._lock = threading.Lock()
+
+    def put(self, command, target=None):
+        """Add command, False if the same one is already queued"""
+        key = (target, command)
+        with self._lock:
+            if key in self._waiting or key in self._running:
+                return False
+            self._waiting.discard((target, _OPPOSITE.get(command)))
+            self._waiting.add(key)
+            return True
+
+    def take(self, command, target=None):
+        """Mark command running, False if it was cancelled meanwhile"""
+        key = (target, command)
+        with self._lock:
+            if key not in self._waiting:
+                return False
+            self._waiting.remove(key)
+            self._running.add(key)
+            return True
+
+    def done(self, command, target=None):
+        with self._lock:
+            self._running.discard((target, command))
+
+    def pending(self):
+        """Number of waiting and running commands"""
+        with self._lock:
+            return len(self._waiting) + len(self._running)
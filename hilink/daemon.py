@@ -0,0 +1,225 @@
+"""Headless modem monitor, doesn't import Qt"""
+from __future__ import print_function
+from hilink.client import ModemClient, OFFLINE, SIGNAL, STATUS
+from hilink.poller import ModemPoller
+from hilink import broadcast
+from hilink.export import ColumnarWriter
+import json
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+except ImportError:  # >= 3.x
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+
+
+class Daemon(object):
+    """Daemon - polls modem without GUI and keeps the latest snapshot"""
+
+    def __init__(self, ip, intervals=None, adaptive=True):
+        self.client = ModemClient(ip)
+        # broadcaster and exporter are set on it
+        self.poller = ModemPoller(self.client, intervals, adaptive)
+        self.started = time.time()
+        self._stop = threading.Event()
+
+    @property
+    def snapshot(self):
+        return self.poller.snapshot
+
+    @property
+    def throughput(self):
+        return self.poller.throughput
+
+    def tick(self):
+        self.poller.tick()
+
+    def run(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.tick()
+                except Exception:
+                    # keep monitoring and serving metrics
+                    sys.stderr.write("hilink-tray: tick failed\n" +
+                                     traceback.format_exc())
+                self._stop.wait(max(0, self.poller.nextTick() - time.time()))
+        finally:
+            self.poller.close()
+
+    def stop(self):
+        """Make run return once the current tick is done"""
+        self._stop.set()
+
+    def counters(self):
+        counters = {"polls": self.poller.polls,
+                    "uptime": time.time() - self.started,
+                    "requests_per_minute":
+                        self.poller.scheduler.requestsPerMinute()}
+        for key, value in self.client.connectionStats().items():
+            counters["connections_" + key] = value
+        for key, value in self.client.tokenStats().items():
+            counters["tokens_" + key] = value
+        return counters
+
+    def toJson(self):
+        snapshot = dict(self.snapshot or {})
+        return json.dumps({"ip": self.client.ip,
+                           "snapshot": snapshot,
+                           "throughput": {"upload": self.throughput.upload,
+                                          "download": self.throughput.download},
+                           "counters": self.counters(),
+                           "diagnostics": self.client.stats.toDict()})
+
+    def toPrometheus(self):
+        """Latest snapshot and counters in Prometheus text format"""
+        label = '{modem="%s"}' % self.client.ip
+        lines = []
+
+        def add(name, kind, value, labels=label):
+            if kind is not None:
+                lines.append("# TYPE hilink_%s %s" % (name, kind))
+            lines.append("hilink_%s%s %s" % (name, labels, value))
+
+        snapshot = self.snapshot
+        if snapshot is not None:
+            add("online", "gauge", int(snapshot["status"] != OFFLINE))
+            add("connected", "gauge", int(snapshot["status"] == "Connected"))
+            add("signal_level", "gauge", snapshot["level"])
+            add("unread_messages", "gauge", snapshot["unread"])
+            add("upload_bytes_per_second", "gauge",
+                "%.0f" % self.throughput.upload)
+            add("download_bytes_per_second", "gauge",
+                "%.0f" % self.throughput.download)
+            if snapshot["values"]:
+                lines.append("# TYPE hilink_signal gauge")
+            for key, value in sorted(snapshot["values"].items()):
+                add("signal", None, value,
+                    '{modem="%s",param="%s"}' % (self.client.ip, key))
+
+        counters = self.counters()
+        add("polls_total", "counter", counters["polls"])
+        add("uptime_seconds", "gauge", "%.0f" % counters["uptime"])
+        add("requests_per_minute", "gauge",
+            "%.2f" % counters["requests_per_minute"])
+        add("connections_created_total", "counter",
+            counters["connections_created"])
+        add("connections_reused_total", "counter",
+            counters["connections_reused"])
+        add("token_cache_hits_total", "counter", counters["tokens_hits"])
+        add("token_refreshes_total", "counter", counters["tokens_refreshes"])
+        self._addDiagnostics(lines)
+        return "\n".join(lines) + "\n"
+
+    def _addDiagnostics(self, lines):
+        """Request latency histograms and outcome counters
+
+        Every metric family is a single block, as the text format requires.
+        """
+        endpoints = sorted(self.client.stats.toDict()["endpoints"].items())
+        if not endpoints:
+            return
+        labels = dict((section, 'modem="%s",endpoint="%s"' % (
+            self.client.ip, section)) for section, _ in endpoints)
+
+        lines.append("# TYPE hilink_request_duration_seconds histogram")
+        for section, stats in endpoints:
+            latency = stats["latency"]
+            seen = 0
+            bounds = [str(bound) for bound in latency["buckets"]] + ["+Inf"]
+            for bound, count in zip(bounds, latency["counts"]):
+                seen += count
+                lines.append('hilink_request_duration_seconds_bucket'
+                             '{%s,le="%s"} %d' % (labels[section], bound,
+                                                  seen))
+            lines.append("hilink_request_duration_seconds_sum{%s} %f" % (
+                labels[section], latency["sum"]))
+            lines.append("hilink_request_duration_seconds_count{%s} %d" % (
+                labels[section], latency["count"]))
+
+        lines.append("# TYPE hilink_requests_total counter")
+        for section, stats in endpoints:
+            for outcome, count in sorted(stats["outcomes"].items()):
+                lines.append('hilink_requests_total{%s,outcome="%s"} %d' % (
+                    labels[section], outcome, count))
+
+        lines.append("# TYPE hilink_received_bytes_total counter")
+        for section, stats in endpoints:
+            lines.append("hilink_received_bytes_total{%s} %d" % (
+                labels[section], stats["bytes_received"]))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        daemon = self.server.monitor
+        if self.path == "/metrics":
+            self._reply(daemon.toPrometheus(),
+                        "text/plain; version=0.0.4")
+        elif self.path in ("/", "/json"):
+            self._reply(daemon.toJson(), "application/json")
+        else:
+            self.send_error(404)
+
+    def _reply(self, body, contentType):
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer(ThreadingMixIn, HTTPServer):
+    """HTTP endpoint with /metrics (Prometheus) and /json"""
+    daemon_threads = True
+
+    def __init__(self, address, daemon):
+        HTTPServer.__init__(self, address, _MetricsHandler)
+        self.monitor = daemon
+
+
+def parseAddress(value):
+    """Split [host:]port into (host, port), host defaults to localhost"""
+    host, _, port = value.rpartition(":")
+    return (host or "127.0.0.1", int(port))
+
+
+def main(ip, interval, listen, export=None):
+    intervals = {}
+    if interval:
+        intervals[SIGNAL] = intervals[STATUS] = interval
+
+    daemon = Daemon(ip, intervals)
+    if export:
+        daemon.poller.exporter = ColumnarWriter(export, ip)
+    if broadcast.supported():
+        try:
+            daemon.poller.broadcaster = broadcast.SnapshotBroadcaster()
+        except (socket.error, OSError) as e:
+            print("hilink-tray: no local broadcast: %s" % e)
+    server = MetricsServer(parseAddress(listen), daemon)
+    serverThread = threading.Thread(target=server.serve_forever)
+    serverThread.daemon = True
+    serverThread.start()
+    print("hilink-tray: serving http://%s:%d/metrics" % server.server_address)
+
+    # systemctl stop and kill flush the export like Ctrl-C does
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+    return 0
@@ -0,0 +1,299 @@
+"""Streaming export of polled snapshots to a columnar file, doesn't import Qt
+
+The file is a header line, a JSON line describing the columns, then chunks.
+Every chunk starts with its row count, time range and the sizes of its
+column blocks, so a reader finds the chunks of a time range by reading
+their headers only, and reads only the columns it needs.
+"""
+from __future__ import print_function
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from hilink.client import NETWORK_TYPES, NETWORK_TYPES_EX, \
+    CONNECTION_STATES, OFFLINE, SIGNAL_LABELS
+import csv
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+
+
+NAN = float("nan")
+MAGIC = b"HLCX1\n"
+
+# name, array typecode, value of a missing sample
+COLUMNS = (
+    ("time", "d", NAN),
+    ("rssi", "f", NAN),
+    ("rsrp", "f", NAN),
+    ("rsrq", "f", NAN),
+    ("sinr", "f", NAN),
+    ("cell_id", "i", -1),
+    ("pci", "h", -1),
+    ("level", "b", -1),
+    ("network", "B", 255),
+    ("status", "B", 255))
+
+# labels of enumerated columns, every file keeps its own copy
+LABELS = {"network": sorted(set(NETWORK_TYPES_EX.values()) |
+                            set(NETWORK_TYPES.values())),
+          "status": sorted(set(CONNECTION_STATES.values())) + [OFFLINE]}
+
+# magic, rows, flags, first and last time
+_CHUNK = struct.Struct("<4sIBdd")
+_CHUNK_MAGIC = b"CHNK"
+COMPRESSED = 1
+
+
+def _frombytes(buf, data):
+    if hasattr(buf, "frombytes"):
+        buf.frombytes(data)
+    else:  # 2.x
+        buf.fromstring(data)
+
+
+def _tobytes(buf):
+    return buf.tobytes() if hasattr(buf, "tobytes") else buf.tostring()
+
+
+def _param(params, key):
+    """Integer signal parameter like cell_id, None if missing"""
+    value = params.get(key, "")[len(SIGNAL_LABELS[key]):]
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _readHeader(source):
+    if source.readline() != MAGIC:
+        raise ValueError("%s is not a hilink export" % source.name)
+    return json.loads(source.readline().decode("utf-8"))
+
+
+class ColumnarWriter(object):
+    """ColumnarWriter - appends snapshots to a columnar file
+
+    Rows are collected in typed arrays and written as a chunk once there
+    are `chunkRows` of them or the oldest is `maxAge` seconds old, so memory
+    use doesn't grow with the file and a crash loses at most `maxAge`
+    seconds. Column blocks are zlib compressed with `compress`. An existing
+    file is appended to.
+    """
+
+    def __init__(self, path, source="", chunkRows=4096, maxAge=60,
+                 compress=True):
+        self.path = path
+        self.chunkRows = chunkRows
+        self.maxAge = maxAge
+        self.compress = compress
+
+        if os.path.exists(path) and os.path.getsize(path):
+            existing = ColumnarReader(path)
+            existing.close()
+            if [name for name, _ in existing.columns] != \
+                    [column[0] for column in COLUMNS]:
+                raise ValueError("%s has other columns" % path)
+            self.labels = existing.labels
+            self._file = open(path, "r+b")
+            # drop a chunk cut short by a crash
+            self._file.truncate(existing.end)
+            self._file.seek(existing.end)
+        else:
+            self.labels = LABELS
+            header = {"source": source, "labels": LABELS,
+                      "columns": [column[:2] for column in COLUMNS]}
+            self._file = open(path, "wb")
+            self._file.write(MAGIC + json.dumps(header).encode("utf-8") +
+                             b"\n")
+
+        self._codes = dict((name, dict((label, code) for code, label
+                                       in enumerate(labels)))
+                           for name, labels in self.labels.items())
+        self._buffers = [array(typecode) for _, typecode, _ in COLUMNS]
+
+    def append(self, t, snapshot):
+        """Add snapshot polled at time t"""
+        values = snapshot["values"]
+        params = snapshot["params"]
+        row = {"time": t, "level": snapshot["level"],
+               "cell_id": _param(params, "cell_id"),
+               "pci": _param(params, "pci"),
+               "network": self._codes["network"].get(snapshot["network"]),
+               "status": self._codes["status"].get(snapshot["status"])}
+        for (name, _, missing), buf in zip(COLUMNS, self._buffers):
+            value = values.get(name) if name not in row else row[name]
+            buf.append(missing if value is None else value)
+
+        times = self._buffers[0]
+        if len(times) >= self.chunkRows or t - times[0] >= self.maxAge:
+            self.flush()
+
+    def flush(self):
+        """Write collected rows as a chunk"""
+        times = self._buffers[0]
+        if not times:
+            return
+        blocks = []
+        for buf in self._buffers:
+            if sys.byteorder == "big":
+                buf.byteswap()
+            data = _tobytes(buf)
+            blocks.append(zlib.compress(data, 1) if self.compress else data)
+        header = _CHUNK.pack(_CHUNK_MAGIC, len(times),
+                             COMPRESSED if self.compress else 0,
+                             times[0], times[-1])
+        sizes = struct.pack("<%dI" % len(blocks),
+                            *[len(block) for block in blocks])
+        self._file.write(header + sizes + b"".join(blocks))
+        self._file.flush()
+        self._buffers = [array(typecode) for _, typecode, _ in COLUMNS]
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class ColumnarReader(object):
+    """ColumnarReader - reads time ranges and columns of an export
+
+    Only chunk headers are read on opening. A chunk cut short by a crash
+    ends the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        header = _readHeader(self._file)
+        self.source = header["source"]
+        self.labels = header["labels"]
+        self.columns = [tuple(column) for column in header["columns"]]
+        dataStart = self._file.tell()
+        # (offset of column blocks, rows, flags, first time, last time,
+        # block sizes) of every chunk
+        self.chunks = self._index()
+        # end of the last complete chunk
+        self.end = dataStart if not self.chunks else \
+            self.chunks[-1][0] + sum(self.chunks[-1][5])
+
+    def close(self):
+        self._file.close()
+
+    def _index(self):
+        source = self._file
+        size = os.fstat(source.fileno()).st_size
+        sizesFormat = struct.Struct("<%dI" % len(self.columns))
+        chunks = []
+        while True:
+            header = source.read(_CHUNK.size + sizesFormat.size)
+            if len(header) < _CHUNK.size + sizesFormat.size:
+                break
+            magic, rows, flags, first, last = _CHUNK.unpack(
+                header[:_CHUNK.size])
+            sizes = sizesFormat.unpack(header[_CHUNK.size:])
+            offset = source.tell()
+            if magic != _CHUNK_MAGIC or offset + sum(sizes) > size:
+                break
+            chunks.append((offset, rows, flags, first, last, sizes))
+            source.seek(sum(sizes), os.SEEK_CUR)
+        return chunks
+
+    def __len__(self):
+        return sum(chunk[1] for chunk in self.chunks)
+
+    def iterChunks(self, start=None, end=None, columns=None):
+        """{column: array} of every chunk with rows between start and end"""
+        names = [name for name, _ in self.columns]
+        columns = columns or names
+        for offset, rows, flags, first, last, sizes in self.chunks:
+            if (start is not None and last < start or
+                    end is not None and first > end):
+                continue
+            inside = ((start is None or first >= start) and
+                      (end is None or last <= end))
+            blocks = self._readBlocks(offset, flags, sizes, columns if inside
+                                      else ["time"] + list(columns))
+            if inside:
+                yield OrderedDict((name, blocks[name]) for name in columns)
+                continue
+
+            # chunk at the edge of the range
+            times = blocks["time"]
+            low = 0 if start is None else bisect_left(times, start)
+            high = len(times) if end is None else bisect_right(times, end)
+            if low < high:
+                yield OrderedDict((name, blocks[name][low:high])
+                                  for name in columns)
+
+    def read(self, start=None, end=None, columns=None):
+        """{column: array} of rows between start and end"""
+        result = OrderedDict((name, array(typecode))
+                             for name, typecode in self.columns
+                             if columns is None or name in columns)
+        for chunk in self.iterChunks(start, end, list(result)):
+            for name, values in chunk.items():
+                result[name].extend(values)
+        return result
+
+    def toCsv(self, out, start=None, end=None):
+        """Write rows between start and end as CSV, chunk by chunk"""
+        writer = csv.writer(out)
+        writer.writerow([name for name, _ in self.columns])
+        missing = dict((name, value) for name, _, value in COLUMNS)
+        formats = dict((name, "%.3f" if typecode == "d" else
+                        "%g" if typecode == "f" else "%d")
+                       for name, typecode in self.columns)
+        for chunk in self.iterChunks(start, end):
+            columns = []
+            for name, values in chunk.items():
+                labels = self.labels.get(name)
+                format = formats[name]
+                columns.append([
+                    "" if value != value or value == missing.get(name)
+                    else labels[value] if labels is not None
+                    else format % value for value in values])
+            writer.writerows(zip(*columns))
+
+    def _readBlocks(self, offset, flags, sizes, names):
+        blocks = {}
+        position = offset
+        for (name, typecode), size in zip(self.columns, sizes):
+            if name in names:
+                self._file.seek(position)
+                data = self._file.read(size)
+                if flags & COMPRESSED:
+                    data = zlib.decompress(data)
+                buf = array(typecode)
+                _frombytes(buf, data)
+                if sys.byteorder == "big":
+                    buf.byteswap()
+                blocks[name] = buf
+            position += size
+        return blocks
+
+
+def parseTime(value):
+    """Seconds since epoch of "YYYY-MM-DD[ HH:MM[:SS]]" or a number"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    for pattern in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return time.mktime(time.strptime(value, pattern))
+        except ValueError:
+            continue
+    raise ValueError("unknown time %r" % value)
+
+
+def main(path, since=None, until=None):
+    """Print export at path as CSV"""
+    reader = ColumnarReader(path)
+    try:
+        reader.toCsv(sys.stdout, since and parseTime(since),
+                     until and parseTime(until))
+    finally:
+        reader.close()
+    return 0
@@ -0,0 +1,163 @@
+from PySide import QtCore
+from multiprocessing.pool import ThreadPool
+from hilink.client import ModemClient, OFFLINE, pollMany, NOTIFICATIONS, \
+    STATUS, PLMN
+from hilink.commands import CommandQueue, CONNECT, DISCONNECT, REBOOT
+from hilink.transport import TransportError
+from hilink.breaker import CircuitBreaker
+import time
+
+
+# fleet view needs no signal parameters or traffic
+FLEET_SECTIONS = (NOTIFICATIONS, STATUS, PLMN)
+
+
+class ModemState(object):
+    """Last known state of a single fleet modem"""
+    __slots__ = ("ip", "level", "status", "operator", "unread", "updated")
+
+    def __init__(self, ip):
+        self.ip = ip
+        self.level = 0
+        self.status = OFFLINE
+        self.operator = ""
+        self.unread = 0
+        self.updated = 0
+
+    @property
+    def online(self):
+        return self.status != OFFLINE
+
+
+class FleetMonitor(QtCore.QObject):
+    """FleetMonitor - polls many modems from one thread
+
+    Requests of all modems share a single pool, so at most `concurrency`
+    requests are in flight at once.
+    """
+    # worst signal level, modems offline, modems total
+    updated = QtCore.Signal(int, int, int)
+    # ip, command, succeeded, error message
+    commandFinished = QtCore.Signal(str, str, bool, str)
+    _commandRequested = QtCore.Signal(str, str)
+    _finishRequested = QtCore.Signal()
+    finished = QtCore.Signal()
+
+    def __init__(self, targets, interval, concurrency=32, poolSize=2):
+        super(FleetMonitor, self).__init__()
+        self._clients = [ModemClient(ip, poolSize) for ip in targets]
+        self.states = [ModemState(ip) for ip in targets]
+        # offline modems are probed instead of polled
+        self._breakers = [CircuitBreaker() for ip in targets]
+        self.interval = interval
+        self.concurrency = concurrency
+        self._pool = ThreadPool(concurrency)
+        self._aggregate = None
+
+        self._requestTimer = QtCore.QTimer(self)
+        self._requestTimer.setInterval(interval * 1000)
+        self._requestTimer.timeout.connect(self._updateInfo)
+
+        self._commands = CommandQueue()
+        self._commandRequested.connect(self._runCommand)
+        # the pool is closed on the monitor thread, not during a tick
+        self._finishRequested.connect(self._finish)
+
+    @property
+    def targets(self):
+        return [client.ip for client in self._clients]
+
+    def monitor(self):
+        self._requestTimer.start()
+
+    def finish(self):
+        """Stop monitoring, finished is emitted once everything is closed"""
+        self._finishRequested.emit()
+
+    def _finish(self):
+        self._requestTimer.stop()
+        self._pool.close()
+        for client in self._clients:
+            client.close()
+        self.finished.emit()
+
+    def reboot(self, ip):
+        self.request(ip, REBOOT)
+
+    def connect_(self, ip):
+        self.request(ip, CONNECT)
+
+    def disconnect(self, ip):
+        self.request(ip, DISCONNECT)
+
+    def request(self, ip, command):
+        """Queue command for modem ip, False if it is already queued"""
+        if not self._commands.put(command, ip):
+            return False
+        self._commandRequested.emit(ip, command)
+        return True
+
+    def aggregate(self):
+        """Worst signal level of online modems and number of offline ones"""
+        levels = [state.level for state in self.states if state.online]
+        offline = len(self.states) - len(levels)
+        return (min(levels) if levels else 0, offline, len(self.states))
+
+    def _index(self, ip):
+        for index, client in enumerate(self._clients):
+            if client.ip == ip:
+                return index
+        raise KeyError(ip)
+
+    def _runCommand(self, ip, command):
+        if not self._commands.take(command, ip):
+            return
+        try:
+            index = self._index(ip)
+            self._clients[index].command(command)
+        except TransportError as e:
+            succeeded, error = False, str(e)
+        else:
+            succeeded, error = True, ""
+        finally:
+            self._commands.done(command, ip)
+        self.commandFinished.emit(ip, command, succeeded, error)
+        # show the new state of this modem without waiting for the next tick
+        self._update([index])
+
+    def _updateInfo(self):
+        now = time.time()
+        probed = [index for index, breaker in enumerate(self._breakers)
+                  if breaker.probeDue(now)]
+        reachable = self._pool.map(
+            lambda index: self._clients[index].reachable(), probed)
+        for index, alive in zip(probed, reachable):
+            if alive:
+                self._breakers[index].probeSucceeded()
+            else:
+                self._breakers[index].probeFailed(now)
+
+        self._update([index for index, breaker in enumerate(self._breakers)
+                      if not breaker.isOpen])
+
+    def _update(self, indexes):
+        snapshots = pollMany([self._clients[index] for index in indexes],
+                             self._pool, FLEET_SECTIONS)
+
+        now = time.time()
+        for snapshot, index in zip(snapshots, indexes):
+            state = self.states[index]
+            if snapshot["status"] == OFFLINE:
+                self._breakers[index].failed(now)
+            else:
+                self._breakers[index].succeeded()
+            state.level = snapshot["level"]
+            state.status = snapshot["status"]
+            state.operator = snapshot["operator"]
+            state.unread = snapshot["unread"]
+            state.updated = now
+
+        aggregate = self.aggregate()
+        if aggregate != self._aggregate:
+            self._aggregate = aggregate
+            self.updated.emit(*aggregate)
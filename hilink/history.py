@@ -0,0 +1,216 @@
+from array import array
+import mmap
+import os
+import struct
+
+
+NAN = float("nan")
+INF = float("inf")
+
+# numeric signal parameters worth keeping
+METRICS = ("rssi", "rsrp", "rsrq", "rscp", "ecio", "sinr")
+
+# bucket width in seconds and number of buckets: an hour of raw samples,
+# a day of minutes and 90 days of hours
+LEVELS = ((1, 3600), (60, 1440), (3600, 2160))
+
+_HEADER_SIZE = 256
+_ROW = struct.Struct("5d")
+
+
+class RingBuffer(object):
+    """RingBuffer - fixed number of time buckets of a single metric
+
+    Every bucket keeps start time, min, max, sum and count of the samples
+    that fell into it. When `storage` (mmap) is given buckets are written
+    through to it at `offset` and restored from it on creation.
+    """
+    FIELDS = 5
+
+    def __init__(self, width, capacity, storage=None, offset=0):
+        self.width = width
+        self.capacity = capacity
+        self._storage = storage
+        self._offset = offset
+
+        size = capacity * self.FIELDS
+        if storage is None:
+            self._data = array("d", [NAN]) * size
+        else:
+            self._data = array("d")
+            _frombytes(self._data, storage[offset:offset + size * 8])
+
+        # restore position from bucket times, empty ones are NaN
+        times = self._data[::self.FIELDS]
+        filled = [i for i, t in enumerate(times) if t == t]
+        self._size = len(filled)
+        self._head = max(filled, key=lambda i: times[i]) if filled else -1
+
+    def __len__(self):
+        return self._size
+
+    def oldest(self):
+        """Start time of the oldest bucket"""
+        if not self._size:
+            return None
+        tail = (self._head - self._size + 1) % self.capacity
+        return self._data[tail * self.FIELDS]
+
+    def add(self, t, value):
+        start = t - t % self.width
+        data = self._data
+        row = self._head * self.FIELDS
+        if self._size and data[row] >= start:
+            if data[row] > start:
+                # late sample of a closed bucket
+                return
+            data[row + 1] = min(data[row + 1], value)
+            data[row + 2] = max(data[row + 2], value)
+            data[row + 3] += value
+            data[row + 4] += 1
+        else:
+            self._head = (self._head + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            row = self._head * self.FIELDS
+            data[row:row + self.FIELDS] = array("d", (start, value, value,
+                                                      value, 1))
+
+        if self._storage is not None:
+            _ROW.pack_into(self._storage, self._offset + row * 8,
+                           *data[row:row + self.FIELDS])
+
+    def stats(self, start, end):
+        """Min, average and max of buckets within [start, end)"""
+        data = self._data
+        low, high, total, count = INF, -INF, 0.0, 0
+        index = self._head
+        for _ in range(self._size):
+            row = index * self.FIELDS
+            t = data[row]
+            if t <= start - self.width:
+                break
+            if t < end:
+                low = min(low, data[row + 1])
+                high = max(high, data[row + 2])
+                total += data[row + 3]
+                count += data[row + 4]
+            index = (index - 1) % self.capacity
+
+        if not count:
+            return None
+        return (low, total / count, high)
+
+    def series(self, start, end):
+        """List of (time, average) of buckets within [start, end)"""
+        data = self._data
+        points = []
+        index = self._head
+        for _ in range(self._size):
+            row = index * self.FIELDS
+            t = data[row]
+            if t < start:
+                break
+            if t < end:
+                points.append((t, data[row + 3] / data[row + 4]))
+            index = (index - 1) % self.capacity
+        points.reverse()
+        return points
+
+
+class SignalHistory(object):
+    """SignalHistory - signal parameters rolled up to several resolutions
+
+    Memory use is fixed by LEVELS. With `path` the buffers live in a
+    memory-mapped file and survive restarts.
+    """
+
+    def __init__(self, path=None, metrics=METRICS, levels=LEVELS):
+        self.metrics = metrics
+        self.levels = levels
+        self._file = None
+        self._storage = None
+
+        if path is not None:
+            self._storage = self._open(path)
+
+        self._buffers = {}
+        offset = _HEADER_SIZE
+        for metric in metrics:
+            self._buffers[metric] = []
+            for width, capacity in levels:
+                self._buffers[metric].append(
+                    RingBuffer(width, capacity, self._storage, offset))
+                offset += capacity * RingBuffer.FIELDS * 8
+
+    def append(self, t, values):
+        """Add sample of {metric: number} taken at time t"""
+        for metric, value in values.items():
+            buffers = self._buffers.get(metric)
+            if buffers is None:
+                continue
+            for buf in buffers:
+                buf.add(t, value)
+
+    def stats(self, metric, start, end=INF):
+        """Min, average and max of metric, None if there is no data"""
+        return self._level(metric, start).stats(start, end)
+
+    def series(self, metric, start, end=INF):
+        return self._level(metric, start).series(start, end)
+
+    def flush(self):
+        if self._storage is not None:
+            self._storage.flush()
+
+    def close(self):
+        if self._storage is not None:
+            self._storage.close()
+            self._file.close()
+            self._storage = self._file = None
+
+    def _level(self, metric, start):
+        """Finest buffer that still covers start"""
+        buffers = self._buffers[metric]
+        for buf in buffers:
+            oldest = buf.oldest()
+            if oldest is not None and oldest <= start:
+                return buf
+        # not enough data anywhere, the coarsest level has the most
+        covering = [buf for buf in buffers if len(buf)]
+        return covering[-1] if covering else buffers[0]
+
+    def _layout(self):
+        levels = ",".join("%dx%d" % level for level in self.levels)
+        header = "HLHS1 %s %s\n" % (",".join(self.metrics), levels)
+        return header.encode("ascii").ljust(_HEADER_SIZE, b"\0")
+
+    def _open(self, path):
+        header = self._layout()
+        size = _HEADER_SIZE + sum(
+            capacity * RingBuffer.FIELDS * 8
+            for _, capacity in self.levels) * len(self.metrics)
+
+        fresh = True
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            with open(path, "rb") as f:
+                fresh = f.read(_HEADER_SIZE) != header
+
+        self._file = open(path, "w+b" if fresh else "r+b")
+        if fresh:
+            # layout changed or no file yet, start empty
+            self._file.write(header)
+            empty = array("d", [NAN]) * ((size - _HEADER_SIZE) // 8)
+            self._file.write(_tobytes(empty))
+            self._file.flush()
+        return mmap.mmap(self._file.fileno(), size)
+
+
+def _frombytes(buf, data):
+    if hasattr(buf, "frombytes"):
+        buf.frombytes(data)
+    else:  # 2.x
+        buf.fromstring(data)
+
+
+def _tobytes(buf):
+    return buf.tobytes() if hasattr(buf, "tobytes") else buf.tostring()
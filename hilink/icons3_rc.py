@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created: Sun Oct 18 10:12:40 2026
+#      by: The Resource Compiler for PySide (Qt v4.8.7)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide import QtCore
+
+qt_resource_data = b"\x00\x00\x14\x86\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c--y\x13\x18\xa8\x00\x00\x14\x13IDATx\xda\xed\x5ck\x8c$\xd5u\xfe\xce}Uu\xcf\xf4\xbcvw\x06\x98\xcdz\x81\xac\xd7k\x0c\x0b6\xc1v\x1c\x12\x10\x0e\x18)\x18\xc9\xc6J\xc0\xc4\x8e-Eq,\x22E\xf9\x13\xc9\x12 9\x7f\xe2(V\x14\x92`K\x91\xb0\xa58J\x82d%\xb2\xb0\xb1 8\x96\xc3\xe2u\x14 1^`\xd7\xfb~\xef2K\xcf\xf4\xbb\xbb\xaa\xee\xc9\x8f\xae\xdb\xdc\xa9\xa9\x9e\xe9\xd9]\xf3\xc8\xd6\x91J=;L_\xaa\xcf9\xf7;\xdf\xf9\xce\xad\x06\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+l\x85\x11\xd1E\xfd[*\x5c:\xba3\x99\xd9w\xec\x9a\xbec\xf7\x86\xc2.^\x10\xb4\xd6\xb4\x8e\xbf\xa7\xb5\x02U\xec\x80u\xc6\x00\x00\xcf\xcd\xcd\xcd\xc7q<\x91\x073i\xd2\x93R\xaau\xfa\xf4\xe9\xc3\xden\xe1\x22\x00\x17\xe8\xfc[n\xb9e\xea\x96[n\xf9\xf2\xe6\xcd\x9b\x1fp\xceffXk\x97\xed\x12!\x04\x98\x19\xa7N\x9dz\xe6\xa9\xa7\x9e\xfa\x83]\xbbv\x1d\x98\x9c\x9c\xc4\xd2\xd2\xd2\x8aEU\xe1\xd7\x91L\xdcu\xd7]\xf4\xa1\x0f}\xe8O>\xfa\xd1\x8f>P\xa9T\xd0j\xb5\xb8\xdb\xed\x22\x8a\x22\xc4q<\x08\x86\x94\x12Zk\x94J%\xba\xf6\xdako\xd3Z\xff\xe3\xae]\xbb~kiii\xc1\xaf#\xced\xe1\xdb\x91\x8c\xef\xb8\xe3\x8ep~~\xfek;v\xec\x98\xaeV\xab\xbc\xb4\xb4\x84Z\xadF\x8dF\x83Z\xad\x16u:\x9d\xc1\xd5\xeb\xf5\x10\xc71\xcd\xcc\xccDD4y\xfa\xf4\xe9=G\x8e\x1c\xd9\x07\xc0\xae\x88l\xe1\xdb\xd1\xec\xd4\xa9S\x8a\x99\xa7\xe38F\xaf\xd7\xe3n\xb7\xeb\x1c\x8d$I\x06\xbb\xc0Z\x8b8\x8e)I\x12\xeev\xbbBJ\x19\x10\xd1v\x00S\xb9[\xabp\xedh\x16\x04\x01\x13\x11[k\x91$\x099\xdc'\xa2e\x97\x10\xc2]$\x84\x00\x00\xd1\xedv'\x01\x8c\xe7\xf9\xbb\xa8\x01#Z\x92$\xb9M\x96{efDQ\x04\x22\x82\xb5\x16Q\x14\x81\x99)-\xc8j\x98\xaf\x8b\x00\x8chq\x1c\x0f8\xbd_p\x1b\x8d\x06Z\xad\xd6\xe0\xdf\xc6\x18\x18c\x06\xd0\xc4\xcc\xabv\xc4E\x00\xce\xc3\xa4\x94 \x22\x1c;v\x0c\xf5z\x1dccc\x08\x82\x00B\x08\x10\x11\xa4\x94PJA)\x85<\xe6s\xc9\xd5\x80\xf5\xe87\xa3\xac\x15E\x11^~\xf9e\x9c9s\x06Zk(\xa5\x969_\x081\x08\x82\xeb\x09.\xe9\x1d\xe0\x1c \x84\x185\x12l\xad]\x91\xbdD\x84N\xa7\x83\x9f\xff\xfc\xe7h6\x9b\x08\xc3p\xe0\xf0\xec\xe5~\xef\x8a\xf3%\x1d\x80R\xa9\x84v\xbb\x0dk\xed\xc8\xe2\x98\x10\x82\xac\xb5\xec\x82 \x84@\xb7\xdb\xc5\xe1\xc3\x87\xd1\xeb\xf5\xa0\xb5\x1ed\xbcc?~0\x8a\x1d\xe0Y\xbb\xddv?^\x1b\x86\xe1eY\xea\xe81\x1d\xd1\xeb\xf5\xaaI\x92\xfc\x97\xb5\x96\xc30\xa4N\xa7\xc3\x00`\xadE\xbb\xddF\xbb\xdd\x1e\xbcO)\xb5,\x00\xce\xf1\xfe\x95R\xd1K/\x00.s\x89\x88n\xbc\xf1\xc6\xf2\xad\xb7\xde\xfaw7\xdcp\xc3g\x94R\xb0\xd6\x0e._b\x96R\x82\x99i\xdf\xbe}?}\xf8\xe1\x87\xef\xect:'\xf3\xd6Lw\xc8 \xc3\xf3\xe0\xc7\x0f\xce%\x19\x80\xd4\xf9\x82\x99\xed\xcd7\xdf\xfc\xa5{\xef\xbd\xf7\xb3\xe5r9i4\x1a6\xd5p(\x8a\x22\xc7\xd7!\xa5\xe4 \x08011A\xdb\xb6m\xbbN\x08\xf1\x83\x07\x1f|\xf0\x03\x00\x9a\xd9 \xf8\xd9\xefg}6\x00.@\x97d\x00\xd2 X\x00r\xdb\xb6m\xbf_.\x97\xb1\xb0\xb0@\xf5z]w:\x1d\xc4q\x8c8\x8e\x07J\xa6\xe3\xf0Q\x14a\xeb\xd6\xad\xbd\x9d;wn\xb9\xe6\x9ak>\xbeg\xcf\x9e\x7fFFJv\xbb\xc5e\xb8\xcb\xf2\xbc]\xe0\x93\x80K\x95\x86\x8e3s%\xd5p\x06\xfa\x8dk\x94|(r?GQ$\x83 \xa0\xf1\xf1\xf1\x1d\x00\xa6\xe1\xc9\xf6\xae\xb1\xcaf}\x1e\xfc\x8c\x02A\x97B\x00\x06E\xd4]Yz\x9a-\x9c\xa9\xe3d\x14E\x13\x00&\xc8\xf3\xa2\x0fA\xae\xf8fY\x90\x1f\x84K\x19\x82\xdc\x14\x8a\x00\x90\x93\x0f\xb2\x85\xd4\xfd>\x8ec\x10QV\xf3\x91\xbe\x8f\xfc\x82\xed\x8bo>\xe5t\xf3\x00?\x00\x97<\x0d\xcd\xd2M\xd7P\xd5j\xb5A6\x97J%H)\x07;d5\xc7\x09!`\xad]\x06AY\x09\xc2\x87\xa8K>\x00.{\xa5\x94H\x92\x04'N\x9c\xc0\xb9s\xe7\x90\xb2\x9ee\x19\xeb\xc4\xb4\xd4q\x94\xe7|\x07+y\x14\xd4\x0f\x80\xd6zM)D\xbd\xc3 e$\xbc\x1f\xe6\xfcN\xa7\x83W_}\x15\xf5z\x1dZk\x04A\xb0,S\x9d\xf3\xb4\xd6\xb9\x99\xeb\xc3\x8e\x1f\x00\xb7F\xd6\xf9\xae\x08\xff\x7f\xd8\x01CO\x15\xe4\x90\x0a\xce\xa3\x8d\x9dN\x07\xfb\xf7\xefG\xb7\xdb\xcd-\x94\xbe\xf3]\x81\x1d\x96\xb9\xd9\xce\xd7\x7f\xf5\xf9\xffZ\x05\xf8\x9d\x12\x00q\xff\xfd\xf7\xef\xd0Z\xcf3\xb3\xcc\x1e\x90\xf2~\xb6Dt\xec\xb1\xc7\x1e{\x15\x00;\xb8\x01\x808\x8eq\xe8\xd0!DQ4X\xd4W1\xfd\x0c\xd6Z\xfb\x104T\x8av;\xc0\x0f\x86[\xd3\xdf\x09\xef81\xce9\xf5\xaa\xab\xae\xa2\x83\x07\x0f\xf2C\x0f=\xf4\xc7\xdb\xb7o\xffS\xad\xf5l\x92$\x03\xee\xeeC\x80R\x0aA\x10\xa0\xd1h\x9c1\xc6<\xfa\xf5\xaf\x7f\xfd\xcb\xd7_\x7f=?\xff\xfc\xf3\x00\x80V\xab\x85F\xa3\xb1\x0c:\x1cD8G\xf9\xce\x1f&\xa2\xf9S\xb0a\xd4\xd3\xdfI\xa3\xd8\xdb.\x00N\xbf9x\xf0 \xdfs\xcf=\xb7\xde|\xf3\xcd_\xdd\xb2e\x0b/--q\xa7\xd3A\xaf\xd7\x1b\x04\xc0}\xd80\x0c1>>\x8e\x0d\x1b6l\x9c\x99\x99y\xf0\xa5\x97^:\xb4k\xd7\xae\x7f\xc8B\x86[\xdf\xc7y\x7f\x07h\xad\x07\xd70\xf8\x182\xff]\x11L\xd7\x05\x8f\x82\x99o[\xfd~ff\xe6w7n\xdc\x88z\xbdnk\xb5\x1a\x16\x17\x17iii\x89\xdcq\x10w$\xa4\xd9lR\xb3\xd9\xa4n\xb7\x8b\xeb\xae\xbbN\x5cs\xcd5\x9fB\x7f\x08\x9eK!\xb3<\xdd\xcf~\x17\x80Ud\xea\x15]\xb0\x0f9\xfe\xeb(\x83\xa0\xb7u'\x9c$\xc9T:\x81\xa2^\xafGQ\x14-\x93\x0f\x1c$y\x81#!\x84\xd0Z\xcf\x02xW\xf6\xf3Yk\x97\xc1\x8fs^6\xfbW\x93\x10\xf2\x9a0\xbf\xf9\xf2\x831\xca\xd9\xdc\xb7e\x11\xf6\x8ak\xe2;\xdbu\xb2~\xd3\xe3\x7fp\xe7\xbc(\x8a\x0c\xfa\xe7pDv]\x1f~|\xe9\xc19\xdf\x18\xb3b'\xfa?g\x1b\xaf<\x1a\xeaC\xd0;Z\x8e\xa6\x9c\xbbw\x0ep\xf2\x81\xfb]\x18\x86\x03\xbe\xcf\xcc\x22\xfdl\x03\xfa\xea\x1c\x98\xedT\x9d\xe3\x5c\x03\xe6\x07\xc0\xaf\x03y\xe7\x7f|]\xc8_\xd3M\xcb\xde\x91ExX\x0c\x5c\xf1\x8c\xa2hp\xc85\x08\x02\x94\xcb\xe5\x81\xe33\xb4\x8f\xf3\x82\xe7(\xa6_8}\xec\xf7\xf1?\x8f\x05\xad\xc5|\xb2\x83\x98w\xfcL\xd8W,\xcf\x9e=\x8bZ\xad\x860\x0cQ.\x97\x07\x1f\xdcw\xa0\x94\xd2o\xdeh\x98\x03\xfd\xacu\x99\x1f\x04\xc12\xf9 \xcfq\xd99p\xb6\x00\xfb\xc7Q\xdc\xfd\xbfe\xf3\x80\x0b=\x0d\xe20\xdfZ\x8b\xc3\x87\x0f\xe3\xc4\x89\x13+0\xdc\xfd\xdb]\x19\xa7q^\xf7\xea_\xee}~\x06\xe7a\xb7_\x03\xb2\x058\xcb~\xfc\x02\xfc\x96\xee\x00f\x80\x08k>%\xe2HJ^\xa2Xkq\xf4\xe8QT\xabU\x94J\xa5A\x93\xe4o{\x7f\x07\xb8C\xb2y\xe627\xdb\xf9\xfakd\x8f\x1cfk\xc0\xb0\xd1\xa3\x7fek\xc7[R\x03\xd2{ kWj3\xab\x08>\xc4\x99\xac=~\xfc8\xaa\xd5\xea\xc0Ay\xec\xc5A\x88\x0b\xc0j\x1c\xde\x0f@\x96~\xba\xfa\x90\x87\xffY\x08\x1a\xd6|\xb9\xff\xe6\x9a\xc5\xb5\xa8\xe8/,\x00\xd6\x82\xee\xbe\x1d\xb4o\xbf|o/\xe2-.\xb18\x03\x0e\xcc\x04)\xd1y\xdf\xbb\x93]\xff\xfa4z\xfen\xb1\xd6\xa2V\xab\xe5\x0e=\xfc\x02\xea^\x9d\xf3\xf2\xb2.O\xb9\xcc\xee\x9eQ\xba\xd7\xbc\xee\xd7g@J\xa9\x15\x87\xb9\xdet5T)\xd0\x07\xaf/O\xfc\xea\x076\xfc\xf9\xa7?1\xf7\x05\xa54\x98#\xf4g\xe4^7)$\xb4\x09!\x088pp\xdf\xc9n\xf7\xf8\xe7\xbe\xf7#<Eo\x04\x8a\x9dS}\xe7\xfb\x93'?\xfb\xfd\xba1L\xc1\xf4\xf1\xdb9\xdd\x15`\xbfxf\x1d\xe7\xcf\x82\x87e\xbf\xfb\xf7j\xc3\xa07#\x00\x14\xc7\xe0_\xbf)\xfc\xc3\x8f\xdd~\xc7\x17\xc6*[l\xbbu\x0e\xbdn\x9d\xad\x8dH\x08\x82R\x12\x811\x08\xc3\x12\xcac\xe3<Q\xd9D\x1f\xf9\x0duE9\xfc\xea?}\xefG\x07\x7f\xcd2\xbf\x92\x06\x8a\xb2\xec\xc5\xff\xc0~\xf14\xc6,\xd3|V\xcb\x5c\xff\xfd\x8e\xf98xsG\x12]\xb0\xf2\xea\x88\x1f\xc0l\x07<\xacx\xbf\x99,\x88\x01\xa02.\xef/\x8f\xcf\xa3\xb6t\x12K\x8b\xc7\xc4\xd2\xe2qY[:)\x1a\xf5S\xa2Y?#\x9a\x8d3\xa2\xd5<#\xda\x8d\xb3\xb2U?%J\xa5\xc9\xe8\xa6\x0f\xdf>~\xeb\x8d\xf8\x04@\xc6\x1f\xc2dq;\xcb\xdf\x1d\x0c\x8d\x02\x1d\xc3\xe0+\xab\xff\xe49.\x8fz\x0e\xa3\x9fy\xcd\xdc\x9bJC\x094\xc1I\x0fQ\xd4F\x1cw\x10\xc7=X\x1b\xc3r\x0c \x06\x91\x85\x10\x0c!\x01!\xc1\x8c\xae0A(\x95\xc2V\x80gS'\xb0k\xb2\xf2\x1a \x1f\x82\xdc\xd6w\xe78\xd7\xe2\xff~\xe1\xcd\x0b`\x1e\x0b\xf2\x9d\x9fw\xb9{X\xcfi\xec_X\x11f0\x98\x130[\xb2\xd6\xe1\xa7\x80\x12\x0aJ\x1aH\xa9 \x85\x84$B\x9f\x1d*\x22\x12\x1c%\x18\x030\xe1\x02\x90\xd5]\xf2\x9a/_>\x1eV\xf4\xb2\xc53\x8f\xfdd\x1f7\xcd\xee\x08\x17\xdc<\xc7\xbb\x1a\xe5 lT\x08\xfa\x85\x05\x80H\x10\x04\x01lA\xd4/\xa2l\xbb\xe8\xb4k\x88{\x16\xd6\x1ah9\x09.\x01Dc\x00,\xfa-\x03\x04\xd2\xa77\xa9o\x83\xd3\x0a\xc3\xe0g5\xfe\xeeC\x98\xaf|\xfa\xda\x8f\xdf\xfd\xae\xda\xb5\xa6\xc1\xb3\xd6\xae\x18\xe4\xf8\x0d\x9cw.\xf5\xad\x16\xe3\x18B*\x80\x18gO\x1fD\xb7\xf3\x1a\xca\xa5\x00\x13\x13\x93\x18\x97\x1b\xa0\xb5\x81\xd6\x01\xb4\x0a\x00\xa1\xc1Bx<5\x1fB\xb2\xcae\xb6\x03^\xed(\x89\xdf\xf9\xfa\x0chT\xe9\xd8\x09o\xae\x18\x9f\x8f\xfc\xfc\xe6A\x103\x84P\xe8\xb4\xeb\xf8\xd9O\x9f\x05\xdb&\xa6\xa7\xc6\xfa\x94\xcf\x94\xa0U\x08\xad\x03\x18\x1d@(\x03H\x03b\x81\xecA\x10\xfft\x99?<q\x97{4\xc8\xcf\xb8<\xfc\xf6w\x80\x9f\xfd>\xfc\xacu\x86\xc7\xdd\x8f\xff@\xf6ZG\x10\xd7}4\xf1b=\xcdCD\xe8\xb4\x97\xf0\xea+\xff\x81N\xa7\x81R(\xa1\x94\x86\xd2\x06\xdahh\xd3\xcf~\xa5\x0d\x840\x004H\xc8\x15\x9a\x85\xaf\xe1d\xe5\x07\x1f~\xf2\x06\xf5y\x81\xccb\xff\xa8\xba}6\x90\xae\xeed\xc7\x8f\xeb}\x1cJ\xe4\xe97B\xac;\x10+\xfe:Nz8z\xe89D\xbd\x1a\xca! \x95\x84\xd1z\x00;F\x87)\xfc\x84 i\x00\xa9A$W\x88\x16y\xd2A\x96~\xae\xf5$b\xd6qy\xef\x1f\x15>\xfcd\xc8\xca\xcf\xe7\x03A+\x02 \x05p\xc3\x8e~ \xd6\x838\x9f\xff\xe4\xf2_D\xbd\x16\xda\xed%(e\xa0\x94\x80\x92\x1aJ\xeb~\x10\xd2\xec\xd7:\x80T\x1aL\x1a\x80\x01\x93Z\x11J\x7fl\x98\xe7\xc0<\x9e\x9d\x07AY\xec\xcf\xbe\x7f-\xbe\xee\x82<L|s\x10v\xde5\x80\xa8\xef\xf4\xc4\x02\xcf\xef\x01\xee\xfc\x08>\xb6\xfd\xdd\xf8#Ar\x1a\xc4\xd4\x1f-\xa5<\x85\x80>\xbf\x91B\xd8\xde\xe9\x1f\xee\xc6\xdf?\xf6m|\xf7\xfe\x8f\x83\xbe\xf5\x9d~\x0e\x13\x04\x88\x04\x84\x14\x00;\xdc6\xd0\xda\xc0\xe8`\xf0\xb3T\x01,\x19\x80\x0c\x88\x96C\x90\xa3}\x8e\x01e\xf1?\x0b?\xabQH\xd7$e\xe1\xc7\xcf\xfe\xb5\xe0\xc3\x9f\x05dNR\xaf*\x83\x8c\x14\x00'\x1do\x9a\x06>\xff\xdb\xb3\xf7\xdc\xf9\x9b7\xfc\xcb\xc6\xb9\xf7\x91Mz\xb0I\x0fJJhm\x10\x86!\xc2R\x09c\xa5\x09\x94\xc6\xa7\xd0\xb1\x02\xbb\x7f\xf0\xb5\xbb\xff\xec/w\x7f\xf1[\xdf\xc1\xd7|\x06D\x00\x94\x90 \xe2\x14~\xf4 \xf3\xb5\x0e\xa1T\x00H\x03\x08\x9d6\xbfrh\xf3\xe3\x9c\xe74\x1b\xf7\x9a\xf7\xc1\xb3\x01\xc9\xae\xe17_\xa3\xd2\xc5\xac\x1c\xed\xef\x00\xbfG\xb8 \x08b\x06~e\xa76\xdb\xb7\xcd\xfe\xc5\xd6\xabo\xa38\x8a\xe3f\xa3j\xdb\xed%\xdb\xee,\xd9n\xb7f{Q\xdd&q\xcb2\xb7,\xdb\x16\x97J\xd3\xc9\xad\x9f\xfa\x9b\xf8\xf3\x9f\xbe\xea!\x00W\xfa\x8dX\xffF%\xb4J\xb3N\x07\xd0\xc6\x05\xc0@\xe9~\xe6s\xba\x038\x13\x00\xc76\xb2\xddk\x10\x04\xcbN\xaf\xe5u\xbey\xf4\xd1/\xdc\xee\xfd\xa38\x7fX-\xf1\xb5\xff\xf3}\x169\x1b2\xde{\xc0^\x1e\x1a\xb3\xb5\xd3\xa9s\xbb\xb5 \xbb\xddE\x11uk\x22\x8e\x1a\xc2\xda\x96`\xdb\x13\xe0H\x10E\x82(\xa1\xa4\xf7\xbad(\xfa\xa5+?\x18^9\x87\x0f;\x1d\x87\x88@B@J\x05\xa5S\xf6\xa3\x0dL\xfa\xaau\x00!\x03\xb00 \x0aR\x08Z]B\xf0\xf1{\x18\xfc\x0c\xb3<\xf6\xe32w\x945\xfc\x89\x98\xdf\x10\xae\xd6\x00\x9eW\x1f`\x19\x8a\xc1`\x1bQ\x92D\xb06\x86R\x1aZ\xb9\x82\xd5\x05X\x818\x00\x10\x81\x04@\xb0LD\x8a\x09\x9bS\x19a\xa1/%KH\xa5\xa1\x15\x0f0\xff\x0d\x08\x0a@\xc2\xc0\x0a\xdd\x87!\xe8\x15s\x1b\xb7\x03\x5c\xe6\xf9\xdc}\x14\xf6\x93\x85 \x00+\xb4\x9fQw\x80\x7f\x02\xc2o\xc4.\xf4{\xf9\xfc\x22L\xcc\xe9\xf4\x8ah\xa0\xdd\x87a\x09\xbdn\x1d\x8b\x8b'\x10\x18\x02MN\xa1\x1c\x5c\x06\xa22@6e-\x92\x98A\x89E\x08 p+J)\xa1\xa4\x82R\x04\xa3\x1c{q\xf8o\x804\xfb\x19\x01@j\x05\x9bu;\xc0q\xee\xac\xf6\xb3\x9e\xa2\x97\xad\x01\xeb}\xbf\x7f8\xc0\xbf\xa7\x0b\xfd\x1a\x04\x957\x16\x043HH\xc4I\x17\xa7\x8f\xbe\x88n\xe7\x1c\xa6\xa6\xa6P\xdet9\x8c)!\x08J\xd0:\x04\x89\x00L!@\x01\xd2<\x1a\xcc\x7f\x09\xccRI(\xad\xa15`\x023\xc0~\xad\x0d(\x85\x1f\x90\x01(\x18:6\xce;\xb9\xe6\xce\xee\xac'{\x1dd\xadw\xf7\xe4\xc1\xa1?_v\xe2\xdbE\x83 N\x9f\xaaZ\xac\x1e\xc6\xdeW\x9eF\x12\xb7035\x83R8\x96\xd2\xc7\xe0\x0d\xfc&\xd3Ox\xd6\x00\xadh\xa1 \x85J\x0b0\xa0T\xe0\xc1\x8f\x01I\x03K\x1a\x82\x020\xeb\xa1\x01p\xd0\xe3CP\xf6\xf1\xcfQ\x18\x8c+\x98\xfe\xf9\xff\xf39\x1e\x93}\x04\xf5B\x9c\x9f\xaf\x05\x11\xa3Q;\x83\xa3\x87\x16\x91\xc4\x11\xc2\xa0\xd4\xcf^c`L\x08c\x02\x18\x13\x00\xca\x80\xa5\x01D\x00\x90p\xac\xf3\x8d\x1d@\xe8\x17`\xa9a\xb4X\x86\xffrP|]\xf6\xcbU\xb5\x97a\x83\xf3Qi\x9f\x0f\x19N;:\x9f\xc6)\xfb\x80\xf6\xc5\xf8^\xd6\x1c\x08b\xf4zm0\x1b\x18\xada\xb4\x84Vf\x90\xfdJ\x87\x902\x04!\x00!\x80E\x90\x92)\xbb\x82`I\xa9\x00\xa3\xa0\xb5\xf4\xe8\xa7\xdb=\xba\x1f\x00\x04\x00\xc9\xa1Y\x97\xa7~\x9eO\xdb\xefk7\x17\xc2Z\x1c\x03\xbah\xf3\xf3\xdc\xb3!D \x91\xb6\xddN8K3?0!\x946`\x15\xa4\xd9\xafsO\x9d\x101\xa4R\x10\x14@\x1b\xd5\xd7~R\x18\x22i\xfa;`\xf0\xfe\xd5\x8bg\xb6\xfb]\xaf\xf3\x1d\x8br\xea\xe5\xf9dnV\x12?_\xf1m\xb5>\x80\x07j(\x03R\xa4\xdc;e/}\xfe\x1e\xf6\xf1[\xa4\xf8O\xa1\x07\x1f\x99\xf3\x98D)\x03\xd2\x83\xa6\xab/=\xa4\xceG\xfa~\x17\x00^\xf62\xb8\xa7\xec\xf8p\x9d\xd9\xe7\xbc\xc3\xd9\xb9\xc1\x88\x8e\xe3\xac\xa3\xb3\x87\xae\xd6\x0a\xe6\xc8\x131\xf7wl1\xc8~m\x0c\xb4J\x1b\xa8\x14\xff\x95\xee\xcb\x07D\x01\x88B0\xdc\xc3\xce\x83\x9b\xed\xbf2\xf5\x07-\xcc\xac\xb5&\x9dv\xc1\xc2\x93\x1e\x18\x01h\x90\x03<TF\xf6\xe5\x83\xb52/]c\xd9\xbd\x08!\xc8\x05\xcfg.\xa3:\x7f\xb5b\xbf\xda:\xde\xe7\xe1a\xaa\xb1\xca\x99\x07\xb0\x90\x02\x81\x19\x03!\xe20\xd4\x14\x06c0\xa6\x0cc\xcaP\xb2\x04\x16%\xb0\xe8\xd7\x000\x81Y0\x09\xb9\xec\x7f \x04\xb1\x09\xca\x00+\x0a\x02\x85\xc0\x94\xa1u\x09$C\xb0\x08A2\xf4\x0a\xb0\x05\x131\x09\xb5\xec\x0e\x89\x88\xd23;\xec\xd3\xc7\x11\x1c\xb7L\xd3\x13B\xb0\x83\xaeQ4\x1b\xf7\xad\xe7\xeeh6\x11\xa1T*1\x11\xf1z\xa0']\xc7\xbf\x1f\x1e\x0aAn\xbd-\xf3|\xb2\xdd\xee\x9d+\x95gx\xbc\xb2\x09cc\x1b8,M#\x0c\xa7`\x82\x0a +\xb0\x5c\x02\xf3\x18,+$\xacY\x88\x10\xc7\x8e\xfc,:~\x16U\x17\xd4v'\xd9k\xad\xc0\xf8\xf8,\x07\xe1$LP\x81T\xe3\xb0(\xc3r\x08\xcbeXV\xb0\xccH\x12\x06\xd1\x0c\x9f=\xb9\xc7\x1e8\x8a\x05@0\x00DQ\xf4B\xadV\xc3\xe4\xe4$\xc20\x1c|o\xa7\xff\xc5\x1a\xfe\x03\x1c\x00\xb8\xd5j\xf1\xfe\xfd\xfb\xcf\x01\xe8Q\xbf\xca\xd7\xab\xd5\xea\xb1\xf4\x9b\x0d\x99\x999\xfb\xde\xec:D\x843g\xce\xd8\x03\x07\x0e\x9cs~\x0a\xc30\xaa\xd7\xeb\x87Z\xad\x16V{\xbf\xb7\x0e\x13\x11/,,DG\x8f\x1e\xadb\xc8\xf1L\x99\xc9~\xb1\xfdJ\xc4\xd6\xc6<\xbbQ\xde~\xd9\xdc\xd5T\x99\xd8\x84\x89\xc9YT&fa\xca\x9b`\x83\x19\xc0L\x83\xd54\x98\xc6\x10[\x81\x97\x9e\xfb\x0a\xfd\xd5#\xdf}q\xff1z\x9a\xc0G\x01\xd46MG\xc77N\xb7\xee\x9b\xdf\xbcCMN\xcdr\xb9<\x0d\x1b\xce\x80\xf5\x14XM\x82\xe5\x04\x98\xca`R\xb0\x08\xf9\xe4\xfe\xc7\xe5\xdf\xfe\xf5W\x8e\xff\xfbn\xfc\x1b\xc0\x07\x00\xbc\x1e\xc7\xf1+\xf3\xf3\xf3\xbfs\xf9\xe5\x97O\x8d\x8d\x8d\xe5~\xb3Iz\x91\xb5\x96k\xb5\x9a\xf8\xe67\xbf\xd9\xf8\xc67\xbe\xf1\xed8\x8e_&\xa2\x05\x00\xd1\xdc\xdc\xdc\xb9\xa9\xa9\xa9O\xcc\xcd\xcd\x09\x07AyAL/\xde\xb7o\x9fx\xe4\x91G\xf6\xbd\xf0\xc2\x0bO\x008\x04`i\xcf\x9e=\xc9\xe6\xcd\x9b\xdb\x95J\xe5\xee\xd9\xd9YZk\x9d$Ix\xff\xfe\xfd\xe2\xd1G\x1f\xdd\xf7\xe3\x1f\xff\xf8I\x00\x07\x01,\x0e\x9dd\xb9y\x80\x83\xa6\xcf}\x12\x0f\x5c\xbdu\xe3=\x95\x89\xca<Xj\xa5\xb4\x90R\x83\xa4\x82\x10\x0a$\x14\xd8J>q\xf2d\xfb\x99\x1f\x1e\xd8\xfb\x9f/\xd0\xf7\x01~\x11\xc0O\xc3\x00\xf5N\x17|\xf7m\xb8\xeb\xfd\xd7M\x7fqn\xf6\xb2_f\xa8\x92\x10R\x10\xa9\xfe\xe8\x91$\x90\xea\xff\xe7^\xafu\x7f\xf2\x93\xff=\xf1\xed\xa7\xf1}\x00\xff\x0d\xe0E!\xc4k\xd6Z{\xd3M7\xbd\xf7\xb6\xdbn\xfb\xd2\xfc\xfc\xfc\xfb\xa5\x94\xe3\xe9\xb3\xc2\x94m\x80\x9a\xcdf\xbcw\xef\xde\xea\xe3\x8f?\xfeL\xb5Z}\x8e\x88^`\xe6#\x95J\xc5\xd6\xebu\xbe\xf7\xde{?\xbbs\xe7\xce\xdf\x9b\x9e\x9e\xdeb\xad\x0d\x88H\xe4\x1cC\xe4\x85\x85\x85\xee\xb3\xcf>{\xe8\xc9'\x9f|\x12\xc0\x8b\xe9\xf5\xba\xf3\xcb}\xf7\xddw\xff\xce\x9d;?355\xb5\x95\x99\x8dC\x91,$\xbd\xf6\xdak\xed\xdd\xbbw\x1fy\xe2\x89'\x9e\x04\xf0<\x80\xff\xf1\xd6\x19>J\xcc\xd8\xe6\xcdsxO\xa7\x8b\x8d\xcc\x08\x98\xfb\xfd.\xbbxYp\xb5\x89.@u\x80_\x03p\x18\xc09\x00\x09`\x00\xf4\x00`\xe6\xb2\x0d\xd8\x11\xc7\xb8\xc22J\xe0\xc1\xd3\xec\x82\x01K\x0c\xaa5\xd1\x8b\x19\xcd\xf4\xbdG\x01\x9c\x02\x10y\xf7Q\x9a\x9d\x9d}\x0f\x11\xbd+\x8e\xe3\x0a\x00\xe9\x0dA\x98\x88\xa8\xddn\xc7\xcdf\xb3\x95f\xd9\x09\x00\xc7\x00\xb42\x9fg\xee\x8a+\xaexO\x14Es\xd6\xda\x92\xf7\x08\x14\xa5_\xee\x84\xc5\xc5\xc5^\x92$\x8d\xf4^\x0e\x038\x0b {\xe4zn~~~G\xaf\xd7\x9bc\xe60\xf5#\xa7\x8fFY\x00T\xadV\xbb\xd6\xdaF*L\x1e\x19\xb2\xce\xaa\x01\xa0\x14\xa2\x82\xf4\xd2Yj\xe7O \x01t\xd2\xcb\x02\xc0X\x084;\x83:\x13x\x17\x86\xac\x13\xa7\xefo\xe7vu\xfd\xdaRB?\xb2\x22g\x0d\xea\x07\x1e\xddt\x8d8s\x8f\xee\xf3\xe8t\x9du}\x1e\x00\xa8T*\xa8\xd7\xeb\xf0\xfc\x12z\xeb\xb8\xb5\xfcu\xe2\xf4^:9\x9fi\xb5\xa6\xe3\x22\x9c\x8a\xb8h\x07\xbc\xe8m\xb1\xc6\xc5\x5c\xa7\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0\xc2\x0a+\xac\xb0K\xd3\xfe\x0f\x850\xf2`&\x94\xc5\xdc\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x18\x0b\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c.\x1a\xea\x83\xeed\x00\x00\x17\x98IDATx\xda\xed\x5ck\xac\x5c\xd7U\xfe\xd6\xde{\xedsf\xe6\xbem_;\xb1\x9bg\xab\xc4\xa1!\x8f\xbeBA\xc5\xa5Q\xd3\x22BP\xd5\x0a\x14\xd2\x96VB\x94\xaaH\xc0\x1f\xa4\xf2.\x7fZ\xa4\x0a$JZ\x01\xa2\x08\x82h\x91\xaa\xf2#}\x90R\x1e\x027Ni\xe2\xb4M\xe28/\xc7v\xe2\xf7\xcd}\xcc\xbd\xf3:\xe7\xec\xc5\x8f\xbd\xf7\x993s\xe7\xda\xd7\x89\xdb\xd4x\x96ttm\xcbs\xee\x9c\xf5\xf8\xd6\xb7\xbe\xb5g\x80\xb1\x8dmlc\x1b\xdb\xd8\xc66\xb6\xb1\x8dmlc\x1b\xdb\xd8\xc66\xb6\xb1\x8dmlc\x1b\xdb\xd8\xd6\x19\x11]\xd0\xffKc\x97n\xde\x99\x22Ru\xec9}'\xf1\x05c\xbbpA`f:\x8f\xffO\xe7\x0a\xd4\xb8\x02\xce3\x06\x00d\xfb\xf6\xed;\xf3<\x9f\x1a\x053!\xe9\xc9\x18\xd3:q\xe2\xc4\xf3\x95j\x91q\x00^\xa1\xf3\xf7\xec\xd93\xb3g\xcf\x9eO\xec\xda\xb5\xebc\xd1\xd9\x22\x02\xe7\xdc@\x95(\xa5 \x228~\xfc\xf87\x1fx\xe0\x81_\xdb\xbbw\xef\xb3\xd3\xd3\xd3X^^^wS3\xf6\xeb\xa6L\xddy\xe7\x9dt\xdbm\xb7\xfd\xf6\xed\xb7\xdf\xfe\xb1\xc9\xc9I\xb4Z-\xe9v\xbb\xc8\xb2\x0cy\x9e\x97\xc1\xd0Z\x83\x99Q\xab\xd5\xe8\xc6\x1bo|\x073\xff\xe3\xde\xbd{\x7fnyy\xf9L\xb5\x8fD\xd3c\xdfn\xca\xe4\x8e;\xeeHw\xee\xdc\xf9\xd9\xdd\xbbw\xcf...\xca\xf2\xf22VVVhuu\x95Z\xad\x16u:\x9d\xf2\xea\xf5z\xc8\xf3\x9c\xe6\xe6\xe62\x22\x9a>q\xe2\xc4\xe3\x87\x0f\x1f~\x0a\x80[\x17\xd9\xb1o7g\xc7\x8f\x1f7\x222\x9b\xe79z\xbd\x9et\xbb\xdd\xe8h\x14EQV\x81s\x0ey\x9eSQ\x14\xd2\xedv\x95\xd6:!\xa2\xeb\x00\xcc\x8c,\xad\xb1k7gI\x92\x08\x11\x89s\x0eEQP\xc4}\x22\x1a\xb8\x94R\xf1\x22\xa5\x14\x00\xa8n\xb7;\x0d`b\x94\xbf\xc7=`\x93V\x14\xc5\xc8!+\xfe\x14\x11dY\x06\x22\x82s\x0eY\x96AD(4d\xb3\x91\xaf\xc7\x01\xd8\xa4\xe5y^r\xfaj\xc3]]]E\xab\xd5*\xffn\xad\x85\xb5\xb6\x84&\x119\xebD<\x0e\xc0\xcb0\xad5\x88\x08G\x8f\x1eE\xb3\xd9D\xa3\xd1@\x92$PJ\x81\x88\xa0\xb5\x861\x06\xc6\x18\x8cb>\x97^\x0f\xb8\x80\xd3\x0e\x11!\xcb2<\xf1\xc4\x138y\xf2$\x98\x19\xc6\x98\x01\xe7+\xa5\xca \xc4\x99\xe0\xd2\xae\x00)\xd3\x8d\xce\xf9\xff\x02\xa4\xc3\xad\x9f_\x89\x08\x9dN\x07O?\xfd4\xd6\xd6\xd6\x90\xa6i\xe9\xf0\xe1+\xfe{l\xce\x97v\x00R\x02:\x028\xc8y\x05\xcbAb\x10\x94R\xe8v\xbbx\xfe\xf9\xe7\xd1\xeb\xf5\xc0\xcce\xc6G\xf6S\x0d\xc6\xb8\x02\xaa\xd6)\x1dp#,v\x0c\x00o\xfc\xb3\x03 P\xe8a\x11\x82o\xc3A\x90*B\xc7\x09\x008\xe7\xd0n\xb7\xd1n\xb7\xcb\xac6\xc6\x0c\x04 :\xbez\x05*z\x09\x06\x80JH!\xbc\xc1\xd6\x1b\xb7_\xfb\x97\xd7\xdcz\xdd\x07j:A\xcf\xe5\x10qp\x22($\xd0KE0\xca\xa0\xe72:x\xe0\xe0\xf7\xe4\x0f\x9fz7:\xee\xd80\xfe\xc7lVJ\x95\x19>\x0a~\xaa\xc1\xb94\x03\xe0\x9d\xaf p[\xf7\x5c\xff\xf1_x\xff{?xM\xed\xf2\xe2\xa5\xf6\xb2[\xcd\xda\xe8\xe6\x1d\xea\xe4\x19\xbay\x17\x05\x04Zkak\xb1mb\x96\xdet\xc3M?\xfe\x05\xfd\xa5\x7f\xcf~\xef\xc0\x1b\x00\xac\x0d\x07\xa1\x9a\xfd\xd5\xac\x1f\x0e@\x0c\xd0\xa5\x19\x80~+\xd5\x8d\xd7m\xfd\xd5kj\x97\xe1\xd0\xe2\x0btzm\x91[y\x07\xdd\xac\x8bN\xdeC\xaf\xc8 \x04(M\xe0$\xc1Ro\x057\xef\xba\xbew\xeb\xad\xb7\x5c\xf1\xd0u\x07~\x9e\x0f\xe2\x0b\xd9\x90\x94\x1c\xb1?fx\xcc\xf2QU\x10\xe7\x86K\xb9\x07L\x18\xa1\xc9V\xdeE+\xebP\xb7\xe8\xa1\x93\xf7\xd0\xcd\xfd\xcf\xdc\xe5>\x00\xa4A\x92\xa3\x8b\x0c\xcd^K7ju\x87)\xbd;C1\x0b`\xb1\x8ci\x18\xac\x86\xb3~\x14\xfcl\x06\x82.\x859@\x04@!\x05\xc49\x14\xcew\x5c\x89\x99I\x04m4\x98\x0d\x8c6`e\xa0\xb4\x02\x884z\x98\x22`\x0a\xd4\xa7\xafU\x08\x8a\xcdw\x98\x05U\x83p)CP\xbf\x0d\x0b\x91\x80<\xb5\x0f\xffJa\xa2u\x85C\xb7\xe8\xa1#=\xa4T\xc0\x8aEQ\xba[t\xd5G\xd5\x9dpU|\xabR\xce\xb8\x0f\xa8\x06\xe0\x92\xa7\xa1R\xd9\xcc*\x00\xa4\x14\x9ak\xab8\xf1\xd2)\xacH\x0b\xca\x1a4\x1a\x13\x98\xd6S\xa8\xb9\x06\x0a\x14\x01\x1bF\xc3\x87R\x0a\xce\xb9\x01\x08\x1a\x96 \xaa\x10u\xc9\x07\x80B\xf6\xb22\xe8\x16\x19\x0e<}\x10\x0b\xc7O\xa1H\x01\x9aM\x910#\xb1\x8c\xc4ZXf$\x86\xa1H!\x8ca\xeb\x9c\x1fae\x14\x05\xad\x06\x80\x99\x07\x14\xd3\x8b=\x00\x9bQtdt\x13\x10\xb0\xd6x\xa9\xb3\x82}\x0f?\x84\xd6\xd2*\xc0\x1aH\x0d\x0c\x1b0\xb3\xbf\x8c\x81e\x036\x0c\xad\xd4\xba\xdbUa\xa7\x1a\x80\x98\xed\xc3\xce\x8fM\xf8\xffC\x05lx\xaa`\x04\xa9\x10\x8c\xa0\x8d\xcb\x9d&\xf6\x1ex\x08\xadV\x1bP\x0a0\x04\xd8A\xe7\xb1a\xb0N\xc0\xfd\x0a\xd8P\x90\x1b\xd6|\xe2\xcf*\xff?W\x03\xbeX\x02\xa0p\xcf\xecn\xe2\xc6N\x08i\x82@$\xd0\x92JCu$N\xa8y\x14\x9f_~\x12\x80@\x13Px\x0ff.\xc7\xbe#\xdf\xc7R\xb7\xd5\xef\xc2\x96\xa0\xa2\xe3\xd9\xf8\xec7\x06\xd6\xe8~\x05\x8c\xc8\xdc*\xb5\xac2 \xa5T\xd9|\xab\x95p\xf1\x89q1\xd7\xafI\x09\xcfud\xe6\x8fo\xfa\xcd\x1f\xdb}\xc3\xef\xa4\xda\xcew\xf3\x0c\xb9\x14($\xac\x03\x15A\x91\x82\xd1\x1a\x89\xb5XX]<\xf9h\xb2\xef^|\xee\xc4'ps]\xf0\xb0\x1fb\x17[\xcb\xd0\xab)\x8c\xd6\xc8\x05\x80\xf6\xd9\xafXC\x1b\xf6\x99\xcf\x0cf\x1b\xaa L\xb0\xb4\x1e\x82\x86\xa1h\x98z\xc6+\xe2\xff\xc5W\x01Q\xbfy\xae#\xf6};\xde\xfe\xb6\x9f\xfe\xe9O\xbf\xf157\xc8\xa9\xd5Ei\xf6V\xd1\xc9\xbb\xc8\x5c\xe1\x03e\xfc\x83\xa7\xd6b\xb2>\x81\xcb\xa7\xb7o\xadm\x99\xfc\xfd\x07\x1f\xbd\xef\x10\xf6\xad\xfd\xc3@\x19U\xb3\xd0\x10\xc0\x1aZ\x07\x87i\x03\x1b\x03a|/\xd8\x08>6\xd8\xff\x0ep\xff\x18\x84\x8b3\x00\x95V*3\xf6\xfdWo\xdb\x89\xc5\xd6\x8a;\xb5\xba\xa0\x9a\xbd5\xea\xe4=\x14\xe2 J\xa0\x8c\x86a\x83\xd4%\xe8\xa9\x02\x13\xb5\x06\xdev\xe3m\xea\xc1\x9b\x1ex\x1f\xf6\x9d\xfc2\x80\xd5~\xf7&\x7f_%\x00+\x10\xab>\xfc\xb0\x81\x19\x0e\xc0\x06= :\xbb\x1a\x80*\xe4T\x7fn\xe6p\xee\x8f\xf4$,\xce\xcd\x14\x10\xb4\xb3.\xb5\x8b.u\xf3\x0c\xdd\xbc\x87\xac\xe8!s9z\xae@!\x052r(\xa8@.\x05)\xa3\x148\x99\x07p\xe5\xba\xe7\x13\xafz\xc2jh\xf6\xc13\x81\xb103,\xb3\xaf\x04e}\x006Q\x01\xb1\x89\x8f\xc2\xff\xcd\x9c\xcd\xfd\xd1\xac\x80\x92\xf3P\xe1\x5c\x01'\x0ep\x80@@\x04H\xc0}\x0f\x1f\x0c\xd6\x1eN\x94\xd6P\x9a\x80L,\xfc9\x9cA/\x92\x04\xf6C\xde\xf1Z\x97Yo\xc3\xc5\xc6\x80IC\x0f\xc7\xae\x22C\x8fZ?\x0e\xf7\x80\x08A\x17\xb7\x1cM \x09\xc1\x10\x00\xe2\x04F{\xad\xa6\xedzh\xf5\xbaP\xa2P3u\xe8\x82\x91S\x81DY\x80H\x85g\xeb\xd3W\x0a:\x04\x13\xc8Fg\xf1\xe0\x0c`\x0c,3\x18\x5c\x95\x7f\xd6e~U\x03\x8a\xbaPu\xfa\x8d\xdb\xb2\x8b\xb7\x07T\x9f;\xeciE\x1c\x12k\xb1\xd4i\xe2\xf0\x99c\xe8H\x0f\xb5z\x1d\xd3\x93\x930\xb0p\x1a \x1d)\x9f\x1b\x1c\xca\xa4\x02?\x89\x82\xd2\xcaW\x0eG\xea\xc9H\x22\xfc\x18\x06\xc3@\x93Z7\xfam\x86\xf9\x0c/b.\xee\x9d\xb0\x88\xd7q\xe0\xcb\xfd\xe0\xd1\xe7\xf0\xcc\xe9C\xd0\x8d\x043S\xd3H\xd8\x9f\xc1\xb1lK\xf8\xd0J\x03\xae\x9c\x12\xa8?C\x0b\x94\x22@i\x18\xed'`c\x0c\x0c\xf7\x9b\xaf\xe5~\x00h\x83&<\xbc\x07\x1en\xc0\xd5\xe3(\x11\xba^\xbdIx\xb3\xf3\xeb\xc6\xf9\x0f\x02!w\x05\xbe\xf3\xe4\xa38v\xec\x08h\xdb\x04\x92$\x85\x8eY\x17\xb0;1\x0c\xab\xfd\xf8_\xc9\xdc\x12~H\x08\xa4\x144\x14\xd8\x18\x18\xa3=\xde\x1b\x86\xe5\x0a\x0dU\x06\x06\x06\x0a\x83\x15P\xed\x01\xc3\x0dx\x98\xfd\xc4\x06\x5c\x85\xacW'\x00\x91\xd3oN\xc7Ywf\x81\xc4\xeb\xf8\x0f\x1d\xda\x8fc\xa7^\x04&j \xd6\xbe\x81\x06\x0ai+\x19l\x0c\xc3\xc0\xac\xffm\xe2\xdb\xb1\xd6\x1aB\xf0Y\xaf+\x03\x98aXc\xc1\xc6\xc2*\xd3\x87\xa0\x11=`\xa3\xd5c\xf5\xaa\xce\x10\xaf^\x13V!\xf7\xdczm\xe6lM\x17\xd2\xff\xbf\x0e\x84\xef\x1f\x7f\x1a\x87\x97N\x00\x89\x01\x98\x02\xfb\xe1A\xe80AJ\xd0\x0cS\xe8\xf5\xbfM<\xfch\xad\x00E\xa1Qz\xcc\xae\xb2\x1fk\x0c\x98|\x10i\x83\x9c\x19u\xf8jX\x88\x8bru\xb5r~\xf8\x01p \xdcu9\xe9\xa7\x16o\x90^q\x05\xe2Gud\xb0?\x92\x08\xa0U\xa7x\xfd\xe4^|\xf9L\xafZ-\xce9\x1co\x9e\xf6\x19e\x14\x10\x87'\xa3\xfb\x8c\xc50\x12N\x90\x18\x9f\xd5\xba\xa0u\x12\x02\x88\xa0\xc8C\x05\x94\x94\xd5\x12\x83g\x0d\xc3\xb2\xf5U\x01_\x01j\x83\x11i\xd4\xf4[e@\xc6\x98\x01\xa7\xbf:j\xa8\xd1T\x7f\xcb\xdc\xd4\x96\xb7^\xf5\xc9\xed\xbf\xfc\xd6\x8f\xb0\xb1\xc8$\xf7|\x1e\x80R\x1aZ\x07\x19\x81-\xa0\x08O=\xfb\xf4\xb1\x17\xba\x8f~\x08_]y T\x02H\x91hR\xfe/L\xd0&\xe2\xb7\x19\xcc\xfeX\x15\xa4\x03v\xd3\xba\xd2\xd2\x91\xbdh\x04\xec\xef\xcb\xd0\xb1\x0a\xac\xf6\xd9o\xa0\xd7\x1d\xa2\xab\xee\x827\xca\xfe\xf8\xf7Q\xd0\xf5\xc3\x0c\x00!/$}\xdb\xe5\xbf~\xc7\xbb\xee\xf8\xc8\x15\x8d\xedn\xa1\xbd\x8cf\xaf%\x99\xcb\x88\x94\xdf\xc1\xda$A-M1Qo\xc8\xb6\xa992?\xf9\xb3\x97\x7f\xba\xfe\xb9\x7fz\xee\xab\xdf\xf8)8\x1c\x08\xd8\xedY\xa8R \xada4CkS\x06\xc1\x94\xce\xb3\x81\xbf\x9b\xd1[\x01B\xa0\x9e\x06bP\xee\x00\xca\xd7\x9a\xc0\xa2\x88\xc1\x12\x9a\xf0\x06\x93p5\x001\x80\xa3\xd8\xcfp\xf3\xfeaJ\x11\x02\x00z2\xb9gg}\x1b\x8e\xad\x9c\xc2\xd1\xe5\xe3\xea\x85\xe5\x13\xfa\xd8\xcaiu|\xf5\x8c:\xb9vF\x9d\x5c[P'[\x0b\xeaT\xfb%}\xbcuZM\xd7\xa6\xb2w\xbe\xf9g&\xf0vz\x0f\x00[\xe9\x0aPD0\xaa/\x1f\xf0\x00|\xd8\xb2\x912\x19\x98\x91\xfc=T\x9d\xf1\x14t\x90\xfd\x04\xec\x0f\xf0cJ\x08\xa2\x0d\xf7\x00\xa3`g\xa3\x00\x9ck'\xf0\x03\xd3\x82\x880\xd5\x93\x1c\xed\xac\x8bN\x9e\xa1\x97g\xc8]\xe1/\x08\x1c\x09D\xc1/G\x14\xa4+\xb9Jm\xaaa\xecU\x00\xe6C(\x85\x04PZC\xb3\x0a\xb8\xdd\xdfb\xd9\x0a\x84x\xfa\xc8P2\x82\x05\xc17`\xd6C\x1b0\xed+\xc0\xb0\x05+\xe3\x03\x08\x03[\xa9\x00\xd9\xc0\xf9\xa3\xae\x08?\xe7\xf3i\xfa\x1fX\x13\x96p\xec\xcf\x89\x908\xaf\xe1(\xed\x1f\xc0\x1a\x86\x89\xe7f4\x00\xad\xc9\x90\x22E$\xc8\xa4\x01`*\xa4\x87(\x22\x18\xad\xa0%\xac\xfa\x22^\xb3\xc7\xec\xc8\xdf-1\x18\xda\x8f\xceCeO\xf0\xc7\x0e\xb51PF\x95\xa2[\x1c\xe0\xacaX\xc5`\x89M\xb8\xdf\x03\xe2(\x13\x07\xaaQA\xa8\x9e\x8ap\xce\x0d\x04\xe0UcA\x8a\x14Qd\xa1\x04\x18\xc3\xe8J\x0f+\x9d\x16\x5c\x0eXg1\xcdS\x80h4\xa8\x08GF\x08\x00)\xc4Oo\x0a\x08J\xfb\xcd\x95D\xe8\xd0\x81\x82z\xf8\xb1\x81\xcf\x1b2`\xb0/\x99\xf5=\xd8\xc3\x8f1 \xa3\xcbJ\xb2\x11\x8a\xb4\x87/\x16\x9f\xfd\x0c\x1dD\xa8\xd1R\xb4sn\xc0\xf1\xb1\x0fT\x9bnu\x10{\xd5\xb4 \x01`\x94\x86\x00x\xee\xd4a\x9c\xee.#\xa9'\x98\x9e\x9a\xc6\x96\x89\x04\x96-\x12\xb6H\x82\x00\xa6dh\x0bE\x80&\x82\x0e\xd9\x1b\x07'[Q/\xcbJ\xf0\xe3\x13\x0a\xd1#p\xd6\xf7\x10\xd6\x1a\xaa2=W\x970F\xb8\xc4\x7f\x1e\xc1\x82\xa2s\xa3\xa3G\xb1\x9f\x97\xf3\xd5\x10?P\x082J\xa3\xd9Y\xc3\xff<\xf6 \xd6\xa4\x83\xc6\xec4\xac\xb5\xa8%\x09RN\xbc\xf3\xad\x85U\xde\x81\x8a\xf4\x10|\x08(\xd0U&/\x1f\x98\x12\xf7m\x1f~\x94\x81\x86\x86\x81AA\xf9HIDk\xdf\xc0U\xc9\xfb\xfb\xec\xc9F\xc7\x87*\xd0\xa8\x88iC\xa4*:\xbaz\xf2\xe1lG\x10\xcf\xbf\x02^\xa9~3p\x12a\x05\xff\xf1\xe4\xb7\xb0\xdaY\x83\x99\xa9\x87\xb2\xf7\xbb\xd7\x98\xfd\xd6XX\x15\xf2\x97\xd6\x0fQ\x1es5\x8c3\x95\x8d\x15\xf7\xe1\xc3\xf8\xea\xb1\xf0\xf8\xedJ\x15\xba\xfaf\x94\xd7\xfe\x1dC\x97\x0bx;\x04?\xfe\x1e6L\x01r\x96)\x18\x00\x98y\xa0\x1fl\xd6\xe1\xe7\x0e@\xd0M\xceC@\x18\x19\xb6^\x9e\xe1[G\xbe\x8b\x95\xac\x03\xd4\x03\x7f\xb7\x5c:>\xb5\xec\x7f\xb2\x0d\x0d\x94\xa1I\xafs\x9e&\x05\xa3\x0cX\xb9J\xf3\x0c\x0d\x94\xab\x0e\xd4`\x18\xe4X\xbfLW\x10h\xed\x9b\xac\xaeH\xcf6\xf4\x12#\x9e\xff[\xeaO\xc1\x1b\xb91\x9et\x1b%?\x0f7\xe0\xcd+6\x03O\x0c\xe0\x96\xf9\xf3\xad\x02\xc1\x87\xb7\x0e\xfcC+kc\xb9\xdd\x845\x06\xcahp8\xee\xd1\x0f\x82\x87 \xd66d\x9f\x81\x11\xb5.\xaeJ)\x98\xb8>\x8c\x02\x9c\xae\x88i\xca\x04\xf6\x12\xee1\x12\xbbUP?\xf5`\xe5\xc4\xe1\x0b\xfeP\xae\x87\x225r\x96\x8bMu#\xf1\xcd9\xb7\xa9s@\x1bW@\xcc\xe1\x02\xc0\xc3\xa7\x80w\xdbw\xe1\xba\xcb~C+3+a \xf2c)\x95\xab\x12\xed\xa0zj\xed\x04\xfe\xf3\xd8_\xe3o\xcf|\x05\xf7l!\xdc\xb7 \xf1\x14\x82\xa2\xb0\xb4F\x9f\xb7[\x8eG\x00\x03\x0ci\x0b\xeb|\xf9k\xd2\xeb\xb2W+\x05!\x03\x06\xfa\xb8\x1d\xb2\x98\xd9;\xd08\x13X\x90\xf6\xf7\x18\x91<\xac}\x8be\xae\xf4\x0e\xc3\xb0\xe2q\xdf\xf7\x00\x1d\xda\xefh)\xae\xba\x0b\xa8J\xd1U\xed\xff\xe5CP\x94\x8e\xb7\x11\xe6?|\xf3{oy\xf7m_|\xfd\xd6\xd7R\xcfe\xe8\xb9\x0c\xda(X\xb6H\xd3\x14\xb5\xb4\x8e\xa9F\x033\xb5i\xa8\x0e\xe1\xb3\xfb\xee\xbbk\xdf\x9f|\xf1\xa3\xb8o\xe1\xb3\x03\xe3p\xa0\x7fB\x00[\xff\xf01\xf3S\xb6H\x8c\x0d\xd8\xdd\xc7\xdeu\x05\xa94@\x04G4\xb0\xbfe\xc3HT`.\xd4g/>SF9\xcex\x8c7< =\x18x\x08\xb3\xe4\xdf\x83\x0a\x99(\x1b,\xe3\x87O\xc0E\xf1-\xce\x08/O4\xaex\x8d\xdf\xb4\xdd\xce_\xb7\xebO\xdfq\xd5\x9b)\xcf\xf3|qm\xc9-\xb7W\xdcr{\xd5\xadtW]\xb3\xd7r\xad\xa2\xedZ\xd2u-\xe9\xcalm\xa6\xf8\x8b\xb7\xffQ~\xcd\x87\xf7\xfc\x01\x80\xab+\x0a\xb0\xe7\xcd\xa6\xaf\x99$\x01\xf7\x13\x8e[,\x1f\x00\x1b\xf8\xb7\x1e\x86\xa0\xc86\xca\x05\x0a\x97g7\x99\x19Fq\xc8^\x86\x15\x06K\xe0\xef\xb2^\x0d\xb5\xe5\xfb\xe8K\x11\xacb\xe63\xach\xb0\x98R\xb0=[\x05T\xf1?:\xfd|3\x7f\xa3\x1e \xee\xe0\xd2e6\xe5\xab\x9a\x9d59\xd3^\xd4K\xddU\xb5\x92\xad\xa9\xd5\xbc\xadZ\xae\xa7z\x92\xa9\x0c\xb9\xca\xa8P\x059z\xa9hj#\x86\xde\xf2\x9a\x9bS\x5c\x8d\x9f\xa0\xa0\xe3\x10\xa1<\xb5\xc6\xa5`\xd6_!&l\x91(\x0b+\x16\x09E\x1aJ\xeb\xe9\xa3R\xe1\xe0Tl\xba\xb6T.#{\xf1\x19l\xa0\xc9x\x84\x1c\xd6c\x88\xfa\xc3\x97f_y\x86}\xd3\x0d\xd3\xaf\x7f\xbd\x0a\xdb#\x1aI\xab\xab\xc3\xd8\xf0\xd9\x9f\x97\x1b\x003B\xc77\x22@&9eE\x8e\xdc\x15\xe1\xd4\xb0\xf5\x9f\x95E\x0e\x83\x1e\x12\xca\x90\xc1\x9fPs\xe4\x84\x88\x0c\x04\xbb\x82\x8cp\x06 \xd1J\x83\xb5\x81\xb0*\x99KR\xb9,1\xd8E\x0a\xa9\xfb\x1f\xca\x8d\xfew\xfe\xfc\xa62\x0a\xd0.\xbc\x8f\xbe\x8e\xc3\xe2\xe1\xc7\xc2\xc0BA\x87\x0fa\x8c\x1c\xa0T\x80\x99\xca\xeb\x8dp\xd9|\xab\xf0s\xb6\xf3@\xc3\x83\xd8+\xfd^>\xb3~\x1b\xe5\x8f\xbe\xbap\xe3ZZC\xb3\xb7\x86\x17\x97\xce\x80\x12\x8d\x19\x9a\xc6\x8e\xfa<\xea4\x11\x1eVAC\x13\x04\x84\x02)\x80$\xaeau\xd0~\xc8(\xcf~\xac\x9fzSN`M\x02\x0bFB\x8cD\xfc\x14\xbb^C\xf3\xc3\x9c1\x06J\xbb>w\xaf\xb2\x1f2\xe5 u\xb6\xdd'\x1bF\x0e\xd7WB\xa9\xdf|-\x99\xf0\xfbi\xc3\xcfrGG\xc7\x1e\x10\xe7\x80\x97\x9b\xf9g\x19\xc4\x88\x04\x02M\x0a\xdd<\xc3\xfe\x13O`\xa1\xbb\x8c\x99\x99\x19\x5cV\xdf\x8e\x9aM\xfb\x93,Y\xa4\xc2H\xfc\xe4H\xd5\xfd\xaf\x10\xc4k\xf7\x0c\xb0\x0e\xce\xb7\xb0\x9cx&D\x066\xd0\xcf\x04\x1c\x1c\xe7\xd6\xcf\x01\xca\x1f!\x81\x11/\x1d\x07\x01\xce7M]\xd2H?<m<\x8d\x1a\xad\xbd\xd3u\x80\xaf\xd8\xbc\xc97\xe7\x8d\x86\xafQGRb \xaa\xdc\xff\xc2A\x90\xf8\x16\xf4\xfc\xd21|\xe3\xe0^\xb4\x8a6\xe6\xe6\xb6\xa0Q\xab#\xb1i\x80\x8f$\xe07#\xf1<\x02\xc3\x9d\x8f@\xe5\xb1?\xb0Fb|\xf6\x97A \x0bv\xbe\x0f\xb0\xe8\xd1\xc4\x8fP.`\xb4\x91\xbe\x04\x1d\x86*\x13\x03Hf\x03\xf5\xa6\xdf\x03\xaca8\xf2\xf7`\xd5_\xbex\xf8\xd1\xe5\xeb\xe5,\xd2J\xb5\x07\x0c\x8bo\x17\xac\x02\x04\x84\x93\xabg\xb0t\xa4\x85\xac\xc8PKk\xb0axJ-#\xb1\x89\xe7\xf1\x08\x0d\x146>:\x0d\x9f\xc5\x89\xcb\x0fe\x03\xff\x8f\xfa\x8f\xf6\xac\xc5\x92\xcf~}\x96\xaf\xae3Z\xc1\xb2Aa\xc4\xef}9\xb2\x17]\x19\x9e\xf4\x86K\xf4\xe8$\xd6\x06\x05\x89\xefE\xcaxu\x15\xfd\xfe3t\x1e`\xe3J\xda\xe4\x87\xef^~\x00\x88\xd0\xee\xb5a%\x05[\x86\xb6\xa6\x1c\x9e\x12N\x90\x9a\x04\xa9\xf6\xf0\x93\x10#q\x1c\xbe\xd7b=\xbd2Z{\xf7T\x9d\xcf1\xeb}\x13N\x06\xd0\x7f\xf8cA\x9e\xbf\xb3fh\xed\xfc\xd4\xac\xb8\x9c\x1d84Os\x8e\x00\x00\xdeqL\x80\xd5\xd6\xc3\x8e\xeb\xd3P}\x1e\xdf]\x18\x19\xd0\x05[\x9f\x8fR\x15\xaa\x1d\x9f\x8d\x87\x8c\x84\x13$6A\x9ax\xfe\x9e\x84\xecg\x98\x91y\xe3\x0f\xd0\x1a$\xca\xc20#\xb5\x83\xec\xc7\x8aAB\x95=ne\x1a\x1c\x1e\xc4\xd80\x84\xa5\xd4\x82\x0c\xe2\xe6\xaa?<\x9d\xed\x8bP\x88|\x13\x16\x82\xdf\x9c\x89_\xe0'0H\xc2\xeb\xa5\xfc\xddr\xce\x1eP\x0d\xc0\x85l\xc2R\xbe\xdb\x0a\xcdb\xe6\xf2k\xb8\xd2(\x1f\x10\xc3:FJ1{\xcb\xf6'\xfd\x9c\x0b\x82\x95\xb80\xfe\x879@\xdb\x00?\x8c\xd4o\x01F\xf4\xa0\xfe_\x8c\xd6\x1e\xbf\xb5\x94\xd2suz\xf6\xea\x8f*\xa7\xd7\xe1S/AQ\x12\xa35D\xa1\xaf\xfdP\xdc\x01\xab\xc0~\xdc\xf09\x88\x81\x81\xb8\xfa\xb1\xa4\xe1#'g\x0b\xc2\xe67b\xd2w\x80\x17\xafL\xa9\xd7\xd8\x98\xc16\x09\xf2A\x82\x84\x0cR\xb2P\xa2\xbc\xcf\xfa\xbfIb\x13N\x98!\x10a\xb6T6`eK\xecM$\xee^\x052\xe2\xcd\x92x\xec\xb6\x86Qp8\xcfC\xec\xf1\x9b4\xach\x98J\x00)\x1e\xa3\xc0\xe0{QDd\x0d\x03\xa4|\xcf\x08\xca\xa7\x0d\xf4W %\x84\xf9Z\x90\xf2\x8b\xb7\xab\x01\x1d\xe5\xe8M:_\xaa\x09q.\x1a*J)4\x92\x1a2\xca\x85\xd3\x94\x1ai\x0du[C\xdd\xa6\xa8\x99\x045\xb1H$AB\xfe\x18\xb7\x12\x12Mf\xe0\x17\x90\x22\xa9\xdb\xd4\x93\xbd\x84QOj\xa8q\x82\x94,RI\x90R\x82\x04\x16\x1a\xcag\x9f@\x0c\x0d-\xd4I(1\x09j\x9cJ\xc1\x82\x9aI\x90\x88\x97/\x12D\x19[\x95\xbc\x17\x220\xd0\xc3))P$5\x93@K\xe1\x93G\x85{P\xb5\xffP\xf8<\xb1\x02\x09\x89Q\x06\x95\xa8\xa0V\xab\x09\x11\xc9\xf9@O\x08b\x15Wec)\x22b\xc8\x15\xb5c\xbdv{a\xae6%\xdb&\xe6\xb0\xa51%\xb3\xe9\x14f\xd2\x09L\xda\x06&\xd1@\xcdY4\xc4\xc28\x05.\x94\xa4*\xc1cG\x9f\xcc\xf0\x02\x16cP\x8bv\xe7\xa0r\x0a\xf3\x13[d:\x99\xc4\xa4\x9d\xc0\x84\xae\xa3\xeeR\xa4\x8eQw\x0c\xe3\x14\xc4\x09\xa4\x10\xcc\xd1\x94<~\xea\xa0\xc3\xb3\xc5\x19\x8ao\xb4\x97?\xb2\xb8\xb4\x88\xed\x8d9L\x99\xba4\x90J\xddY\xa4b\x918\x03\xeb\x8c\xff\xe0\x86\x13\xb8\xc2a\x96\xa6\xe5\xd9\xe6\x11\xc1S\xc7\x17\x08\xe8\x81`\x014\x9bK\x8bG\xd1\x06fdB\xea\x92H\xea\x18\xa9c\x18\xe7OR\x8b\x13\xc0\x09P\x08\xa8\x00\xa6\xa8\x8eG_<\xe0p\x08\x0b\xd1Oi\x9af\xcdf\xf3P\xab\xd5\x82s\xee\x9cWQ\x14BDr\xe6\xcc\x99\xec\xc8\x91#\x8b\x1b5\x17=,\xbf\xe3:\x9b\xe7ND\xcf\xd7\xdfy\xed\x8e+i\xdb\xe4\x16\xccO\xcda~r+\xb6\xd9Y\xcc\xb9Y\xccb\x12\xb32\x89\x86$P\xb9\xc6\xa7\xbe\xffW\xf4\x95?\xfb\xfc~z&\xff\x86\x10\x8e\x00X\xc9\xb6\xa9\x17Z[\xe5\xee\xdd;_k\xe6\xa7\xb7\xc8l}\x0asn\x1a32\x85i\x99\xc0\x944P\x17\x0b#\x1a\xa9K\xe4\x9f\x8f}]\x7f\xea3\x9f|\x01\xff\xd6\xfc\x17\x00\xcf\x02x\xc9\x15r`\xe1\xb2\xde/]\xbb\xf3\xea\x99\x9d\x13;0%\x0dL\xc2\xbfvJjhH\x0a\x16\x0d-\x9aj\xce\xca\xfe\xe6A\xf5[\x7f\xf7\xbb\xab\xad\xbfy\xf1K\xe4\xf0\x04\x08g\x00d\xf9<-\xac\xce\xb9\xf7\xdc4\x7f\x83\x9aQ\x13\x98\x90:\xa6\xa4\x8e\xba$0\xa2\xa0EC\x8b\x82\x11\x0d[\xb0\xdc\xfb\xec\x17\xd4\xdf\xff\xf9g\x9e\xc2#\x9d\xfb\x01\x1c\x22\xd0\xf2c\x8f?V\xec\xda\xb5\xab=99y\xd7\xfc\xfc<\xc5!,~[\xee\xa8\x00<\xf3\xcc3\xea\xde{\xef}\xea\xc1\x07\x1f\xfc\x1a\x80\xe7\x00,\x8d\xdad\x8d\xdai\x19|h\xc7\xc7\xb6^\xbb\xf3\xbd\x93\x93\x93;5\xc0lX\xb1\xf6\xba\xbbQ\x1a\x864\xb4\x90\x1c{\xf1x\xfb\xd9o~\xfb \xfdw\xf6u\x01\xf6\x03\xf8\x1eR\xd5D\xc7\x09\xee\x9a\xbas\xf6\xd6k>\xbac\xfb\xfck\x8d\xa8\x9aVZ\x19\xd2\xd0\xa4\xa0I\xfb\xf2'`ea\xb9\xfb\xdd\x87\xfe\xf7E|i\xe9\xeb\x00\xbe\x03`?\x08\xa7!px\xa3\xbe\xa1v\xfb\xeb>~\xed\x95W\xdd\x9a\x18\x9e QZ\x13\x91\xa6\xa8\xdc\xfb\xf7\xde]\xed\xe6\x8f<\xfe\xdd\xc5\xfc\x8bG\xbe\x89e|\x0b\x84G 8\x8cI\xed\xd0,\x04\xbf8\xf3\xc1\xd7\xdcr\xc3\xaf\x5c\xb6m\xfe\x0a%\x94\xf8\xef\xb6%\x90x\xf4\x0a\xa7 \xe4\xf4\xa9\xd3\xdd'\xff\xeb\xdb\x87\xf0\xaf\xad\xaf\xc1?\xcf~\x00/E\xbf\xdc}\xf7\xdd\xf7\xdct\xd3M\x1f\x98\x99\x99\xb9JDlD\x91aH:}\xfat{\xdf\xbe}\x87\xef\xbf\xff\xfe\xaf\x01x\x18\xc0\xa3\x95\xfb\x8c\x08\xc0h\xdb\x85]\xb8\x1e\x1dl\x85 )\xc9\x8e\x94s\x8b`\x11]\x02\x9a\x02\x9c\x06\xf0<\x80\x05\x00\x85\x05\xd0\xf3\xf7\x98\xc3\x0e\xecF\x8e\xcb\xe1P\xab\x90}\x05\x81\x03\x81\xb0\x82\x1er\xac\x85\xd7\x1e\x01p\x1c@Vy\x1f5\xcc\xe1z(\x5c\x09\x87\xc9\x81\xca\x8d\x1d\xb4\x83\x1c-\xb4\x08X\x12\xe0E\x00G\x01\xb4\x86\x9eg;\xb6\xe3z\xe4\xd8\x0e\x87Zex\xf0\x1f\xab\x11\x00\xcb\xe8\xc1a5\xbc\x97\xe7\x01\x9c\x020\xbc\xe9\xdf\xbes\xe7\xce\xdd\xbd^o\xbb\x88\xa4(\xbf\x8eBT\xd4S\x16\x17\x17\xbb\xce\xb9U/L\xe2\xf0\x06\xf79\xc7\xf4\xe2\x1f4\x09\x17\x0f\xbd\xa6\x8ai\x19\x80N\xb8\xfcL\xd6P\xc0\x9a\x8b}&\xa9\x5c\xd8\xe0>yx}\x1b\x18=\xd7\x01\xa8\x85c\x8bj\xc4=(\xec\xf3\xba\xe1\x1e\xf9\xba\xa9\xce?\x0f\x87\xfb\x9c\xdf\xf3\x00\x98\x9c\x9cD\xb3\xd9D\xc5/i\xe5>\xa3v\xe3yx/\x9d\x11\xcft\x0e\xd7\xbf\xf2#\xba\x17\xea\xa8\xef\x8f\xcc{y\xa5C\xd7\xd8\xc66\xb6\xb1\x8dmlc\x1b\xdb\xd8\xc66\xb6\xb1\x8dmlc\x1b\xdb\xd8.m\xfb?\xd2\xfbA\xe2>c8w\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x16g\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c.\x0a\xf74\xfe\x00\x00\x00\x15\xf4IDATx\xda\xed]k\x8c]\xd7U\xfe\xd6\xda\x8fs\xee\x9d\xf7\xc4\xf6\xa4\xb6\x9b8I\xa3\xd4I\x83I\x1b\xfa\x00R\x12\x1a5\x0d\x22D\x94V\x22!\xb4\xb4\x12P\xaa\x22\x01\x7f\x90*\x85\x8a\xf2\x87\x02\x15R\xa1\x09\x12\x08\x90(\x82\x22U-R\xdaT)\x05\xa4&M\xda\xa6I\x9b\xc6y\xb8~\xc4v\xec\xb1\x9d\x19\x8fg\xee\xf8\xbe\xce9{\xf1\xe3\xec}\xbd\xe7\xcc\xbd\x9e;N\x9a6\xf8\xae\xe8h\x1e\xbe\xe7\xcc=k\xad\xfd\xado}k\xdf\x13`d#\x1b\xd9\xc8F6\xb2\x91\x8dld#\x1b\xd9\xc8F6\xb2\x91\x8dld#\x1b\xd9\xc8F6\xb2uFD\xaf\xe8ki\xe4\xd2\xe1\x9d)\x22\xb1c7\xf4\x9d\x84\x13F\xf6\xca\x05\xc1\x18C\x9bx=m\x14\xa8\xd1\x0a\xd8d\x0c\x00\xc8\xdc\xdc\xdc\x8e<\xcf'\xfb\xc1\x8cOz\xd2Z7O\x9c8\xf1B\xb4Zd\x14\x80\x97\xe9\xfc\x9bo\xbey\xfa\xe6\x9bo\xfe\xe4\xce\x9d;?\x16\x9c-\x22p\xce\xadY%\xcc\x0c\x11\xc1\xfc\xfc\xfc\xd7\x1fz\xe8\xa1\xdf}\xe4\x91G\x0eLMMayyy\xddE\xf5\xc8\xafC\x19\xdfq\xc7\x1d\xf4\xf6\xb7\xbf\xfd\x8fn\xbd\xf5\xd6\x8fMLL\xa0\xd9lJ\xa7\xd3A\x96e\xc8\xf3\xbc\x17\x0c\xa5\x14\x8c1\xa8\xd5jt\xfd\xf5\xd7\xbf\xcb\x18\xf3\xaf\x8f<\xf2\xc8/////\xc4u$\x98\x1a\xf9v(\x93\xdbn\xbb-\xdd\xb1c\xc7\xfd\xbbw\xef\x9eYZZ\x92\xe5\xe5e\xac\xac\xac\xd0\xea\xea*5\x9bMj\xb7\xdb\xbd\xa3\xdb\xed\x22\xcfs\x9a\x9d\x9d\xcd\x88h\xea\xc4\x89\x13{\x0f\x1f>\xbc\x0f\x80[\x17\xd9\x91o\x87\xb3\xf9\xf9y-\x223y\x9e\xa3\xdb\xedJ\xa7\xd3\x09\x8eFQ\x14\xbdU\xe0\x9cC\x9e\xe7T\x14\x85t:\x1dVJ%Dt\x0d\x80\xe9\xbeKk\xe4\xda\xe1,I\x12!\x22q\xce\xa1(\x0a\x0a\xb8ODk\x0ef\x0e\x0713\x00p\xa7\xd3\x99\x020\xde\xcf\xdf\xa3\x1a0\xa4\x15E\xd1\xb7\xc9\x0a_E\x04Y\x96\x81\x88\xe0\x9cC\x96e\x10\x11\xf2\x05Y\x0f\xf2\xf5(\x00CZ\x9e\xe7=N\x1f\x17\xdc\xd5\xd5U4\x9b\xcd\xde\xcf\xd6ZXk{\xd0$\x22\xe7\xed\x88G\x01\xb8\x00SJ\x81\x88p\xf4\xe8Q4\x1a\x0d\x8c\x8d\x8d!I\x1203\x88\x08J)h\xad\xa1\xb5F?\xe6s\xd1\xd5\x80\xcd\xe87\xc3\x5c+\xcb2<\xf3\xcc38y\xf2$\x8c1\xd0Z\xafq>3\xf7\x82\x10z\x82\x8bz\x05\x04\x070\xf3\xb0\x91\x10\xe7\xdc\xba\xec%\x22\xb4\xdbm\xfc\xf0\x87?\xc4\xd9\xb3g\x91\xa6i\xcf\xe1\xd5#\xfc>\x14\xe7\x8b:\x00\xb5Z\x0d\xadV\x0b\xce\xb9\xa1\xc51f&\xe7\x9c\x84 03:\x9d\x0e^x\xe1\x05t\xbb]\x18cz\x19\x1f\xd8O\x1c\x8c\xd1\x0a\x88\xac\xd5j\x85o\xafO\xd3\xf4\xd2*u\x8c\x98\x0ew\xbb\xdd\xa5\xa2(\xbe\xed\x9c\x934M\xa9\xddn\x0b\x008\xe7\xd0j\xb5\xd0j\xb5z\xe7i\xad\xd7\x04 8>><\x15\xbd\xf8\x02\x102\x97\x88\xe8\xc6\x1bo\xac\xdfr\xcb-\x9f\xbd\xe1\x86\x1b>\xa0\xb5\x86s\xaew\xc4\x12\xb3R\x0a\x22B\xfb\xf6\xed{\xea\x13\x9f\xf8\xc4\xed\xedv\xfbx\xbfk\xfa\x15\xd2\xcb\xf0~\xf0\x13\x07\xe7\xa2\x0c\x80w>\x8b\x88\xbb\xe9\xa6\x9b>~\xd7]w}\xb0^\xaf\x17\xab\xab\xab\xcek8\x94eY\xe0\xebPJI\x92$\x98\x9c\x9c\xa4\xab\xaf\xbe\xfa\xa7\x98\xf9\xbf\xef\xbd\xf7\xde\xb7\x008[\x0dB\x9c\xfdq\xd6W\x03\x10\x02tQ\x06\xc0\x07\xc1\x01PW_}\xf5o\xd7\xebu,,,P\xa3\xd10\xedv\x1by\x9e#\xcf\xf3\x9e\x92\x198|\x96e\xd8\xb5kWw\xcf\x9e=\x97]w\xddu\xbf\xb2w\xef\xde\x7fGEJ\x0e\xab%dx\xc8\xf2~\xab &\x01\x17+\x0d\x1d\x17\x91\x09\xaf\xe1\xf4\xf4\x9b\xd0(\xc5P\x14\xbe\xcf\xb2L%IB\xe3\xe3\xe3\xbb\x01\xcc \x92\xedCcU\xcd\xfa~\xf03\x0c\x04]\x0c\x01\xe8\x15\xd1pT\xe9i\xb5pz\xc7\xa9,\xcb&\x01LR\xe4\xc5\x18\x82B\xf1\xad\xb2\xa08\x08\x173\x04\x85)\x14\x01\xa0 \x1fT\x0bi\xf8}\x9e\xe7 \xa2\xaa\xe6\xa3b\x1f\xc5\x05;\x16\xdfb\xca\x19\xe6\x01q\x00.z\x1aZ\xa5\x9b\xa1\xa1ZYY\xe9es\xadV\x83R\xaa\xb7B\xce\xe78f\x86sn\x0d\x04U%\x88\x18\xa2.\xfa\x00\x84\xecUJ\xa1(\x0a\x1c;v\x0c\x8b\x8b\x8b\xf0\xacgM\xc6\x061\xcd;\x8e\xfa9?\xc0J?\x0a\x1a\x07\xc0\x18\xb3\xa1\x14\xa2_c\x902\x14\xde\x0fr~\xbb\xdd\xc6s\xcf=\x87F\xa3\x01c\x0c\x92$Y\x93\xa9\xc1y\xc6\x98\xbe\x99\x1b\xc3N\x1c\x80p\x8d\xaa\xf3C\x11\xfe\xff\xb0\x02\x06\xee*\xe8C*\xa4\x1fml\xb7\xdb\xd8\xbf\x7f?:\x9dN\xdfB\x19;?\x14\xd8A\x99[\xed|\xe3\xaf1\xff\xdf\xa8\x00\xbfV\x02\xc07\xdc\x83\xdd5C;D\xa0\x08\x04\x88\xaf\xad\xbd\xb0\x10@\xce\xb5I\x8e>\xf1Ox\x0e\x80\xb0\x02\x9c\xaf\xa7y\x9e\xe3\xd0\xa1C\xc8\xb2\xacw\xd1X\xc5\x8c3\xd8\x18\x13C\xd0@):\xac\x808\x18\xe1\x9a\xf1Jx\xed\x89q\xde\xa9\x97\x5c\x09Z<\x08\xf9\xb5?\x9d\xfe\x837\xed\xbe\xee\x8f\x8dJ\xb7ey\x07Nr\x88\x14%\xbda\x02\x13C+\x0dk\x13,\xad.\x9eL\x93\xef\xdd\xf7\xcd\xbf\xc3'\xe7~\x1a2\xff\xdd\xf2\x92\xcdf\x13\xab\xab\xabk\xa0#@DpT\xec\xfcA\x22Z<\x05\x1bD=\xe3\x954\x8c\xfd\xe4\x05\xa0LnZ<\x08y\xf3\xfb\xed-\xbf\xf8\x0b\xef\xfc\xf45\xaf\xbfQ\xce\xac\x9e\x92f\xb7\x81,o\xa3p\x19@\x00\xeb2#S\x9bb\xac>\x81-S\xdb\xb7\xcc\x5cR\xbb\xf7\xc0\xf7\x1e=4\xff\x18\xfe\xa5\x0a\x19\xa1\x1e\xc48\x1f\xaf\x00cL\xef\x18\x04\x1f\x03\xe6\xbf\xeb\x82\x19\xba\xe0\xd7&\x04\xf9\xc4\xabO\xcbon\xdfz\x05\x1a\xcd%\xb7\xb4z\x8a\x9b\xdd\x06ey\x1b\x85\x14`\x16(\xcd0F#s)\x1cwQ\xaf\x8d\xe3\xad\xd7\xbf\x93\xaf\xdc\xf3\xe8\xfbO>\x86/\x02X\xed\xc7b\xaa<=\xce\xfe\x10\x80\xf3\xc8\xd4\xeb\x14\xd0\x18r\xe2\xaf\xc3\x0c\x82~\xa2;aq2-(\xd0\xcdZ\xd4-Z\x94\xe5\x1ddy\x07E\x91!w\x19\x0a\xd7\x85H\x01G\x19\x84\x0a8\xc9Ii\xe6\x9a\xc16\x00\x97W\xef\xcf9\xb7\x06~\x82\xf3\xaa\xd9\x7f>\x09\xa1_\x13\x167_q0\x86\xd9\x9b\xfb\x93\xb9\x02|\x1d \xa0\x10\xe7\xe0\xc4A\x5c\xb94\xca\x9b\x17(\xa5a\xb5\x86R\x1aZ\x19\xef\x08\x86R\x8c,\x83E\xb9\x0f\x87\xab\xce\x8b\xe1'\x96\x1e\x82\xf3\xad\xb5\xeb\xa4\x8a\xf8\xfbj\xe3\xd5\x8f\x86\xc6\x10\xf4\xda\x96\xa3\x09\x04\x12\x88\x00\x0e\x02\xe7\x04\xac4\xb4bd\xae\x85\xd5n\x13F\x18\xa2k0\x85\x82P\x0ep\x02\x10\xd8\xdf[\x8f'\x05\x07V;\xd5\xe0\xb8\xd0\x80\xc5\x01\x88\xeb@\xbf\xfd?\xb1.\x14_3L\xcb^\xbb5\xe0\xdcB \x91\x92n\x8a\x08\x12\x9b\xa0\xd1>\x83\x17\x17\x0e#\x936\xc6\xea5LML!\x85\x06)\x07V\x04>w\xe3\xd2\x0f\xbf\x03\xc5\x8c\x0bg\x8c\xfd1\xfe\xf7cA\x1b1\x9f\xea \xe65=\x13\x16\x01\x88|\xe6*\x85\xfdG\x9f\xc7\xd1\x97\xf6\xa3>\xa6059\x0dk\x12\xef<\x8bD[\x18m\xa0X\x81\x5c\x0f\xc8h\x90\x03\xe3\xac\x0d\x99\x9f$\xc9\x1a\xf9\xa0\x9f\xe3\xaas\xe0j\x01\x8e\xb7\xa3\x84 \xfe\xd8:a\x0a=\xd3\xcb8\x1f \x14.\xc7\xf7\x9f{\x1cG\x8f\x1f\xc7\xf4VB\x92$\xd0Z\xc1h\x0d\xad\x0d\x8c\xb6\xd0:\x81V\x16\xac\x14\x22\x05G\xaa\xce\xaf\xd2\xc7\x90\xf5q\x06\xf7\xc3\xee\xb8\x06T\x0bp\x95\xfd\x84\x02\xdco\xee\xfc\xaa\x06\xa0\xcc`\x90\x0c\xf7)\x11W\x0d\x96\x08\xc1I\x81\xa7\x0f}\x0b\xc7O\x1d\xc7\xd88\xa0\x0d\x95\x85W\x07\xc8(3\xbf<4\x08\x1a\x83\xee7dn\xb5\xf3\x8d)hu\xcba\xb5\x06\x0c\x1a=\xc6G\xb5v\xfcXj\x00sId\xc4\xad\xd7f\x06*h\x04\x82\xc4?:\x1c\x9c\xff\x01N\x9d9\x8c$\x01\xd8\x00Z\x05\xbc\xd5\x91\xe3\xcb he\xe1\x0a=\xf0\xaf\xc5\xec\xa5_\xf3\x15\xeaC?\xfc\xafB\xd0\xa0\xe6+\xfc[\x90\xb57\xa2\xa2?\xb2\x008\x07z\xcb\x9d\xa0\x17\xf7\xa9k\xb3\xae\x5c\x16\x12+v\x8e\xf8,W\x0a\xed\xedo*\x1ey\xea\x8b\xe8\xc6\xb8\xed\x9c\xc3\xe9\xc6<\x88\x19\xac\x01m\x00\xa5u\xcf\xe9\xdag\xbf5\x09\x8cN\xa0\x95AV\xa8\xbe+\xa0\x9frYm\xbe\x86\xe9^\xfbu\xbf1\x03\xd2Z\xaf\xdb\xcc\xf5\xaa\xd7\x00\xa5AW\xbd\xad>y\xdd\xcf^\xf2\xe7\xb7\xff\xc6\xdcG\x8c6($\x83\x13WVFfh\xff\x86\xadI\xc1\x0c\xec;\xb0\xefx\xd6y\xf1C\xcf~\x05\x0f\x11\x81D\x00b\x12\x22\x05\x02A\x19x\xdc/\xa1fM\xf6+\x0f?\xa4A`\x08\x0dV0c\xfc\x0eN\x0f\x058.\x9eU\xc7\xc5\xb3\xe0A\xd9\x1f~>\xdf0\xe8\xd5\x08\x00\x159\xe4\xdaw\xa6\xbf\xf7K\xef\xb9\xed#[\xc6.s+\xadE\xb4\xba\x0d\xc9]F\xcc\x04\xad\x15\x92\xc4\x22Mk\x18\xaf\x8f\xcb\xec\xe4V\xba\xfd\xe7\xf4\xf6\xb4\xfe\xe9\x7f{\xf6+\x07\x7f^\x1c\x9e\xf5K\x84\x00\x013A\xab\x12\xfb\xcb\x1b\xf6A0\xda\xc3O\xc9\x84\x18f\xe0T\xa0\xdf\xd0$\xcc\x04b\xfd'lI\x0c\xc1\xeaWG\xe2\x00V;\xe0A\xc5\xfb\xd5\x94\x22\x04\x00\xea\x13\xea\x9e\xd9\xfa\x0e,\xac\x1c\xc7\xa9\xe5\xa3|j\xf9E\xb5\xb8r\x9cO\xaf\xce\xf3\xd2\xd9\x93\xbct\xf6$/7O\xf2r\xeb\x94:\xdd\x9c\xe7\xf1\xdaTv\xd3[\xdf=\xfe\xfa[\xf0^\x006\xaeaL\x0c\xc5\x1a\xda\xa8\x1e\xf6km\xa0\xbd\xf3\xb5)\x7ff2`\xd2CCPP>\x03\x0cm\xe4\xb8~\xd4s\x10\xfd\xec\xd7\xcc\xbd\xaaZ\x10\x11M\xe6\xd2E'k\xa1\x9b\xb7\x91\xe7]\x14.\x87s9\x049@\x0e\xc4\x02b@1$\x97\x0e\xa76UFc\x17\x80m>\x94\x02!(\xc5\xd0F\x9d\xc3\x7f\xe3\xf1\xdbx\xfc\xd6\x16\x9aM\xc9\x80\x84\xd7q\xae~\xfc?.\xbc!\x10\xfd\xa4\xe7A\xce\xefw\x04\xf8\xd9\xccn\xec\x1fY\x11.\x1b\x90\x02\x22\x8e\x9c+\xf1\x93\x95W\x1e\xb5\x85R\x1a\xac\x14X\x11H\x81\x884\x81X\x5c\x861\x00\x93\x00 \x0c\x01q\x09=\xa2\xa0=\xfc\xe8P\x80\x95\x85\xf5\x0c\x88\xc9\x02\xf04R6.\x9e\xfd\xd8O\xf5\xe3\xa6\xeb\xefG\xfa\x06!\xde\x15\x11 lX\x08\xd2?\xba\x15\xc0T\x12I\x07\x22\xc0h\x8dL:h\xb4Wp6wH\x9d\x853SH\x04(h\x0c\x02\x07)\xdf8#|zS@\xc4(E6\x09M\x97\x89(\xa8\x85Ve\x00\x884\x18\x06D\xb2\x0e\x82\xe2\x1d\x0b\xc1\xf9\xb1\xf6\x13w\xbf\xe7\xdd\xc5\xe6\x83\xe7\x9c[7\xc8\x89\x1b\xb8h_\xea\x8fW\x8c\x13\x08\x14k\x00\x82\xa3\xa7\x0e\xa2\xd1y\x09\xb5z\x82\xe9\xc9)\xd4\xc6/\x815\x16\xd6$HL\x02\x81\x01W\xe1\x83\x00E\x0a\xcc\x0a*0 \x0f9\xd6\x1f\xc6X(e\xc1\xb0\x1e\x82\x8a\xf3\xd2\xc78\xf3\x03\xfe\x0f+\x1d\x07\xe1-\x14\xe3\x0b\x91\x9f_\xbd\x00\x88@\xb3F\xab\xdd\xc0w\x9e~\x18]9\x8b\x99\x991O\xf9jHL\xea\xb5\x9c\x04\x8a\xbd\x03\x89A\x95{ E\xd0J\xc1\xd19\xe6\xa3\x03\xee\x87\x06\x8c-\xc8\xef\xa1b*\x066OU\xed'\xde\x82\x12f\x05\x1b918:\xde\xf9\xb0\xd1\xfc`s\x01\x18v\xff\xc1\x10B\xcej{\x19\xdfz\xee\x7f\xd0l\xafb|\xfa\x9cnc}\x01ML\x02\xab-4\x07\xfcV\xeb8\xbcb\x86\xd2\x1a\xda\xc5\xdc\xff\x5c\xf7ktI?\x09\xe1\xab\x1b\xe8\xb8\xa2(\xd6a\xff\xb0\xba}\x1c\xc80\xd4\x8f\xeb\xc1\xb0\x0e\xdf\x98\x05\x89\xff\xed\xe6\xae\xb3\xee\xd5y\xde\xc5\xde#\xdfD'[\x81\xad\x97j\xa6\xb5\x81\xb9$\xb0\xb6\x5c\x01\xc6\xa4\x00Y(\x18(Rk.$\x00\x98TIAu\xa9\xfbhm=t\x95\xf0\xa3\x95\x05\xc8\x80`\xc00`\xa8\xbe,\xa8_\xf7\x1b\x02\xb0\x91b\xd9\x0f\xca\xfa\xc9\xcf\x17\x02A\xeb\x02@\x0a\xb8\xe2\x86M\xaf\x02y\xeb\x87\xd7\xfe\xa2\x9d5\xb1\xdaZ\xf6P\xc1\xbd\x02\x1a\x82\x90\x98\x04\xc6\x94\xf2\x01I\x99\xc1$z\xcd\x9f%\x7f\xc3\xdax\xe8\x09\xf4QYhe\xbc\xfc\x1c\xce7`Xp\xbfE]>ff\x9d\xf2\x19k?\x1b\xf1\xf5PT\x07\x89o\x01\xc2.\xbc\x06x\xe8\x91\x028\xf4]\xe0\xca\xdb\xf1\x9e]\xd7\xe0\xf7\x15\xab\x19\x82P\xf9\xef\x84\xc0\xf2\x88 p\x8a\xbb\xdc=\xf1\xf4\xff\xe2\xef\xbf\xfd\x8f\xf8\xf2\x8d\xf7\x80\x1e\xff\x9c\xdf\xa9C\xec\x1b(\x06!\xe6\xed\x16\xd6&\xbd,V*\x01\xbbP\x03\xd6g\xafb\x05!\x01#(\x9f\xa1\xf3M\xbczi@NG,H\xadK\x9e\xb0\x13\x22\x0eD\xbf\xec\xdf\x08>\xe2Y@e'\xf5\x9a ]X\x00\xfcv\x90\xdaV\xe0=\x1f\xde\xf6\xbe[n\xbf\xe1\xf3\xbb\xb6\xbc\x89r\xd7E\xd7ua\xb4Bb,\x924E\x9a\xd6016\x89\xf1\xda4\x8a6\xe3?\x1f\xbb\xff\xce\xcf\xfe\xd9c\x1f}\xfcs\xb8?f@D\xa5~#$\xb0\xd6\xdf\xb8g=\xc6\xa4\xb0:\x81\x82\x05\xc1@\xc1\x82\xa1\xd6-<\xc5\xa5\xb8V\x90[\xaf~r\x02\x82.;`\x18(\x180h]\x1d\x09\x90\x11\x02\x107_\xc3\xd2\xc5\xaa\x1c\x1d\xaf\x80\xb8Gxy\x10$\xc0\x1b~\xc6\xd8+\xae\xd9\xf6\x177\xecz\x17ey\x9e/\x9f]rg[\xcb\xe5\xd1Yq\xcdn\xc3eE\xd3e\xd2t\x994%\xad\xcd\x14\xbfs\xcb\xdf\xe4\xbf\xfa\xe1+\xff\x04\xc0\x15\xbd7,\x02b.\xe9c/\xeb\x92\x92\xf9\x98r\x05hm\xcb\xe2)\x16\x0a\x16\x10\xb5\x86\x05\x89\x00\x14k?:\xd2\xff\x8d\x81b\x0d\x0e\xf0#\x16$\x06\x22\xeb\x1b\xb1\x00\x1d1\xef\x0f\xf03\x8c\xf3\x07\xd5\x92X\xfb\xbf\xd0\xcf\x22WC&\xf3\xcf\xbb\xd7%\xa9\xddu\xb6\xdd\x90\x95\xd6\x82:\xdb9\xc3\xedl\x85\xdb\xf9*w]\x93\x9dt\xd9!c\xa1\x8c\x85\x0a:[\x9cVN4]\xf3\xfa\xb7\xa5\xf6\x0a\xbc\x03 \x0b\x00B\xe5\xae\xb50<\xb1\xa1x\xfa\x11\xa25\x09\x14' \xb1`Jz4\xd4\xd1\xda\x89\x98b\xe5g\x00\xe5yFy\x08R\xb6\x84\x1f)a\x88\xc9\x96E\x9c\xa8/\x81\xe8\xc7~B\xe6\x0eS<\xe3\x89X\xac\x01\x0d\x1a\xe0\x5cp\x1f \x0e\x1a\x22($\xa3\xbc\xc8\xe0\x5c\x0e\xabK\xfcff\x14\xe8 \x87FA\x09\x0ad\xd0\x04\x089!\x22\xcd\x82\x9d^FX @\x14+\x18e\xc0FJ\xe7y\xc7[_\x80\x15Y\x90\x0b\xc5\xd3\x04\xf93\x1a*x\x1dH3D\xa1\xc7\x84\x8c1\xbd\xe2\x0d*\xcf\xd7\xb0\xbe\x81v}\x99K\xa0\x8aU\xedg\xd8\x15\x10\xef\x80\x88\x1b\xb1\x97\xfb\x5c>\x8d\xca4\x8a\xfc\x8e\x1cWn\xc4A\x92\xd6\xd0\xee6p\xfa\xcc1\x98\x840C\xd30\xf5K!T\x87\x83\xf3\xab]\x91\x13\x10\x0a\xa4\x00\x92\xf0\x96u\xd0H4\x95\xec\xc7z\xeeoRXm\x01\x94\xd9\xaf\xa4\xc4rZ;\xaf);a\xf68\xab\xb8\xa7\xfb\x18m\xc1lJ\xf8\xf1\x01 \x18\x10\x06?#\xafZ\x03B\xd35l\xe6\xc6\x1fg\x0a\x1d\xf5 \xc9\xfa\xe5\xad\x80r'\x0e\x98\x14:y\x07\x07O<\x89\xd5\xce\x22\xa6\xa7\xa71W\x7f\x1d\x12[C\x9a\xd4`M\x0aE\x09\x94\xa4\xd0H\xc0D\xb4\xc6\x03$\xc2A<3>\xf3L\xe2W\x81\x87\x1d)\xd9\x8fBR\x16\xcf\x8a\xfb\xc4\x17a\xa54\xa0\xd1\x83\x1e\xa3\xad\x17\xdf,\x98\xca\xe2\xab\xa0\x06r\xe7\xe0x\x22ZW|7\xa1\xee\xf6\xe0'\x9e/\x07\xf1\xed\x15\x83 \xbf#\x0d'\xce\xbc\x80\xc7\x9f\xff\x1a\xbaE\x13\xb3\xb3\xb3\x18\xab\x8d!\xb1I\x8f\xbf\xf7\xf0\x1b\x09\xa8\x1c\x84T\x92\xb7\x1c\xa0Xc\xc0\x06\xb0zm\x01f\x0f?\x8a\x13(1\x90j\xf6\x87\x1a\xa0J\x0d\x88\xb4\x82\xf5C\xf8\x00?,\x1a\x04\x0bE\x89\x97\x22\xe8\xbc\x1aN\xbc/t\xb3\x0e\xab\xd6\x80\xcdB\xd8&\xb4 \xc1\xe9\xd5\x93x\xf6\xc8\x19\x14E\x86zZ;\xb7\xf7\xc6\xa6\xb06Ab=}\x942{\x09\x1c\xe2\x16\xad\x800@70\x96\xd7\xe0\xbfV\xa1\xf8\x86\xf3\xd5\xc0\xe1\x84R\xba\x9cv\xe9\x02F'\x9e\xfd\x94\xcc\x878\xd0Ws\xde\xd6=\x86\x8c\xf0X\x99\x0bi\x9c\xaa\x1f\xd0~%\x9e\xcb\xba.\x00L\x82n\xb7\x05'\x16\xd6\x1ah\xeb\xf9\xbf\xcf\xfeD\xa7\xb0*-\xb1\x9b\x12\xb0K\xfcN@W\xd1&\xca}\xfb\x06\x1a\xd6(\x18\xcf\xff\x03\xfba1\xbd\x00\x00j\xcdG\x1a\xab\x1aN\xd8\xfbi\x94\x81\xe6\x18\xf3\x8d\xef#\xf4\x86\xdaI\xac\xdd\xbc\x1c\xd6\x12\x18\xd0+e\xba\x9f\x14DDPD\xd1\x04\xca\xf6\x94K\x9b\xa4P\xdaB$\x01#\x81\xf2\xece}\xba\x08\xb4\xd2p\x9c\xc0\x1a]\xae\x1e\x1f\x00\x22\xbfz\xa8<\x9f\xce\xa3\x032\x97\x10\xa4\x8c@\xf7z\x87r\xffOY?,\xb8O\x02\xf4\xe3\xefA\xbd\xbc\x90\xcc\xadn\xc6\xbaP\xf1\xed|\x01\x90\x80\xbb\x00\xc0anj\x0c\x12k\x91X\x0bkR$\xc6;\xceYhJ\xa1z\xdd+\xad\xdb\xe2\xa3\xb5\x06\xc4\x94\xd7\xd0\xe7\xc43\xf6\xf0\xc3HC\xfd8w\xe2Z\xdf\x88Va\x82\xe6\x22\xe9\xd9\xae\xd1~\x02{\x12\xff_t\x8d\xe0\x1d\x09=\xc0&y\xbbT\x1d]\xddt\xb5Q1\x1f~\x22&\xe7\xbaO\xf4\xb6q\xdb\x1ek\xb16Eb\xcb\xfd7\x14\xe8#\xa5\x800H\x04rnC\x95\x84\x00\x18\x93\x80!b\x8d!\xdb\x83\x1f\xebUK[\xd2Ob\x0f=}\x1a\x22!/\xbaY\xb0)\xa0\xfd\xe4\x0bR\xca\x0fJ\xca\xd5 1\x93\x965\x89 \xdei\x14\x06/1s\x19\xd6\xf9\xe7\xd3\x8a\x86t\xbe\x0cR\x8du\x1f\x19_\x98\x19\xf5d\x0cB\x99$\xa9\xa14\x1dCj\xebHm\x1d\x89\xae\x81\xa5\x06\x96\xc4\xb3\x0f\x82\x13\x16&\xb5\xe6\x0f\x10\x93\xa4\xb6\x0e\x07MI\xa2\x91$u$\xa6\x06E)HR0\xa5\x11\xfe;8!a\xd2\xd5\x89\x18\x19\x9d 55!S\xc0\xea\xf2\xef\x96\x99_6r\xa1\x00\x93\x94\xc9\xa3\xa0\x85h-\x9bef1\xc6\x0c\xad\xd9\x84\xa7\x9e\x87G\x14\x10\x11j\xb5\x9a\x10\x91l\x06z\xfcu\xe2\xd2&\x83\xa5\x08\xff\x92\x99\xcb\xe4x\xab\xd5]\x1c\xab\xcd\xca\xcc\xf8VL\x8d]\x22\x13\xe9\x0c\xc6\xd2i\xd4\xec\x04\x18\x13P\xae\x06-c \xa7!\x85\x91\x1a\xa78x\xf4\xe9\xac\xfd\x22\x96BP\x9b\xad\xe2yq\x8c\xa9\xf1mRO\xa6P\xb7\x13\xb0j\x1c\xec\xeaP.\x85ru\xb0\xd3 '(\x0a\xc1\x04\xcd\xca\x91S{\xdd\xfc\x01,\xc0+BY\x17O\x9c9\xb3\x84\xe9\xb19\xd4\xf4\xa4h\x8c\x09\xb9:XR(\x97\x80\x9c-\xa1\xdf\x09\x8a\xc2\xa1N3\xb2\xd08 \x87\xf6a\x11\xa0.\x08\x16@cii\xe9\xa8\x7f\xb2\xa1\x88\x88\xc4\xcf\x8d\xa8\x1eEQ\x80\x88p\xf2\xe4Iw\xe0\xc0\x81\xc5\xe0\xa74M\xb3F\xa3q\xa8\xd9l\xe2|\xe7G\xd7\x11\x22\x92\x85\x85\x85\xec\xc8\x91#K\x83\x9a\x14U\xa5.s\xd7 w.\x97\xa9m\xea\xdd;/\xbd\x8af&\xb6bvr\x1bf'\xb6a\xcan\x85u\xb3\xb0\x98A\x22302\x06\x953\xbe\xf4\x83O\xd1\xfd\x7f\xfd\xe5'\x97\xf6\xd3\xd7@r\x04\xc0J}k\xf6bmK\xf3\xee\xabv\xec\xd6\x97Lm\x93\x89\xfa\x0cR7\x0b#\xd3Hd\x0a\x89L\xc2H\x1d$\x1a\xd6\xa5\xf2\x9d\xe3\xff\xa1\xfe\xeao?\xf5\xe2\xa1\xff\xc2\x97\x00\x1c\x00pZ\x0a\xf7\xacy\xdd\xe2\xaf_\xb1\xe3\xaa\xe9-\xe3;`d\x12\x1a\x13\xb02\xe9\x8f1(1 Qd\x5cM\x8e5\x9e\xe4\xbf\xfc\xe7?\x5c\xfd\xc6?4\xbf\x00G\xcf\x80\xb0\x00 \x9b\x9b\x9b[\x9c\x9e\x9e~\xef\xdc\xdc\x1c\x07\x08\x8a\x9f\x8eR9d\xdf\xbe}\xfc\x99\xcf|f\xdf\x13O<\xf1\x00\x80C\x00\x96\xf7\xee\xdd[\xec\xdc\xb9\xb3511q\xe7\xb6m\xdbh\xa3\xeb\x14E!\xfb\xf7\xef\xe7\xfb\xee\xbbo\xdf\xa3\x8f>\xfa \x80\x83\x00\xce\x0c\x9ed\xad\xa5 \xfa\x1d\x1f\xc2\xc7.\xbbj\xcb\xfb&&&v0\x94\xd1\xda\xb0R~\xf7\x01k(\xd2 Qr\xec\xd8\xf1\xd6\xc3_?\xf0\xfc\xd1o\xd0W\x01y\x12\xc0S:E#oC\xae\xbd\x13w\x5c\xfb\xe6\x99\x8f\xce\xcd]\xfa\x06\x16]#VL\xa4\xcbA;\xa9\x92\xff\x13pzq\xa5\xf3\xedo}\xff\xd8\x0f\xbe\x80\xaf\x02x\x1c\xc0\x93DxI\x04\xee\xd2\x1bq\xed[n\xad}\xfc\x8a\xcb\xafz\xb3\xd6\xc98\x84\x14\x93\x22\x22\x05\x06CP\xce(\x9a\xab\x9d\xfc\xa9\xbdO,=\xfa\xf9\xfc\xeb\xf92\xbe\x09\xc2\x13\x10\x1c\x9e\x98\x98p\x8dFC\xee\xba\xeb\xae\x0f\xee\xd9\xb3\xe7\xb7fff.s\xce%D\xc4}\xb6!\xca\xc2\xc2B\xe7\xe1\x87\x1f>\xf4\xe0\x83\x0f>\x08\xe0I\x7f\x9c\x0e~\xb9\xfb\xee\xbb\xef\xd9\xb3g\xcf\x07\xa6\xa7\xa7w\x89\x88\x0d(R\x85\xa4\x97^z\xa9\xf5\xd8c\x8f\x1d~\xe0\x81\x07\x1e\x04\xf0]\x00\xdf\x8b\xae3x\x94X\xb1\x9dc;\xf1\xc6\xbc\x8d-\x22HD\xc2\x83K\xcbz\xe7\x04\xe2\x96\xd0\x01\xa8\x01\xc8K\x00^\x00\xb0\x08\xa0(7\xb7u\x01`\xd6^\x8a\xdd\xc8\xb1]\x1cj\x00\xd8\xf3\x14\x16\x81\x03\x81\x8a\x15t\x91\xe3\xac?\xf7\x08\x80y\x00Y\xf4>j4\x8b7j\xc6\xe5\xe20\x11\xaf\x5c\x912\x06E\x1b9\x9ah\x02t\x06\x90c\x00\x8e\x02hV\xeegn\xfb\xf6\xedo\xcc\xb2l\xce9W\x8b\x1eCC\xfe\xe1N8s\xe6L\xb7(\x8aU\xff^^\x00p\x0a@^\xbd\xce\x8e\x1d;vw\xbb\xdd9\x11IC\xfa\x8aH\xe0\xc3\xb4\xb4\xb4\xd4q\xce\xad\x02X\x00px\xc0u\xce\x1b\x00\xf27\x9a\xf8\xc3T\xa9]\xf4\xda\x0c@\xdb\x1f\x0e\x00\xcc\x18\x90\x9d\xed\xd5\x99$:0\xe0:\xb9?\xbf\xd5\x87\xd4\x87\xcf|\xd5\xfc\xb6E\xees\x0d*\x03\x8f\x8e\xbfF^y\x8f\xe1~\x8c\xbf\xce\xa6\xee\x07\x00&&&\xd0h4\x10\xf9%\x8d\xae\xd3\xaf\x95\xc9\xfd{i\x9f\xb7Q\xc1f\xd7\xc5\xabu\x8d\xa8/y\x99\xdb$_\xa1\xf72\xfa\xff]\x8cld#\x1b\xd9\xc8F6\xb2\x91\x8dld#\x1b\xd9\xc8F6\xb2\x91\x8d\xec\xc2\xed\xff\x00\x16!\xbe\x9e\x14\xeeM\x03\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x1a\x14\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c.)US\x8fr\x00\x00\x19\xa1IDATx\xda\xed|k\xb0dWu\xde\xb7\x1e{\x9f\xd3\xdd\xf75\xaf;#\x8d\x10\x83\x04\x914`K\xc8\xe0\x07vac\x5c`R6\xb8\x5c\xb8\x928<\x02\xa9T\x1c\x17\xa9J\xf2'U\x8e\x1f\xb1\xfd\xc7v\x95\xcb.\x1b\xdb\xd8N\x85T\x8c\xcb\xe0*\x9c\xfc\x08\x16\x0e\x01'\x01\xf4\x8aA\x02\x01\xd2\x08$\xa1\x914#\xcd\xcc\x9d\xfb\xee\xe79{\xe5\xc7\xde\xe7\xf4\xe9\xdb=sgd\x19YL\xef\xa9\xae;RM\x9f\xdbg=\xbe\xf5\xado\xad\xd3\xc0\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xfc\xcc\xcf\xf4\xa1\x17\xf6\xdf\xd2\xdc\xa2WaL\x9b\xb0\xda\xfe\xb6\xb3\xfa\x1d\xf3\xf3\x829\xc1]E\xd0\x12h?G\xcd3\xe0y\xe4\x01\xad\xeaq\x14ail\xbd=f4#(w\xed\xb9\x7f\xfeM\xd0\x1f\xee\xcd\x9f\xb9\x03\x9e\xaf\xf1\xf5M\x87VV~\xf8\xc4\xaf\x1c9\xbe\xfa\x01\x06cd%\xcc\x0c\xc1B\xb2\xae\x01D\x10b\x94\x14p\xfe\xe9\xb3\x9f\xde\xbe\xeb\x1b\xff\x12\xf7\xf4\x1f\xc3\x12\x03[a\xea\xa2:\xb7\xeb\x15\x1d\xc6\xdb\xdbt\xec\x0d\xff\xe0\xdf\xbd\xf5\xado\xf9\xc0\x0d\x0bG\xb19\xd8\xb1\xddQ\x0f\x83r\x80A1Ba\x01\x01\x01$\x04\xa7\x0e\x0bY\x87\xb6\xef\xd8y\xf3]\xfe\xaf\xfet\xfb\x9e/\xfd\x18\xb6\xc2\x85Yy0w\xc0\x95\x9d\x80\x13\x87[\x9d\xe5\xa5\x9f\xbea\xe1\x18\xcen\x9d\xb3\x0b\xbd\x0dt\x87=\xea\x17\x03\x0cC\x81\xd2\x02\x02\x19\xc0\x04U\xb5\x85\xbc\x85W\x1d>1z\xf5m'o\xbd\xf7\x0d_y3\xee.\xff\x02\x86\xd1<\x03\x9e/\xfe\x9c\x19)\xddj\x07\x06\xe5\x10\xddQ\xcf\xba\xa3>\xf7F\x03\xf4\x8b\x01\x8aP\xa2@@`\x03\x05B\x81\x82$\xb0m\x8f\xba\xec\x9c\xcb \xfe\x16\xa0\xb7\x02\xe0\xfctj\xcd\xcf\x95\x1d/f\x06+\xad@\xb0@\x16\x0c\x96\xb0\xdf\x08 \x02\x84\x08,\x04\x16\x01\x11\xa5\xfaj\x8c\x81-\x03X\x98e\xefy\x06\x5c1\x08\x05\x18\x19B\x05\xe3\x14\xad.\x22\x08\xc10*\x0b\x0cF\x03\x84\x02p\xc1A\x1c\xa3DI \x02\x8c\xf4R\xb6\x9e;\xe0JO\x11\x12\xa7'\x98E\x8a/*8\xbf~\x11\xcfm\x9e\xc7\xae\x0d *\xf0\xad\x1c\x0b\xe8\xc0\x95\x1e#+\x10`\x97\xe5\x9as\x07\x5c\xb5\xae`P\x12\x042<\xf4\xc8\xd7\xb0v\xf1<l\xd1A\xdb\x19\x9c88\x11hz\x89\x08\x98\x18\x97\xeb\x87\xf5\x9a\xb1\xdd\x0b$\x0a\x08\x0bv\x8a>\xfe\xef}\x9fE\x7f}\x1b8\xd4\x02\x9c\x809\x1a\x5cD\xeb\x9f*\x0e\xcc\x97\xff\xe5\xd7\x86\x03\xac\xa6\x1c\xb4\xef\xbf\xa3\xf4\xb70\xe98\x83\x81\xc0\xd8\xeco\xe33_\xfd\x1c\xfa\xdb\xbb\xa0v\x06S\x80\x98!\xc2\xd1\xf0\xcc\xe3\x0c`B]\x8b\xafi\x07\xe4\x04\xf4\x0d\x08W\x90\x07Mg\x05X\xe5\x04%Ao\xd4\xc7\xfd\xa7\x1f\xc2\xce\xa0\x0b8\x851\x00I\xc6\xe7q\xf4\xb3Hr\x88\x82\x99\xe7\x0e@\xbf\xb6\xfbw\xc0\xe3\xd8\x04\x19\xe4\xba\xd5\x02\x0c\x8c!\xd6a\xb8\x1f\x01\x86\x9c\x09\xfd`\x00P\x86\x80\x8d\xde\x16\xa8\x97\x83H*a\x0e\xa4\x14\xe1Gc\xf4\x8b(T\x05\xca\x0a\xc7r\x0dg\x00\xd5\x90B\xf8.\xdf\xee\xfc\xc8\xcd\xbfw\xd3\x9d\xb7\xbc\xa7%\x19\x86\xa1\x80Y@0Cier\x04AY1\x0c#:\xf5\xf0\xa9/\xdb/=\xfa6\xf4\xc3\x99\xc9KR\x128\x0dP\x02T@)\x03\x98\x19\xa2\x02\x15\x86\xa6z\xc0\xa2\xd1Yv-\xd6\x80h|\x86!\x1c\xfe\xa1[\x7f\xee'\xde\xfd\xce\xf7\xde\xd4\xba\xbe\xbc\xd8\xdb\x0c;\xa3\x1e\x06E\x9f\xfa\xc5\x08\x83b\x80\x12\x06\x111\xe7=\x8e,\x1c\xa0\xd7\x9f\xbc\xfd;?*\x1f\xff\xcc\xe8\xe7\x1f\xfe.\x00\xbb\x13$\xa8\xea\x01\x14\x80#\x10\xcb\xd8\xf8,P\xd1\xf4\x128a\xf0>r\xe7\xb77\x04\xc5R*\x9dW\x1d\xfe\x177\xb5\xae\xc3\x13\xebO\xd3\xf9\xddu\xd7-\xfa\x18\x8c\x06\xe8\x17C\x0c\xcb\x11\x8c\x00\x16\x82\xcb2l\x0c\xb7p\xc7\x0d\xb7\x0e\xef\xbc\xf3\xb57\xdew\xcb\xc3ow\xa7\xf0\xd1QU\x19hl\x7f\x08\x03B\x10\xa1\xba\x06p\xa2\x9e\xca\x0aI/\xa6y\x0dXP\xa3\xc5n1@w\xd4\xa7A9D\xbf\x18bP\xc4\x9fE(\xa2\x03H@V`\x80\x11\xb6\x87]\xe9\xb4\xda\x01Kr\xdb\x08\xe5\x01\x00\xeb\x13P\xc4\x1c\xa3?\x19^E\xd3\xcfT\x0b\xb4\xd9\x07\xd0e!\xe8Z\xd0\x82\xcc\x00\x94V\xc2B@\x19b\xc55\x00fI\xbfW\x81s\x11:\x1c+X\x18 \x12\x0c\xb1D\xc0R\x02~TM-1\x01\xca`apb=Z\xbft\xfc\xf7\xaa\x08_\xa3\x9d\xf0\xb8\x0c\x1b\x91\x81\x22\xb5\xa7\xb1!E\x04\xa1\x0c\x18\x94C\xf4m\x88\x9cJx\xf3(k\x83\x994mT\x0boL\x80%\xe8\xa9\xb2@\x13\xfc\x08\xc7\x8c\x10\x07M\xf5\xe1\x9a\xef\x84\xad1\x99\xe5\x04!\xdb\xbb;x\xf6\xe29lY\x17\xec\x15\x9d\xce\x02\x96e\x09\xad\xd0A\x892a\xc3d\xe8\x12\x198M\xbc\x84\xb9\xd1\xfdV\x7f\xd7\xd4\x01\xc7\x02,\x22 \xe2y'L\x09n\x1c+\x06\xe5\x08\x0f\x7f\xfd\x14\xd6\xce\x9eC\x99\x03t G\xe6\x1c2\xef\x90y\x0f\xef\x1c2u\x95\x86C{=I`\x103\x08<ax\x95\x98\x05\x15\x0b\x92\xe4\x9co\xa7>\xe0J\xe6\xd76\xbb\x08\x18\x9c\x08.\xf6\xb7p\xef\x17\xeeCwc\x07p\x02\xe4\x0au\x0a\xe7\x5c|\xa9\xc2;\x85S\x07\xe1=\x91\x9bd\x0a\xaed\x07R0\xa7\xa6K\xb8a\xfc\xca!\xc9\x11\xfb\x14a}\x89\xe1\xf9~\xa7\xb2\x9aMB\x07a\xb3\xbf\x8d\xcf?|\x1f\xba\xdd\x1e\xc0\x1c\x1b)\x9f\xf4\x1b\x11\xa8F\xc3;\xc9\xe0\xc6\x190\xfdA\x88\xc0\x09\x82j\xfc\x17I\xb43:\xc1U\xcd\x18s\x84\xa0\xcbd\xc1K\xc1\x01\x8cw\x1d\xb8\x8d\x5c\xe78\x8c\x84`0K\xb4\xa4QP\x03Y0\xda~\x0a\x1f\xde|\x04\x80A\x08(\xa3\x05G\xa1\xc0\xbd\xa7\x1f\xc2\xc6\xa0;\xae\xc2>N\xaeT\x15\xcei\x8c~Ux\x95q\x06LD\xaeE\xe3\x0b\x81\x85!\x16\xd9\x93\x08\x83E#\xf5T\x9dbB\xfc\x92\x83\xa0*\xd6o\xca\x09\x8f\xf7m\xe5\x97o\xff7\xaf\xbe\xed\xe4\xbf\xcf\xc5\xaf\xc6\xed\x83\x12\xa5\x85\xc4\xc7c4\xaa\x082\xef\xb1\xb6\xb3\xfe\xdc\x83\xd9\xbd\xbf\x8f\x0f=\xfb+\xb8\xa3m\xf8Blb\xd7\xbb\x9b\x90\x9d\x1c*\x82\xc2\x00H\x8c~v\x02Q\x17#\xdf98\xe7S\x16$\x11\x8d\xa6S\x80)\xca\x0e\x0c\xa9#\xbe2\xba\xd4?#\x0b\x12R\x10f_\xe7\xef\xaf\x03*\xfd\xe6\xf1\xbe\xf9\x9f:\xf6\xa67\xfe\xe0\x0f\xfe\xe6\xeb^v\xd2\xce\xed\xac\xdb\xf6p\x07\xfdb\x80Q(\xa3\xa34BH\xee=\x16\xdb\x0b\xb8~\xf9\xe8\xe1\xd6\xa1\xc5_\xb8\xe7\xc1\x8f<\x81{w\xffd\xd2p\x8dHT\x02\x5c\xc2j\x8dX\xed+Gh\xac\x05\xb3TLJ\x0e\x10b\x94,\xd0$\xbeI\xa3\x03V\xae\xfa\x81\x98%\xb1\x11\xc3K\xac\x11\xab4\xf8\x15\xff\xeeW\x1c9\x8e\xf5\xeeV8\xb7\xb3\x86s;\x17\xe9\xdc\xce:]\xd8\xdd\xa0\xf3\xdduZ\xebn\xd0\xc5\xfe&]\xeco\xd1Z\x7f\x93\xb6\x86;x\xe3w|/\xe3\xf6\xd5\x9fB\x1c\x827\xaaw2\x04[\xecb\x1d\x8f\xe1\xc7)t\xaf\x03f\xd5\x80\x04A\xa2\x0c%\x81\xa8Bd\xac\xff\xbbT\x88}\x95\x0d\xe4\xea\x1e\xee%\xd9\x09[\x08+%\x0c\xbd\xd1\x80z\xe5\x80\x06\xc5\x08\x83b\x88Q9\xc4(\x14\x18\x86\x12\xa5\x95\x18Q@I%\x0a+\x89\x95\x19.[\x05\xf0\xf2\xa9\xfb\xb3\xa8z\xc2\x0b\xc4\x09\xd4%\xce\x9eX\x90w.f\x02\xfbi\x0d'\x95v\x22\x86P\x92\x1986]\xaa\x0a'\x1a3\xa0\xea\x8cU!\xe0}g@\x7f?\x8bp\xcdy\xa8\x0c\xa1D\xb0\x00\x844\x95\x22\xc0\x12\xeeG\xf8\x88sX\x11M\xb2\x00\x01#\xf3\x00V\xa6\x1c@IF\xf6\x94\x9a%\xa9\xa3\xde\xa7\x97S\x85#\x81\xec\x8dM\x8a\x0c\xa8\x16\xdd\x88j\xdc\xaf!\xa8A?\x95\x19\x0a\x895\xe0%\xdb\x07\x10\xc8\x923\x0c\x80\x05\x83J\xd4jza\x88\xeep\x006FK\xdb\x90\xd2\xa1\xa0\x12\x19{\xa4\xf6S'\xe8+%\x1d\xc2\x11\xc8'\xe7\xd5\xc5\xd7\x8dY\x90sp\x98\x86\x0eKt\x8b9i\xffL\xc9\xe8\xcd\x17\xd7Cya\x05\xbfd3`\xb2\xfb\x8f\xf0m\x01\x99\xf7\xd8\xe8o\xe3\xc9\x0bg\xd0\xb7!Z\xed6\x96\x17\x17\xa1\xf0\x08\x02\x90T3\xd80\xd9\x94Y\x03~\xb2(\xa2\xa988WQO\x87\xac\x82\x1fupP\x08\xf1\x9e\xd6/\x0ec\x84\x19\xa2\x1c\xb3!\x8d\x1d#\xf48\xa8\xbaqWL\x0cA%\xc6\xbdT\x1b1\xb3\xa8\xe3 F\xdb\xa9\xa7\x1e\xc77\xce?\x01\xe9dXYZF\xe6<\xbc\xf7\xf0\xce\xd7\xf0!,@\xa8\xbb\x84\xc6\xa3\x14\x167\x14*\xea\xe8\x12\x03r\xe3\xe2\xeb\xdd\xd8\x01\xb4\xb7\x08\xa7\xab\xc5\x06\xcc\x01\x14\xc6\xbc\xbf1\x09\xd3\xca!$PhL\xe1\x17M\x8c\xfb\xdb\xae\x83P\x8c\xba\x22\x94\xf8\x9bG\x1e\xc4\x993\xa7AG\x16\x90e9D\xb5\xee^\xbdF\xfd\xc6\x8b\x83\x884#\xb7\x86\x1f2\x8a\xdb\x0b`8\x8d\x12\x82\xab\xde\xef\x1a4\x94\x15\x8a\x08\x1f\x13\x19\x90\x96\xb1\x98#\x0d%\xe18x\x91\x86\xd1%\xd1P\x16\x88\xc5,\xe2\xa9L\xfaV:\xa0\xe2\xf4W\xa6\xe3L\xed,\x90E\x1d\xff\xbe'\x1e\xc0\x99s\xcf\x00\x0b-\x90\xab(_\xa4\x8f\xbe\x11\xc1\xaa\x0e\x0a\x9d\xfem\x16\xcb\xb1\x88\xc0\x081\xea\xa5\xd1\x80\xa9\x83W\x0f\xa7\x1e\x9eu\x0cA3\x02\xaa\x9az\xb1`\xdc\xf5\xb2N6d,\x10h\x82 \xbcH5\x80\xd3G\x0e\xd3\xda\xcc\xe5\x8an\xf3\xb9\xaa\x00\xc2Cg\xbf\x8e'7\x9e\x052\x05\x1c\xa5\x94w\x93\xd0\xa1IJ\x10\x07-e\xfa\xb7Y\x84\x1f\x11\x06R\xf1tI\x84k\xb2\x1f\xaf\x0aG\xd1\x89\xb3\xf8;\x81\xa0I\x055\xd9S\x84uLC\x95\x15\x1a\x18R\x0f\xf1_\x0c\x07\x04\x10\xdeq=\xc9\xa3\xeb'mX\xde\x98B\x81\xa2q\xac\x11\xe5\x06\x08\xf7\xcb\xd7,~\x1e\xff\xed\xc2\xb0\x99-!\x04\x9c\xdd>\x1f\xbbRe\xa0j\x9eT\xc6\x8cE\x1d2\x97!\xd3\x18\xd5R\xce(zD\xe0\xc4\xdd\xc1VgK\xe5<\xaf\x0e\xde\xf9\x98\x15\x88\x19\xc03\xe8c\xd4\x82\xe2uL\x08\xa2\x9aXO\xa4\x9d\xa2\xa93\xb6\x88\xffu\x0d\xf8\x96\xcf\x03T\xa8\xfd=\x07\x97\x0e\xbd\xe1\xc4\xaf\x1d\xfd\xa7o\xf8\x19\xa7iQ5i8QCO2\x82\xf3\x00\x13\x1e}\xec\xebg\x9e\x1e<\xf8>\xfc\xe5\xd6\xffL\x99\x00b2!\x8e\xff\xe1b\x07\xea\x1a\xd8_G\x7f\x95\x15$\x09\xbbi*vc\xf1\x8c\xd0\xe1R\xc6\xd4\x0dX\xd5\x07\x88Kf\x93\x99\xf4\x91R\x11V\x11\x980\x5c\xb5\x07$\x89\xd2r\xc5\xff+\x0a\xca/\xcaP\x9eP\x94\x96\xbf\xf1\xfa\x7f\xf5\xd6\x1f}\xeb\xcf\xdc\xd89\x1a\xd6z\x9b\xd8\x1evm\x14FD\x1cUD\x9feh\xe59\x16\xda\x1d;\xb2t\x90\xf4\xfb\xff\xe1\xf5\xbf\xd9\xfe\xd0\x9f=\xfe\x97\x9f\xfa\x01\x04<\x5c\x09\x90\x96&X$\x02\x95H\xf3*'hm<\x9f\xf8\xbb\xce\x9e\x0a\x10\x12\xf5T\x98\xa2\x9e\x01\xd4\xef\xd5\xc4\xa2\xc8\xc1Y*\xc2\xb3\x0cg\xa9\x08\xb3\x00\xc2\x0d\xf5\xb3\xda\x05R(E\xf3K\xdd\x05|\xeb\x87\xf2\x06\x00\xb2\x98\xbd\xebx\xfb\x08\xcel\x9d\xc3S\x9bg\xf9\xe9\xcdg\xe5\xcc\xd6y>\xbbs\x81\x9f\xdb\xbd\xc0\xcf\xed\xae\xf1s\xdd5>\xd7\xbb(g\xbb\xe7y\xb9\xb54z\xcbw\xff\xf0\x02\xdeD?\x09\xc07`\x17L\x14o0\xc9\x07n\x02>|]H\x1d)t\x06\xeb B\xbd\xbd\xa6\xc9\x81c\xf6\x93\xb0?\xc1\x8f\xd6\x10D3!HdR\x01UqPv5\x15\x95\xc6\x1fE\x92\xa3\xf9E\xd0\x82\x88\xb04\xb4\x02\xf11\x9e\x11\x86\xc5(>\xca\x13J\x140\x04\xb2\xb8[\xc9\x0c0l`\x05\xe7>\x17\xa8?\x01`\xb5j?\xc9\x12\xf3p\x9cp{<\xc5\xf2\x0d\x08\x89\xf4\xd1\x81m\x06\x0bB,\xc0N\xf6L\xc0$f\x80:\x0f\xc7\x1a\x1d\x08\x85od\x805\xa5\x08F=\x88\x8fl'\xd1N\x95\xc8\xfb9\xc2\xa0Rt\x00\x83c\x0a\xbf\x18}\x80\xa5\xb5\xbf`F\x16\xa2\x86\xc3)m\xbd\xbazo\x86\x04\x80\x08)11\x91ad\x1d\x00K)<\x8c\x89\x92\xb4\x1b9w\xad\xdb\xb8\x88\xd9\x15\x7f\xf7\xe4\xe0 \xb1u\xde\x93\xf2\x84\xb8v(\xaa`\xe5Zt\xab\x1a8\xaf\x0e\x9e\x1d\x9cUEx\x5c\x03\xea\x12jQ\x0fa\x8a\x86\xa7j\x0cY\x8d\x2259#(\x84b\x1dq/R\x0d\xa8\x06\x17D\x15\x0b%@\xd5a`Cl\xf5\xbb\x08\x05\xe0\x83\xc7\xb2[\x02L\xd0\xa12\xad\x8c\xc4\xad\x1b\x00R\xd5\x00$\xf1K\xad\x82\x0eI\x144\xc2\x8fO|^I\xe1\xe0b\xcaL\xd7\xe0zbE*u&\xf9\x0a\x8a$\xc2\x97\xb3\x18\xfd\x0e\x92\xd8\xcb\x1e72\xc5q\xa3\xc5\x9dPWw\xbeI\x8cCTJ\x95\xd2\xc4\xacv\xe4\x8b$E\x18\x00e\x81\x01x\xfc\xdc\x938?\xd8D\xd6\xce\xb0\xbc\xb4\x8cC\x0b\x19\xbc\xf3\xc8\x9cG\x96\x040\xb6=\xd3\xa3\xf4\xe0\x9b\xa4\xe8\xad\x1a'\xdfP/\xebL\x88\xed\x13J\x93\x198\x1bk\x88\x13\x017\xba\xe7\xe6\x10F\xcd\xd5\xf8\xef.\xc5\x82\x10\xc7\x91j\x0a\xe6\xc4\xbc\xaa\xc1<\x0b\xd8\xaa\x02,5\x9b\x8a\xf1ti'\xfc\x9dB\x90\xb2`\xbb\xbf\x8b\xcf}\xe5\x1e\xecZ\x1f\x9d\x03\xcb\xf0\xde\xa3\x95e\xc8]\x16\x8d\xef=<G\x03\xf2\xd4&\xb1\xa5\xedc\x89\xf8\x5cE\xbfsc\xe6\xa2\x0e\x9e\xb5\xbe\xe9\x92\x8a\x99\x1d\xacH,\xe0\x5c\xf3\xfe1{\xf2\x95\xe1S\x16\xd4\x22\xda\x84\xe9,iA\xa9\x13V\xae\xa7_\xb1\x1688\x1bc\xbf\x80#\x195\x5c\xa5\x14\xf1\x02=\xce\x137\x11\xb6\xf0\xd7\x8f\xdc\x8d\x9d\xfe.t\xa5\x9d\xd2>\xce^\xab\xe8\xf7\xea\xe19\xc5\xef\x0c\xe5\x909am\xd0\xc6\xc4\xca\x8d\xe1Cc\xf6xD\xfc\x0e\xb5\x0a\xdd\xfc0Q&\x8eO/j\x0d_\x93\xf0\x13\xaf\xe1S\x17`3((Y\xda\x820\x19\x7f\xaeJ~\xb6ht!\x81C|\x098\x8dB\xaf\x06\x82\xecR\xcb\x1dW'\xbb\x0d\x8b\x11\xee>\xfd%l\x8d\xfa@;\xf1w\xefj\xc3\xe7\xde\xc5\x9f\xce\xa7\x02\xea $S\xc6\x13\xe2\xf4\xb0Ch\x14\xcfT@]\xd3\x80\x02\x07E1c\x08\xce0\x88\xc4\x22+\x0d\xe9\xd9\xa7Z\xa2\x16\xf9\xbf\xa7q\x17<M\xa4\x0c\xc4\x11R\x15\x9a2\xa01\x80!\x85\x06M\x0cH\x93\x12$\xfb\xca`\xd3%Z\x00\xbcv\xf5j\xb3\xc0\xf0\xfe\xc3\x13\xff\xa3;\xeaa\xb3\xb7\x0d\xaf\x0a\xd68/u\xea\x1aN\x88\x10\xe4\xc4\xa7\xe8S\xa8\xf1\x94_\x99\x19Z\x8d\x0f+\x01N\x1ab\x1akb/\xe9\x1a3\xf9;'\xf5S&3\xa7j\xbe\x10\x97r#\x14\xf1\xcc^\xae\x9a\x07p\xda\x80v\xcd\x05,\x084\xa4\xdd\xa0\x86\xf19=\xa0pe,\xa8\x8a\xe1\x12\xc0\x17\xce\x01o\xf3?\x8a[\xae\xfb\xd7\xc2z )\xb1\xa9-\xad\x97\xe4M\x02x\xc8\xbb\xcf\xe2\x7f\x9f\xf9c\xfc\xe7\x0b\x9f\xc0\xbb\x0e\x11>\xb2f\xd5\x16B\xb5\xc2\xa1\x18\xf3v\xef\xaa\x15\xc0\x04C\xe2\xe1CL\x7f!\x99\x8a^a\x86\x91\xc2\x01c\xdcNQ\xec\x5c4`\x8c\xbcX<\x85df\xf08\x89%\xd6\xb9F\xedP\x07o\x11\xf7c\x0d\xa8\xccv\x09\x09-5\x84\xce$u\xd6\xd5\x83y\x11\x96\xc4$fl\x85\xff\xe0\xa9\xed\xc6K;\xa0\x92\x8e\x8f\x10V\xdf\x7f\xc7;_\xfb\xb6\xef\xfd\xd8k\x0e\xbf\x92\x86a\x84a\x18A\x94\xe1\x9dG\x9e\xe7h\xe5m,u:Xi-\x83\xfb\x84?\xb8\xf7#\xef\xb8\xf7W?\xf6\xb3\xf8\xc8\xda\x1fL\xb4\xc3\x89\xfe\x19\x01\xce\xc7\x9b\xaf\x22?w\x1e\x99\xfa\x84\xddc\xec\x9dJH\x16\x80\x08\x81hb~\xeb\xd4!\xe3\xc4\x5ch\xcc^b\xa4\xcc\xea`5b\xbc\xba\x09\xe9A\x11!\xccS\xfc\x0c\x15m\xb4\x19IN\xe9\xf3\xc4\x1a\x10\xa5\x11W\x19\x1f\x9c\x8c\xdf\xc0\xffIq\xf7\x0a \xc8\x00\xf7\xfa\xa3~\xf5\x96\x1b~\xe3\xcd'\xbe\x9b\x8a\xa2(\xd6w7\xc2fo+l\xf6v\xc2\xd6`'l\x0f\xbb\xa1[\xf6B\xd7\x06\xa1k\x03;\xd0Z)\x7f\xf7M\xff\xb1\xb8\xe9\xfd?\xf4\x8b\x00^\xd1P\x80\xebGw\xaa\xce3K\xb8\x9f\xb9j\x8a\x15\x1d\xe0\x13\xff\x96\xbd\x10d\x96\x9a\xafj\x80\xe2\xea\xddM\xe7\x5cb\x1e\x91\xff{\x8b,$N\xa0\xa6\xd5P_\x7f\x8e\xb1\x14\xe1\xb8\x8a|\x07o\x02gZ\x0b\xb63Ih\xa5\x86j\xda\x82\xe6\xd4\x01#\xf6)b\x025\x8e\x99`\x0c2\x9b\xd1O\x5c\xbe\x06X8\xb5q\x9d\xcf\xdd\x89\xed\xfe\xae]\xe8\xad\xcb\xc6`\x87\xb7F\xbb\xbcS\xf4\xb8\x1b\x86<\xb4\x11\x8fP\xf0\x88J.)\xd0\xc5r[\xd4\x94\xbe\xe7ew\xe4x\x05\xbe\x8f\x92\x8eC\x84zk\xcd\xd5\x82\xd9x\x84\x989\x8f\x8c=\xbcydT\xd1P\x9a\xa6\x8fi\xf5\xa3\xa6\x8c\xe2k\xe5\xb2b/1\x82c\x07J\x84)5\x94\x89\xc6\xcd\x97\xb8\x98y\xeab\xd1M\xddo|?\xa7\xe9\x11\xcd,s\x04\x82k<\x07\xac\x12!O\x90\xf6B\x89\xe1H\xe0\xd2\xf2\x96\xed\xf3p\xc6l\x16\x14\xa0f\xc0\xc8\x0a\x1a\x95\x05\x8aP\xa6\xada\x0ff\xc6\x00\x05\x14Cd4\xc2\x08qC-P0\x22R\x18nH2\xc2\x05\x80LX\xe0Da\x8ek\xe6\x925^\x9e\x1c\x5c\xa8(\xa4\x8c\x1f\xca\xad\xec\x1fb\xc4\xb12 !}\x8e\xb1\x8e\xe3,\xc2\x8f\x87\xc2#\x0e@\xc2%(\xb1r\x82\x99\xc6\xfb\xd5\x5c]|\x9b\xf0s\xa9\xae\x92\xaa~\x02\x96\xb6\xa4\xc7\x93/\xb1\xd4\x05W\x93\xb0}G1\xd3E8\x01V\x5c}\x0d)\x8d[y\x0b\xdb\xc3]<\xb3q\x01\x94\x09Vh\x19\xc7\xda\xabh\xd3B\xbaY\x86@\x08\x06B\x89\x1c@ViW\x92\xb4\x1fR\x8e\xec\xc7\xc7\xae7w\x19\xbcf\xf0p\xc8\xc8!3\x97vh\xa6\xa9_\x14\xbb\x14,a\xcc\xdd\x9b\xec\x87\xb4n\xa4.7\xfbt\xeaP \x8c\x95P\x1a\x17_\x9f\xb4\x9bZ:\xb9\x04\xd1&\x22(\x09\x0a\xb6\xd8\x99\xb3\xd6\x1do\xc5\xff\xab\x06\xecJ\xbf\x0dNg\x85\x8b\xc1 \xc4\x18\x14#<\xf0\xec\xd7\xb06\xd8\xc4\xca\xca\x0a\xaek\x1fE\xcb\xe7\xe3N\x96<rs\xc8\x90\xbe\x1f\xa71\xff5\x82E\xed\xde\x01N\x92\xf1=\xbc\xcb\x22\x13\x22\x85O\xf43\xab\xbf\x8a0L\xf7\x01\x1cWH\xa0\x16\xa5\xe3$\xc0\xc5\xa2)5\x8d\x94\xcb0\x0e\xa28\xca\xf4\x14eg_M\xbe\xa8\xca 7\xbb\xf9\xda\xdb\x88%)B\x90\x1e\xca\xc6t\xf1u\x8d\xf2\xfb\xfc\x1c`\xb1\x04}s\xe3\x0c>u\xea\xf3\xe8\x96=\x1c<x\x08\x9dV\x1b\x99\xcf\x13|d\x09\xbf\x1d\xb2\xc8#\xb0\xb7\xf2\x11\xa8^\xfb\x83\x13d\x1a\xa3\xbfv\x02y\xb8\x10\xeb\x803\x99\x9d\xb0\x84z\x00#jc\x09:5UZ9\x90.5\xc3\x1a\xd7\x00\xaf\x0e\x81\xe25\x1c\x8f\x87/\x11~\xae@6K\x22\x9f\xb2\x22\x10@\x92VO\xac\xd2\xfe9\x81\x0f\x8f\x1f\xe6~>\x0e0\x10\x9e\xdb\xb9\x80\x8d\xd3]\x8c\xca\x11Zy\x0b>5O\xb9w\xc8|\x16y<R\x01\x85\xafn\x9d\xf6\xee\xe2T\xc3\x0f\xf6\x89\xffW\xfa\x8fD\xd6\xe2)F\xbf@.3\xdddx\xa7(\xd5\xe2\xdc\xd7U\xecE\x1a\xcd\x93\x5c\x16q\x89\x08N\x14%Y\xacE\xacQ]\xc5\xb8\xfe\xd0\xbe\x94\x91\xe2^\xa8\x08\x84-\xd1Q\xad\x07/5\x14\xed\xbb\x0b\xb7\x9f\x03\x88\xd0\x1b\xf6\xe0-\x87\xf3\x0e\xe2\xb5n\x9e2\x97!\xd7\x0c\xb9D\xf8\xc9\xc8!\x0b.}\xaf\xc54\xbdR\x91h\x9e\xa6\xf1]\x15\xf5\xb1\x08g\x13\xe8\xbf\xf7\x81\xb6\xc8\xdf\x9d8\x88\x84\xd85\xb3\xab{\x07\x97\x8a\xa7\xee\xe3\x00\x80b\x17M\x80\x17\x1fa'\x8ci\xe8\xe5\x02`f\x1f\xc0\x06n\x18^&\xfe\xf0\x158\xf3\xb2jh|\x12\x84(}h\x8d\x90\x91\xb9\x0c\x99\xcf\x90g\x91\xbfg)\xfa\x1dt\xe6\xaf\x8a\x0b\xb4\x8a\x8c=\xd49\xe4~\x92\xfdxSd\xd4\x98\xe36\xba\xc1\xbd\x8d\x98S\x07sVkAU\xe9\xab\xc43\xbe\x5c\xf1\xacVB\xd5\xc5\x86\x90\xa3\xf6\xa3$\xc8\xa0\xc8\xd2\xfb\xad\xfe\xddv\x99\x1d\xa78Y3\x120)8\x8ckAU\x80\xe5*\xbf\x8au\xef\xdd\xd7\x1c\xba~n\xcaE\xf6\xe2}\x12\xce\x5c\xe2\xed\xc1!\xa7*z\xeb\xf2\xd7\x98\xe0Y|\xbf\x85\xd4\xfe\xa7>@|\x82\x1f\x87<N\x01f\xd4\xa0\xf1\x7f\xa8H\xc4o\xb1Zznv\xcfQ\xfd\xe1\xba{\xdd\xbb\xf5\x92\x14%S\x11\x18c\xac\xfdP5\x03\xe6\xc4~\xc2\xd4:\xeeD\x18\xa7Q\xb3\x90\xc0\x88b\xd3E\x95\xf1\xc7\xf2\x03\x923\xad\xd63\xed\x0aG\x9266@\x14\xaf\xb4\xd6k|\x15\xc1>K\xf2A\x86\x8c\x149y\xb0q\xb4\x99\xd5\x96\xb3\xaa\x08g\xce\xc1`\xe6\x9c\xa7\xba\x00\xb3\xaf\xb17\xb3j\xf6j\x98\xbcDU\xf7\x22v{u(]\xda\xe7!\x17\xf1\x9b\x04\xde$\xdd\xf4\xd8\xe9d\x13^\xact)\xf2\xea\x00\xe2X3\x92\xf2\xe9\x13\xfd\xb5\xd4d\xa1a>K\x1f\xc6\x1aw\xc4\x884\x14\xa0\xc8\xf9\x93\xfe\xa3\xa9\x08\xd7RJ\xea\xbf\xc8jik\xf2k\xbf\xf7\xa1\xa1\xc6\xcc\xe8d-\x8c\xa80\x97\xe7\xd4\xc9[h\xfb\x16\xda>GK3\xb4\xcc#\xb3\x0cYz\x02\x84\x8dLH'~\x011Y\xdb\xe7\x91\xece\x0e\xed\xac\x85\x96\xcb\x90\x93Gn\x19r\xca\x90\xc1C\xc01\xfa\x0c\xa6\xb4g\xa0NF\x99fh\xb9\xdcJghi\x86\xcc\xa2|\x91\xa1\x92\xb1\xb9\xe6\xbd0\x83Bl\xcf\xc3\xb9\x06&ki\x06\xb12\x06\x0f\xa7kP\xb3\xfe$\xeeb\x0c22eE\xc3+@\xce\x06f\xf3\xe4\xc0\x16 \x95\x86\x04A5K\x1b\x0by\x94\xbe'\x04&$\xd6(Pvi)\xa2\xc2\x90\x1b[g\x86\xbd\xde\xda\xc1\xd6\x92\x1dY8\x88C\x9d%;\x90/a%_\xc0\xa2\xef`\x11\x1d\xb4\x82G\xc7<40\x5c\xc9\x96s\x86\xaf<\xf5\xc8\x08Oc\xbdrj\xd9\xeb\x9f\xe2\xc0X]8d\xcb\xd9\x22\x16\xfd\x02\x16\xa4\x8dv\xc8\x91\x07\x87vp\xd0\xc0\xb0`\xb0\xd2p\x90\x96\xec\xab\xe7N\x05<V^\xa8\xf7\x89\x87\xc5\x17\xd77\xd6q\xb4s\x10K\xda\xb6\x0erk\x07\x8f\xdc<\xb2\xa0\xf0A\xe3\x83\x1b\xc1\x10\xca\x80\x03\xb4l\x8fm\x9f6<zv\x8d\x80!\x08\x1e\xc0\xf6\xf6\xc6\xfaS\xe8\x01+\xb6`m\xcb,\x0f\x0eyp\xd0\x107\xa9-\x18\x10\x0c(\x0dT\x02K\xd4\xc6\x83\xcf<\x1c\xf0\x04\xd6j;\xb5\xbb\xa3\xfe\xce\xd6\x13\xd85t\xca\x16\xf2\xe0\xe0\x83\xc2\x07\x81\x0f\x02\x0d\x04\x0a\x88\xd7\x89\xd7\xb2Et\xec\xd1g\xbf1\xc2i\xac_jGZ\xf6\xca\xef\xb8\xc5\x17E0\x93\xd5\xf6[n>\xf6r:\xb2x\x08\xabK\x07\xb1\xbax\x18G\xfc\x01\x1c\x0c\x07p\x00\x8b8`\x8b\xe8X\x06.\x04\xbf\xfe\xd0\x1f\xd1'~\xeb\xc3\x0f\xd07\x8aO\x19\xe14\x80\xad\xd1\x11~\xba{\xd8~\xfa\xb6\xe3\xaf\xd4\xd5\xe5Cv\xa0\xbd\x84\x83a\x19+\xb6\x84e[\xc0\x92u\xd06\x0f5A\x1e2\xfb\xf33\x9f\x94_\xff\xe0\xaf=\x8d\xff\xb5\xfd\xdf\x01<\x06\xe0b(\xed\xe1\xb5\xeb\x86\xff\xf8\xe6\xe3\xafX9\xbep\x0cK\xd6\xc1\x22\xe2{\x97\xac\x85\x8e\xe5q\x0chB\xad\xe0\xed\x81\xedS\xfco\xff\xcb\x7f\xd8\xe9\xfe\xa7g>N\x01_\x03\xe1\x02\x80Q\xb1Jk;\x07\xc3O\xde\xbez\x92Wx\x01\x0b\xd6\xc6\x92\xb5\xd1\xb6lB<S\x13\xf8\xd2\xd9\xef?\xf6Q\xfe\xaf\xbf\xfd\xc1G\xf1\xc5\xfe\xff\x00\xf0\x04\x80M|\xb9_n\xbc,\xf4F\xcb\xf4\x8e\xdb\x8f\x9c\xa4E\xee\xa0\x1dr,X\x1b\x1d\xcb\xd0\xb2\x0c\xce\x14\x9c\xae\x93\x95\xce>\xfc\xf8_\xf0\x1f}\xf0w\x1e\xc5=\xbd\xbb\x00<\x0e`c\xd6$k\xd6LK\xf1\xbec\x1f8|\xf3\xf1w...\x1e\x17\xc09u\xec\xaa\xc9OR\x01\xc5\xc8\xce<s\xb6\xf7\xd8\xa7\xef?E\x9f\x1d}\xd2\x80\x07\x00|\x199o\xa3\x1f\x0c\xefX\xfa\xf1\x03w\xde\xf4\xb3\xc7\x8e\xae\xbeR\x8d[\xc2\xc2JQ3\x8f\x22V\x04\xcb\xad\xb5\xcd\xc1\x97\xee\xfb\x7f\xcf\xe0\xe3\x1b\x9f\x04\xf07\x00\x1e\x00\xe1<\x0c\x01\xaf\x93\x93\xad\x1fy\xd5\xcf\xdd\xfc\xf2\x13wf\xea\x16\xc8X\x84\x88\x84\xc6-\x0f\x08\x18\xec\x0c\x8a/~\xf5K\xeb\xc5\xc7N\x7f\x1a\x9b\xb8\x1b\x84/\xc2\xf0$\x16%`\xbb4\xfc\xa3\x95\xf7\xbe\xec\xb5'\xff\xd9uGVod\xa3\x8c\xc1\xccD K_\xc0\x11UK;\x7f\xee\xfc\xe0\x91\xffs\xff\x13\xf8\xab\xee]\x88\xf7\xf3\x00\x80\x8b\x12G%\x8a\x7f\xb2\xf8\xae\x1b\xef\xf8\xce\xf7\x1c=\xb2z\x82K\xf3\x04\xe2(\xe2Q\xfd\x082\x88\xb0\xf6\xec\x85\xde\xd7\xee\xbe\xffI|b\xf7.\x00_\x00\xf0 \x80\x8b\x97v\xc0\xecs\x03n\xc0\xad\xe8\xe30\x0cYMv\xac\xa6\xba\x86u\x0c\x08\xd8\xb6\xf8\xbd\xc8\xdf\x04\xb0\x06\xa0\xf4\x00\x86\xf1\x1a\x07q\x0c\xb7\xa1\xc0\xf5\x08h5\xc8>\xc3\x10@ la\x88\x02\xbb\xe9\xbd\xa7\x01\x9c\x05&\xbe\xe8\xba\x85\x83\xb8\x15\x8c\x97#`q\x22s\xab\x0a\xdaG\x81.\xba\x04l\x18\xf0\x0c\x80\xa7\x00t\xf7\xdc\xcfQ\x1c\xc5\xad(p\x14\x01\xad\x066S\xbd\x1e\xbf\x89!\x02v\xd2g\xf9&\x80s\x00\x8a\xa9\xeb\x1c\xc3m\x18\xe1(\x02\xf2F\xeb\xcb\xf5\xf7-nb\x90\xaes\x01\xc0\x93\x97\xb8\xce>\xddK\xbc\xd1,\xbd\xdc\x9e\xf741m\x04\xa0\x9f^\xb1'\xeb0\xb0\x1b\xaa:\x935^\xb8\xc4u\x8a\xf4\xfe^}\x8d=}\x1d\x80VZ[\xe4\x19\xd7\xa04\xcf\x1b\xa4k\x14\x98~\xc6E\xd2}\xb4\xae\xfa~\x00`A\x80\x9d\x12\x0d\xbb\xe4\x8d\xebL\xe0H\xfaK\x91>K\x7f\xc6=\xedc\xfa\xbf\xfd\x8a\xee\x0b\xb5\xea\xfb\xed\xf5Y\xe6g~\xe6g~\xe6g~\xe6g~\xe6g~\xe6g~\xe6g~\xe6g~\xe6\xe7\x9a=\xff\x1f\x22\x06\xf8\xc4g\x97&5\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x12e\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c-\x09E\x10\xfcy\x00\x00\x11\xf2IDATx\xda\xed\x5cm\x8c\x1cer~\xde\xfe\x98\xe9\x99\x9d\xdd\xf5.\xfeHv\x91\xb1\x00\x83\x1d\x0b\x03\xc1 \x82bd\x04\xc2\x17\x14\x82\x94\x10\x09$sI\x90\xa2\x5cN\x17)\xca\x9fH'\x01\xd1I(\x1fR\x14)Rr\x90H\x96M\x1c'9\x09\xf8\x032 ],\x0c\x16\x16\xe0`\x82l\x16\xdb\xbb^\xdb,\xeb\x85\xfd\x9c\x8f\x9d\xee\xe9\xee\xb7\xf2\x83\xaeI\xed\xbb=\xb33\xb6\x0f\xf0m\x97\xd4\x9a\xf5z\xfa\xdd\xee\xaaz\x9f\xaaz\xaa\xba\x81L2\xc9$\x93L2\xc9$\x93L2\xc9$\x93L2\xc9$\x93L2\xc9$\x93L2Y&J\xa9\xab\xfa]\x95\xa9\xb4se\x12\x91T\xec\x8a\xba#>!\x93\xabg\x04\xd7uU\x17\xdfW+\x19*\xdb\x01]\xda\x00\x00m\xd8\xb0a8\x8a\xa2\xbe4\x98I\x9c^9\x8e\xb3x\xe9\xd2\xa5q\xb1[(3\xc0\x15*\x7f\xd7\xae]kv\xed\xda\xf5\x93\xeb\xaf\xbf\xfeG\xacl\x22\x82\xd6z\xc9.\xb1,\x0bD\x84\xc9\xc9\xc9\x9f\xbf\xf5\xd6[\x7fr\xf4\xe8\xd1\xd1\xfe\xfe~,,,,[\xd4\xc9\xf4\xda\x91X\x8f>\xfa\xa8\xba\xf7\xde{\xff\xe2\xa1\x87\x1e\xfaQoo/\x16\x17\x17)\x08\x02\x84a\x88(\x8a\x9a\xc6\xb0m\x1b\xae\xeb\xa2P(\xa8\xdbn\xbb\xedA\xd7u\xff\xfd\xe8\xd1\xa3\xbf\xbd\xb0\xb00-\xe3\x08\x8b\x9d\xe9\xb6#\xa1\xdd\xbbw{\xc3\xc3\xc3?\xdd\xbau\xeb\xc0\xdc\xdc\x1c-,,\xa0\x5c.\xabj\xb5\xaa\x16\x17\x17\x95\xef\xfb\xcd\xa3\xd1h \x8a\x22588\x18*\xa5\xfa/]\xbat\xf2\xfc\xf9\xf3\xa7\x01\xe8e\x96\xcdt\xdb\x99LNN:D4\x10E\x11\x1a\x8d\x06\x05A\xc0\x8aF\x1c\xc7\xcd]\xa0\xb5F\x14E*\x8ec\x0a\x82\xc0\xb2m;\xaf\x94\xba\x15\xc0\x9a\xd4\xad\x95\xa9\xb63\xc9\xe7\xf3\xa4\x94\x22\xad5\xe28V\x8c\xfbJ\xa9%\x87eY|(\xcb\xb2\x00\xc0\x0a\x82\xa0\x1f@)M\xdfY\x0c\xe8P\xe28N-\xb2\xf8\x93\x88\x10\x86!\x94R\xd0Z#\x0cC\x10\x91J\x02\xb2\xd3J\xd7\x99\x01:\x94(\x8a\x9a9\xbd\x0c\xb8\xd5j\x15\x8b\x8b\x8b\xcd\x7f\xe7r9\xe4r\xb9&4\x11Q\xdb\x8a83\xc0e\x88m\xdbPJ\xe1\xe2\xc5\x8b\xa8T*\xe8\xe9\xe9A>\x9f\x87eYPJ\xc1\xb6m8\x8e\x03\xc7q\x90\x96\xf9\xac\xba\x18\xd0\x0d\x7f\xd3\xc9Za\x18\xe2\xd4\xa9S\x98\x9a\x9a\x82\xeb\xbap\x1cg\x89\xf2-\xcbj\x1a\x81k\x82U\xbd\x03X\x01\x96euj\x09\xd2Z/\xf3^\xa5\x14|\xdf\xc7\x993gP\xab\xd5\xe0y^S\xe1\xe6\xc1\xbf\xe7\xe0\xbc\xaa\x0dP(\x14P\xaf\xd7\xa1\xb5\xee\x98\x1c\xb3,Ki\xad\x89\x8d`Y\x16\x82 \xc0\xf8\xf88\x1a\x8d\x06\x5c\xd7mz<g?\xd2\x18\xd9\x0e\x10R\xaf\xd7\xf9\xc7\xdb<\xcf\xfb\x153u\x14\x99\x8e\xd5h4\xe6\xe28~_kM\x9e\xe7)\xdf\xf7\x09\x00\xb4\xd6\xa8\xd7\xeb\xa8\xd7\xeb\xcd\xf3\x1c\xc7Yb\x00V\xbc<\x92Tt\xf5\x19\x80=W)\xa5v\xec\xd8Q|\xe0\x81\x07\xfe\xe9\xce;\xef\xfc\xbe\xe38\xd0Z7\x0fI1\xdb\xb6\x0d\x22R\xa7O\x9f\xfe\xdf\xe7\x9e{\xee\xb7|\xdf\xff\x22m\xcdd\x874=<\x0d~\xa4qV\xa5\x01\x12\xe5[D\xa4w\xee\xdc\xf9\xe3'\x9f|\xf2\x0f\x8a\xc5b\x5c\xadVu\xc2\xe1\xa80\x0c9_\x87m\xdb\x94\xcf\xe7\xd1\xd7\xd7\xa76o\xde\xbc\xdd\xb2\xac\xff~\xe6\x99g\xee\x02P3\x8d \xbd_z\xbdi\x006\xd0\xaa4@b\x04\x0d\xc0\xde\xbcy\xf3\x1f\x17\x8bELOO\xabJ\xa5\xe2\xfa\xbe\x8f(\x8a\x10EQ\x93\xc9\xe4\x1c>\x0cCl\xda\xb4\xa9q\xfb\xed\xb7o\xdc\xb6m\xdb\xef\x9c<y\xf2?aP\xc9\xbc[\xd8\xc3\xd9\xcb\xd3v\x81L\x02Vk\x1aZ\x22\xa2\xde\x84\xc3i\xf27\x5c(I(\xe2\x9f\xc30\xb4\xf3\xf9\xbc*\x95J[\x01\x0c@\xd0\xf6\x5cX\x99^\x9f\x06?\x9d@\xd0j0@3\x88\xf2a\xa6\xa7f\xe0L\x14g\x87a\xd8\x07\xa0O\x09-J\x08\xe2\xe0kfA\xd2\x08\xab\x19\x82\xb8\x0b\xa5\x00(\xa6\x0f\xcc@\xca\xbf\x8f\xa2\x08J)\x93\xf3\xb1\xa5\x8ed\xc0\x96\xe4\x9bL9\xb9\x1f \x0d\xb0\xea\xd3P3\xdd\xe4\x82\xaa\x5c.7\xbd\xb9P(\xc0\xb6\xed\xe6\x0ei\xa78\xcb\xb2\xa0\xb5^\x02A&\x05!!j\xd5\x1b\x80\xbd\xd7\xb6m\xc4q\x8c\x89\x89\x09\xcc\xcc\xcc \xc9z\x96x,\x93i\x89\xe2T\x9a\xf2\x19V\xd2RPi\x00\xd7uW\xa4B\x9ck\x0cR:\xc2\xfbV\xca\xf7}\x1f###\xa8T*p]\x17\xf9|~\x89\xa7\xb2\xf2\x5c\xd7M\xf5\x5c\x09;\xd2\x00\xbc\x86\xa9|\x0e\xc2\xbf\x0c;\xa0\xe5TAJRAii\xa3\xef\xfb8{\xf6,\x82 H\x0d\x94R\xf9\x1c`[y\xaeY\xf9\xcaO\x99\xff\xaf\x14\x80\xaf\x15\x03X{\xf6\xec\xd9\xea\xba\xee0\x11\xd9\xe6\x80\x94\xf8Y+\xa5.\xee\xdd\xbbw\x04\x001\xdc\x00@\x14E8w\xee\x1c\xc20l.*YL\xe9\xc1\xae\xebJ\x08jIE\xf3\x0e\x90\xc6\xe05\xe5N\xb8\xe6\xc88V\xea\x8d7\xde\xa8\xc6\xc6\xc6\xe8\xd9g\x9f\xfd\xf3[o\xbd\xf5/]\xd7]\x1f\xc7q3w\x97\x10\xe08\x0e\xf2\xf9<\xaa\xd5\xeaT.\x97\xfb\xe7\x17^x\xe1'w\xdcq\x07\x1d?~\x1c\x00\xb0\xb8\xb8\x88j\xb5\xba\x04:\x18\x22XQR\xf9\xadH4\xd9\x05k\x95z\xca\x9d\xd4\x89|\xe7\x0c\xc0\xfc\xcd\xd8\xd8\x18=\xfe\xf8\xe3\x0f\xec\xdc\xb9\xf3\xef7n\xdcH\x0b\x0b\x0b\xe4\xfb>\x1a\x8dF\xd3\x00|\xb3\x9e\xe7\xa1T*\xe1\xba\xeb\xae[;88\xf8\xcc'\x9f|r\xee\xe8\xd1\xa3\xfffB\x06\xaf/q^\xee\x00\xd7u\x9bG+\xf8h\xd1\xff]fL\xae\x82;\xc1\xcc\xef,\x7f?88\xf8\xd4\xda\xb5kQ\xa9Tt\xb9\x5c\xc6\xfc\xfc\xbcZXXP<\x0e\xc2#!\xb5ZM\xd5j5\x15\x04\x01\xb6o\xdfnm\xdb\xb6\xed\xf7\xf1u\x13<5\x854\xf3t\xe9\xfdl\x8064\xf5\xb2*XB\x8e\xfc\xec\xa4\x11\xf4\x9d\xae\x84\xe38^\x93t\xa0T\xa3\xd1Pa\x18.\xa1\x0f\x18\x92\x84\xe1\x94eY\x96\xeb\xba\xeb\x01\xdc`\xde\x9f\xd6z\x09\xfc\xb0\xf2L\xefoG!\xa4\x15a\xb2\xf8\x92\xc6\xe8d6\xf7;\x19\x84Ep\x8d\xa5\xb2\xb9\x92\x95E\x8f\xbcqV^\x18\x869|=\x87c\x99\xebJ\xf8\x91\xd4\x03+?\x97\xcb-\xdb\x89\xf2g\xb3\xf0JKC%\x04]\xd3t\xb4J\xb9zV\x00\xd3\x07\xfc;\xcf\xf3\x9a\xf9>\x11Y\xc9\xbd5\xd3WV\xa0Y\xa9\xb2\xe2\xb8\x00\x93\x06\x90q m\xfeG\xf2BrM\xee\x96]\x93A\xb8\x95\x0d8x\x86a\xd8\x1cr\xcd\xe7\xf3(\x16\x8bM\xc5\x1bi\x1f\xa5\x19\x8fSL\x198%\xf6K\xfcO\xcb\x82V\xca|\xccF\xcc5\xdf\x13\x96\x8c\xe5\x97_~\x89r\xb9\x0c\xcf\xf3P,\x16\x9b7.\x15h\xdb\xb6,\xdeT+\x05J\xafe\xcf\xcf\xe7\xf3K\xe8\x834\xc5\x99}`3\x00\xcbq\x14\xbe\xfeo\xad\x1fp\xa5\xe3 \x8c\xf9Zk\x8c\x8f\x8fcbbb\x19\x86\xf3\xbf\xf90\xfe&\xa5U\xaf\xf2\xe0\xf3\xa4\x07\xa7]\xbb\x8c\x01f\x006\xb3\x1f\x19\x80\xbf\xd5\x1d\xc09}\x87<\x8eN\xf3\x14\xad5.\x5c\xb8\x80\xb9\xb99\x14\x0a\x85f\x91$\xb7\xbd\xdc\x01<$\x9b&\xec\xb9f\xe5+\xd70G\x0e\xcd\x18\xd0\xaa\xf5(\x0f3v|+1 \xb9\x08\x95\x8c\x82P\xa7\x80/\x9f\xabRJ\xe1\xf3\xcf?\xc7\xdc\xdc\x5cSAi\xd9\x0bC\x08\x1b\xa0\xdd5I\x03\x98\xe9'\xc7\x874\xfc7!\xa8U\xf1\xc5\xff\xc7\xc5\xe2J\xa9\xe8/\xcc\x00Zk\xf5\xd8c\x8f\xa9\xd3\xa7O\xffZ\xa3\xd1\xd8\x98\xf6`\x1b\xe3\xa3\xe38\xfe\xb6m\xdb\x8e\xbe\xfa\xea\xab\x0d\xf9\x1d\xad5\xca\xe5rj\xd3C\x06P\xfed\xe5\xa5y]\x1asi\xee\x9eN\xaa\xd7\xb4\xeaWf@\x8e\xe3,\x1b\xe6\xfa\xc6\xd9P\xc7q\xd4\xddw\xdf\xddw\xcf=\xf7\xfc\xcd\x13O<\xf1\x03\xd7u\x97\xe4\xf1f\x06b\xdb6FGG\xbf\xf0}\xff\x8f\x0e\x1d:\xf4V\xb2\x13\x00\x80X\xa9R\xf9\xb2\xf3$\xbd_\xc6\x8dV\x0c\xa6\xfc\xfb\xact\x0e\xc02x\x9a\x8a\x93\xbd\xe0V\xde\xcf\xffn\xd7\x0c\xfa&\x0c\xa0\xa2(\xa2\xfb\xef\xbf\xffO\x1f~\xf8\xe1\x1f\x94J%]\xadV\xe1\xfb>\xc5q\xac\xa4\xe2zzz\xd0\xdb\xdbK\x83\x83\x83\xea\xbe\xfb\xee\x1b\xf2<\xef?\xde|\xf3\xcd\xdf\xd4Z\x7f\x9ax\x9b2\xb3\x17y\xc32x\xe6r\xb9%\x9cO;\xcf\x95\xe7s\xe6\xc3\xf0\xc6#\x89l\xac\xb48\x22\x0dhV\xc0\xad\x82\xf77\x99\x05\x11\x00\xf4\xf7\xf7\xef)\x95J\x98\x9f\x9f\xc7\xec\xec\xac533c\xcf\xcf\xcf[\x0b\x0b\x0b\xd6\xc2\xc2\x82U\xadV\xf9\xb0\xab\xd5\xaaU,\x16\xc3\xbb\xee\xba\xab\xb4k\xd7\xae\xdf\x05\x90\x93M\x18\x13\xb7\xcd\xfc\x9da\xa8\x13\xe8h\x05_&\xff\x93\xa6\xb8\xb4\xd4\xb3U\xfa\x99V\xcc}\xa3i(\x11\xf5\xc5q\x8cF\xa3\x01\xf9(\x8fI)$J!\x22\xb2\x5c\xd7\xb5\x1d\xc7\xd9\x04`}\xb2\x06q\x91\x95V\x00I\x08\xe2\xad\xcfs\x9c+\xe5\xff2\xf0\xa6\x190-\x0b\x92\xcaO;\xf8\x1a\xbaI\xbf\x7f\xa1u@2k\xa3x[\x9b\xfc\x8d\x08\xac*\x11\x84a\xd8\x03\xa0\x8f\x0d`\xf2.i\xc5\x97\xa4\x8f[\x05=3x\xa6e?\xe6\xe3\xa6i\x09C\x9a\x11d\x82 \xc7\x1d\xbf\xd5,\x889\x04\x19\xbc\x94R\x08\x82\xa0\xf9P\x9beY\xe8\xe9\xe91so\x0b\xc9\xd3\x9bl\x14\x9eVh\x05?\xed\xf2w\x09a\x92\xf9\x94\xdc\x8f\xac~\xdbV\xad\x89\xf1\xb4\xd6\xcb\x1a9\xb2\x80\x13s\xa9\xdf^\x1d \xdbv\x000??\x8f0\x0c\x91\xcf\xe7\xd1\xd3\xd3\x83B\xa1\x80\x5c.\x07\xcf\xf3\x96\x10`\xed2\x984\xe6\xd2\xac\x80\xdb\x8d\x92\xc8\xcaWf@\x9dR\xc7L\xbcq0\xbe\x1c\xfa\xf9\x1b3\x80\x9c\xa9\x1f\x1b\x1b\x03\x00\x94J\xa5%\xd8\x9d\xcf\xe7\x97\xe0w\x9a\x02\xe5t\x99l\x9e\xf0\xc1\x8f\x06I\x8fK\xc3o\xb9\x03\xa4\xf7K\xf8Yi\x86\x87\xafG>\x90\xbd\xd2\x08b\xd7\xa3\x89W\xf3q\x9ez\xbd\x8e\xb3g\xcf\xa2\xd1h4\x15\xcd\x8a`\xe5\xb3\x02[\xe5\xcc\x92\xc31\xe9\x07\x09?i\x8d\xfa4C\x9a\xd8\xdf)oo\x1a\x92\xe3\x8e\xd9~\xecV\x7fV+\xcf\xedr!\x95\xd2\xcd\xc2\xd8\xd8\x18\xa2(\x82\xe7y\xcb\x8a\xaf|>\xdf4\xc2J\xf0\x93F=H\x05\xae\xf4$\xa2\xa9\xb8\xb4\xf3;\x85\x0f\xe9\x0c&\xfd|9\x10d\xa5y\xca\xf6\xed\xdb\xbb]\x8c\x9e~\xfa\xe9%\xbfh4\x1a\xf0}?u\xeeF\x1a`\xa5\xe9\x01\xd96LS`Z\x9e\x9d\xb6\x8bL\xec7\xcf_)_g#\xb7\x22\xdf\x18\xc2.;\x06\xb0\x05\xe38\xc6\x89\x13'\xf0\xc8#\x8f|\xef\x96[n\xf93\xc7q\x06\x88H\x99\xb3\x95\x9c%\x12\xd1\xa5#G\x8e\xfc\xeb\xde\xbd{_\xdf\xb3g\x8f:p\xe0\x00I81\x090\x13\xff\xdb\xe1.\xefF\xce\x80L\xfc7\xe1\xa7]\x0a\xc9E\x92\x09?\xd2\xfbW\xda\xf52\x9b3&\xa9\xdb\xd2 \x1d\x19\x80\xa9\xe3u\xeb\xd6\xe1\xa9\xa7\x9ez|\xf7\xee\xdd\xff\xb5n\xdd:\x95\xbc\xfb\xa0y\xd1\xc5b\x11\xc5b\x11}}}(\x14\x0a\xa8\xd5j8v\xec\xd8c\xcf?\xff\xfc\x0f\x0f\x1c8\xf0\xd3N\xf0[\xe2\x7f\xca\x9b\xa8R\x8b\x1fV\x1es6\xfc\x99v\xe3\xa6A\xcc5d\xf1\xd5i\xbah\xd2\xd1r\x07\xc8\x1a\xe1\x8a\xb2 \x22\xc2\x8e\x1d;r[\xb6l\xf9\xbb\x9bn\xbaI\xcd\xce\xceF\x95J\xc5\x22\x22\xe4r9\xc4q\xdc\x0cdIE\xabzzz\xf4\x83\x0f>H\x13\x13\x13\xcf\x1e>|\xf8\x0d\x00\xe7\xd2\x82\x1f\x9f'\xbd\xdf\x84\x9f4\xcf\x95\x8f{\xca\xccG\xee\x1es\x17\xa5\x19Rf@\xe6\xf4[\xa7^\xcb\x06\x00\x96N\xd6]I\xf2b\x9a\x8c\xce\x9c9\xf3\xab\xc5bqS\xbd^\xa7J\xa5b\xfb\xbeo\x05A`\x05A`EQd\x11\x91\xa5\x94\xb2\x94R\x16\x00\x15\xc7\xb1MDjhh\xc8\xbb\xf9\xe6\x9b\x7fC\xf08\xcb\xcaw\xa9<\x0e\xcc+\xdd\xb0I=H\x18\xea&\xf0\xa5e?\xec\xb9\x9d\xac!;b2\x9bkW\x00^V\x1d\x10\xc7\xb1\xc3\x14\x02\xcf\xe0\xc8\x82\x85GD\x8c)\x01\xb2,\xcb!\xa2\xeb\x13\x1aa\x9a\xa9d\xb3\x00\x92\x01\x989\xffv7-1W\xe6\xee\x9dd?&\x04\x01X\xc6\xfdt\x02?\xf2{f!v\xa5\xef\xe5s\xccn\x94R\x8a\xb8\x0f\xcb\x17\x1c\x86!\xe6\xe6\xe6\xe08\x0e\x06\x07\x07Q,\x16\x97]_b0\x0f@\x9e\x7f\x9765\xc0\xca7\x1b\xd7\xedv\x00\xe7\xdc&\xf7\xd3\x0d|\x981\xa0\xdb\xf3\xe5p\x80\xbc\xa6+\xad\x9b\x9c\x94?\xa4\x18W\xe38\xc6\xd4\xd4\x14\x82 @\xa9T\xc2\xe0\xe0 \xf2\xf9|\x93F0pW\x19\xfd_2;Gf\xf1\xd5\xd1\xe4X\xca\xe4\x1a\xd7\x0e\xddx/CV\xb7\xbb'\x0d\x0ee\x7f\x99\x89\xc6\xab\x06A,\xb3\xb3\xb3\x18\x1d\x1d\x85\xd6\x1a\xbd\xbd\xbdM\xcf\xe5\xc3\xec\xfc\xa0\xc5\x1cN\x9a\xf7s\xf6\xd3I\xf9\xcf\xd0#!\xc8|\xfc\xb3\x93\x0c\x86\x03\xa6\x9c\xff\xef\x96Z\x911\xa0[\x08\xeb\xd8\x00J)\x94\xcbe\x8c\x8f\x8fCk\xdd\x84\x0b\xb3\x82\x950%\xaaae6Q\xb4\xd6\xcb\xb0\xbf\x1b\x0fl\xd78\xef4\xed\x93\x90\xc1\xbb\xefr\x0a'\xf3\x01\xed\xab\xf1^\xd6T.\xa8\xd1h4\x8b\x97V\x05T'\x0a\x90\xd9\x8b\xf4\xfeN/^\x92^i\xd4s7b6\xde/\xd7kY\x1fW\xad\x7f\xde\xaa\xe46\xabW\xc6~\xe9\xc1\x9d\x5c,\xdf<\xd3\xce+q?i1\xc0\xac~\xbb\xf5<\xbe\x17f//\xc7sMJ\xfcj\x91\x97\x96\x89\xe1\x92\xc77\xd9K6B\xab\xfc\xdb\x9c\xe9\x91\xb0%'\x0f\xba\xb8p2\xdb\x87]z_3!0\xfb\x06\x9d\xfe\xfdV\xfd\x8dN\x1a8]u\xc4\xd2xx\xae\x01\xd2\xe0Gv~\x92\x83\xe4E\x13\x11W\xba\xe4\xba\xae2{\xb7\xddlyI\x1f\xac\xe4y<\xce\x22\xaf\xc5\xb2,\xc5\x7f[f.\x9d*\xbf]\xb0o\xb7\x8e\xd0)\xb5b\x8d\xd3\xb2 \xe2\xa0\xa5\x94\xa2\x5c.\xa7<\xcf\x03\x1f\x0c\x01F\x10\xa5\xc4 J\x04>\xf2<\x0fJ)\xd5\xd3\xd3\x03\xcf\xf3\x96p?)\x17N\xe6\x0d)\xa5Tbx\x92\xe9c\x07\x8aS\xc6\xfd\x90\xbc\xee\x0e\x98O\x92mU\xa5\x14\x0a\x85\x02)\xa5\xa8\x1b\xe8I\xd6\x91\xd7C-!\x88\x17\xdc\xb8q\xe3\x17A\x10\xcc\x14\x0a\x05J\x887*\x95J(\x95J(\x14\x0a\xcd\x97Z\xf0g\x1c\xc7\xa4\x94\xc2\xe4\xe4dx\xe1\xc2\x8596j\x10\x04\x9f\xd9\xb6\x8d\xfe\xfe~*\x14\x0a(\x16\x8bp]w\xd9\x8b1\xb8\xb2\x06@333zttt\x9a/4\x0c\xc3\xff)\x97\xcb\xe8\xef\xef\x87\xe7y\xcd\xf7v\x9a\xe7\xcb5\x16\x17\x17\xe9\xec\xd9\xb33\x00\x1aJ\xa9\x1c\x80\xca\xdc\xdc\xdc\xc5\xe4\xcd\x86DDd\x9ek\xae\xa3\x94\xc2\xd4\xd4\x94\x1e\x1d\x1d\x9da=y\x9e\x17V*\x95s\x8b\x8b\x8bhw\xbeX\x87\x94R4==\xcdz\xa1\xb61\x80\xdf\xafS(\x14\xfc\xb1\xb1\xb1\xbf-\x97\xcbj``@\xad_\xbf\x1ek\xd7\xae\xa5\x81\x81\x01r]\x97\xc20\xa48\x8e)\x8ec\x8a\xa2\x88\xa2(\xc2\x87\x1f~h\x1d<x\xf0T\x1c\xc7_(\xa5\x22\x00\x18\x19\x19\xf9\xeb\x91\x91\x91\xd0\xb6mk``\x80zzz(\x8a\x22\x0a\xc3\x90\xcfk\x1eq\x1c\xeb\xf3\xe7\xcf;\xfb\xf6\xed\xfbb||\xfc\x14\x80\x08\x80u\xfc\xf8\xf1\x7fy\xff\xfd\xf7/NNN\xda\xfc^N\xf3\x5c\xbe\x868\x8eivv\xd6\xde\xbf\x7f\x7f\xed\xc8\x91#\xef\x01h>\x93\xfa\xf1\xc7\x1f\xff\xd5;\xef\xbcC\xd5j\xd5J\xde\x11D-\xd6\xa18\x8e\xf5\xa9S\xa7\xec\xfd\xfb\xf7\x8fV*\x95Q\x00\x11\x11\xd1K/\xbd\x14~\xfa\xe9\xa7\xff\xf8\xde{\xef\xe9Z\xad\x860\x0c\xa9\xdd:Q\x14\xd1\xc8\xc8\x88}\xf0\xe0\xc1sSSS\xe3\xc9=\xd1J\xfd\x00\xfd\xfa\xeb\xaf\x03\xc0?\x04A\x10\xdep\xc3\x0d\x8f\x97J\xa5a\xa5\x94kY\x96e\xbe\x9eKkMSSS\xf5\xc3\x87\x0f\x7f\xf6\xf6\xdbo\xbf\x01`\x92\x88\xca\x9e\xe7\xa9W^y\xe5\xb0\xd6\xfa\xf7FGG\x7f\xb8n\xdd\xba\x9b\x01\x14\xbe\x9e2\xb1\x96M\xb0\xcd\xcf\xcf\x07\x1f|\xf0\xc1\xc4\xcb/\xbf\xfc\x06\x801\x00s\x96e\xe1\xe4\xc9\x93_\xed\xdb\xb7\xef{\x17/^\xfc\xf1\xf0\xf0\xf0\xaf\xdb\xb6]J\x9e\x15Vf\x01T\xab\xd5\xa2\xcf>\xfbl\xeeg?\xfb\xd9\xcf}\xdf?\xa1\x94\x9a%\x22\xbf\xb7\xb7W\x1d8p\xe0`\x1c\xc7\xee\x89\x13'\xfep```\xa3\xd6:\x9f\x10\x8af0\xa5\xe9\xe9\xe9\xe0\xddw\xdf=w\xe8\xd0\xa1C\x00&\x00\x94\x01\xc4A\x10\xe0\xc5\x17_<X\xa9T\xac\x8f>\xfa\xe8\xfbk\xd6\xac\xd9DD9vb\x13\x92\xbe\xfa\xea\xab\xfa\xb1c\xc7\xce\xbf\xf6\xdak\x87\x00\x5cH\xd6\xa1\x15[\x89F\xee|\xfd\xd0\xd0\xd0\x16\xdf\xf7\xd7\xc6q\x9c\xc7\xff\xbf\xb8T%p@\xb3\xb3\xb3\x01\x80\x0a\x80\xaf\x00\x8c\x03\x98\x01 _928<<\xbc\xb5\xd1h\x0c\x11Q!y|\x88\xf8mV\x00T\xb9\x5cn\x84aXK\xce\xbd\x00`Rz0\x80\xc2\xfa\xf5\xeb\xb7(\xa5n\x88\xa2\xa8\x17\x80-x$RJ\xa9z\xbd\x1e\xd5j\xb5E\x00\xf3\x89\xe2.\x02X4ni\xc3\xd0\xd0\xd0\x960\x0c7h\xad\x0b\x22f\xa9\xe4Z0??\xdf\x88\xe3\xb8\x9a\x5c\xcb8\x80/\x13\xef]\xb2NrO\x1b\x88\xc8K\xf4B\xc9\xbdi\x00jnn.\xd0ZW\x13b\xf2|\x8bu\xda\x1a@%\xf39\xf9\xe4p\xcd\xd4N|7\x04\xe0'\x87\xe6\x09\x88j\xb5\xca0\x97\x17\x07Z\xac\x13%\xe7\xd7\xb1\xfc-\xe3\xfc\xccW!\xa1\xbb\xad\x945Tb\xf8 Y\xc3\xdc\xf2|?n\xb2NW\xf7\x03\x00\xbd\xbd\xbd\xa8T*\x10z\xf1\xc4:\xbc\x96\x5c'J\xae\xc5O\xb9\xa7\x95gz\xaeD\xae\xd6t\xc5/\xdb\xb5d\x92I&\x99d\x92I&\x99d\x92I&\x99d\x92I&\x99d\xb2z\xe5\xff\x00aZ\x99\xdfy\x8bsr\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x13-\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00`\x00\x00\x00`\x08\x06\x00\x00\x00\xe2\x98w8\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\xe0\x0b\x01\x0c-\x19X\xa7\xec\x1d\x00\x00\x12\xbaIDATx\xda\xed\x5ckl]Uv\xfe\xd6>\x8f}\xee\xbd\xbe\xb6\xe3\xc46\xe04\x13\x98F!My\x0d\x8fR\xd4\xa0\xa0A0H\xa5HS*AE\xa7-R\xd5\xe9h*U\xfdSi$@\x9a\xfei\xabVSQ5\x80*A\xa4\xd2i\x8b\x04\xf4\x07\xa3\xf0\x10\xa5R\x89@E<Z\x1a \xc6vB\x12\x93\x04\xec\xf8\xbe|\x1f\xe7\xb1W\x7f\xf8\xec\xcb\xf6\xf6\xb9\xbe\xd7I\x06Hs\x96t\xb0c\xee\xd9\xf7\x9c\xb5\xd6\xfe\xd6Z\xdfZ\xe7\x00\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\xb2F\x88\xe8\xbc~\x96r\x95\x0e\xaeLf6\x15\xdbWw\xacO\xc8\xe5\xfc\x19\xc1\xf3<\xda\xc0\xe7\xa9\x9f\xa1\xf2\x1d\xb0A\x1b\x00\xe0\xc9\xc9\xc9\xa98\x8e\x87\xb3`&uzr]\xb7y\xea\xd4\xa9\xa3\xc6n\xe1\xdc\x00\xe7\xa8\xfc\xbd{\xf7\x8e\xee\xdd\xbb\xf7\xc7[\xb7n\xfd\xa1V63C)\xb5j\x97\x08!\xc0\xcc8y\xf2\xe4\xab/\xbf\xfc\xf2\x1f\x1e<xpvdd\x04\xd5ju\xcd\xa2n\xae\xd7\x81D\xdc}\xf7\xddt\xf3\xcd7\xff\xe9\xed\xb7\xdf\xfe\xc3r\xb9\x8cf\xb3\xc9\x9dN\x07Q\x14!\x8e\xe3\xae1\x1c\xc7\x81\xe7y(\x14\x0at\xd5UW}\xdb\xf3\xbc\x7f:x\xf0\xe0\xafW\xab\xd5\x053\x8ehqr\xdd\x0e$|\xe7\x9dw\x06SSS\x8f\xed\xda\xb5k\xd3\xd2\xd2\x12W\xabU\xd4j5j4\x1a\xd4l6\xa9\xddnw\x8f0\x0c\x11\xc71\x8d\x8d\x8dED4r\xea\xd4\xa9C\x9f|\xf2\xc94\x00\xb5\xc6\xb2\xb9n\x07\x93\x93'O\xba\xcc\xbc)\x8ec\x84a\xc8\x9dNG+\x1aI\x92tw\x81R\x0aq\x1cS\x92$\xdc\xe9t\x84\xe38\x92\x88v\x02\x18\xcd\xdcZ\xb9j\x07\x13)%\x13\x11+\xa5\x90$\x09i\xdc'\xa2U\x87\x10B\x1f$\x84\x00\x00\xd1\xe9tF\x00\x0ce\xe9;\x8f\x01\x03J\x92$\x99E\x96\xfe\xc9\xcc\x88\xa2\x08D\x04\xa5\x14\xa2(\x023S\x1a\x90\xdd^\xba\xce\x0d0\xa0\xc4q\xdc\xcd\xe9\xcd\x80\xdbh4\xd0l6\xbb\xff\xf6}\x1f\xbe\xefw\xa1\x89\x99\xd7\xad\x88s\x03\x9c\x858\x8e\x03\x22\xc2\xf1\xe3\xc7Q\xaf\xd7Q*\x95 \xa5\x84\x10\x02D\x04\xc7q\xe0\xba.\x5c\xd7EV\xe6s\xd1\xc5\x80\x8d\xf07\x83\xac\x15E\x11>\xf8\xe0\x03\x9c>}\x1a\x9e\xe7\xc1u\xddU\xca\x17Bt\x8d\xa0k\x82\x8bz\x07h\x05\x08!\x06\xb5\x04+\xa5\xd6x/\x11\xa1\xddn\xe3\xe3\x8f?\xc6\xf2\xf22\x82 \xe8*\xdc>\xf4\xdfup\xbe\xa8\x0dP(\x14\xd0j\xb5\xa0\x94\x1a\x98\x1c\x13B\x90R\x8a\xb5\x11\x84\x10\xe8t:8z\xf4(\xc20\x84\xe7y]\x8f\xd7\xd9\x8fi\x8c|\x07\x18\xd2j\xb5\xf4\xafW\x05Ap\x89\x9d:\x1a\x99\x8e\x08\xc3p)I\x92\xffRJq\x10\x04\xd4n\xb7\x19\x00\x94Rh\xb5Zh\xb5Z\xdd\xf3\x5c\xd7]e\x00\xadx\xf3HS\xd1\x8b\xcf\x00\xdas\x89\x88n\xb8\xe1\x86\xe2m\xb7\xdd\xf6\xf7\xd7]w\xdd\xf7\x5c\xd7\x85R\xaa{\x98\x14\xb3\xe38`f\x9a\x9e\x9e\xfe\x9fG\x1ey\xe4\xaev\xbb\xfdi\xd6\x9a\xe9\x0e\xe9zx\x16\xfc\x98\xc6\xb9(\x0d\x90*_0\xb3\xda\xb3g\xcf\x8f\xee\xbf\xff\xfe\xdf-\x16\x8bI\xa3\xd1P)\x87CQ\x14\xe9|\x1d\x8e\xe3\xb0\x94\x12\xc3\xc3\xc3\xb4c\xc7\x8e\xab\x85\x10\xff\xfe\xd0C\x0f]\x0f`\xd96\x82\xe9\xfd\xa6\xd7\xdb\x06\xd0\x06\xba(\x0d\x90\x1aA\x01pv\xec\xd8\xf1\x07\xc5b\x11\x0b\x0b\x0bT\xaf\xd7\xbdv\xbb\x8d8\x8e\x11\xc7q\x97\xc9\xd49|\x14E\xd8\xbe}{x\xcd5\xd7l\xdb\xbd{\xf7o\x1c:t\xe8_`Q\xc9z\xb7h\x0f\xd7^\x9e\xb5\x0b\xcc$\xe0bMC\x87\x98\xb9\x9cr8]\xfeF\x17J&\x14\xe9\xdf\xa3(r\xa4\x94444\xb4\x0b\xc0&\x18\xb4\xbd.\xacl\xaf\xcf\x82\x9fA \xe8b0@7\x88\xea\xc3NO\xed\xc0\x99*\xce\x89\xa2h\x18\xc00\x19Z4!H\x07_;\x0b2\x8dp1C\x90\xeeB\x11\x00\xd2\xf4\x81\x1dH\xf5\xdf\xe38\x06\x11\xd9\x9c\x8fc\xea\xc8\x0c\xd8&\xf9f\xa6\x9c\xba\x1f`\x1a\xe0\xa2OC\xedtS\x17T\xb5Z\xad\xeb\xcd\x85B\x01\x8e\xe3tw\xc8z\x8a\x13B@)\xb5\x0a\x82l\x0a\xc2\x84\xa8\x8b\xde\x00\xda{\x1d\xc7A\x92$\x98\x9f\x9f\xc7\xe2\xe2\x22\xd2\xacg\x95\xc7j2-U\x1ce)_\xc3JV\x0aj\x1a\xc0\xf3\xbc\xbeT\x88{\x81A\xca@x\xdfK\xf9\xedv\x1b\x1f}\xf4\x11\xea\xf5:<\xcf\x83\x94r\x95\xa7j\xe5y\x9e\x97\xe9\xb9&\xec\x98\x06\xd0k\xd8\xca\xd7A\xf8\xff\xc3\x0e\xe89U\x90\x91TpV\xda\xd8n\xb7133\x83N\xa7\x93\x19(M\xe5\xeb\x00\xdb\xcbs\xed\xca\xd7\xfci\xe6\xff\xfd\x02\xf0\x85b\x00\xf1\xc0\x03\x0f\xec\xf2<o\x8a\x99\x1d{@\xca\xf8]\x11\xd1\xf1'\x9f|\xf2#\x00\xac\xe1\x06\x00\xe28\xc6\x91#G\x10EQwQ\x93\xc54=\xd8\xf3<\x13\x82zR\xd1z\x07\x98\xc6\xd0k\x9a;\xe1\x82#\xe3\xb4R\xaf\xb8\xe2\x0a\x9a\x9b\x9b\xe3\x87\x1f~\xf8Ov\xee\xdc\xf9g\x9e\xe7M$I\xd2\xcd\xddM\x08p]\x17RJ4\x1a\x8d\xd3\xbe\xef\xef{\xfc\xf1\xc7\x7f|\xed\xb5\xd7\xf2\xdbo\xbf\x0d\x00h6\x9bh4\x1a\xab\xa0CC\x84V\x94\xa9\xfc^$\x9a\xd9\x05\xeb\x95z\x9a;i\x10\xf9\xda\x19@\xf37sss|\xef\xbd\xf7\xde\xb6g\xcf\x9e\xbf\xd9\xb6m\x1bW\xabUn\xb7\xdb\x08\xc3\xb0k\x00}\xb3A\x10`hh\x08\x9b7o\xde266\xf6\xd0\xfb\xef\xbf\x7f\xe4\xe0\xc1\x83\xffhC\x86^\xdf\xc4ys\x07x\x9e\xd7=z\xc1G\x8f\xfe\xef\x1ac\xea*x\x10\xcc\xfc\xda\xf2\xf7ccc\xbf\xb3e\xcb\x16\xd4\xebuU\xab\xd5P\xa9T\xa8Z\xad\x92\x1e\x07\xd1#!\xcb\xcb\xcb\xb4\xbc\xbcL\x9dN\x07W_}\xb5\xd8\xbd{\xf7oa\xa5\x09\x9e\x99B\xday\xba\xe9\xfd\xda\x00\xeb\xd0\xd4k\xaa`\x13r\xcc\x9f\x834\x82\xbe\xd6\x95p\x92$\xa3i\x07\x8a\xc20\xa4(\x8aV\xd1\x07\x1a\x92\x0c\xc3\x91\x10Bx\x9e7\x01\xe0\x1b\xf6\xfd)\xa5V\xc1\x8fV\x9e\xed\xfd\xebQ\x08YE\x98Y|\x99\xc6\x18d6\xf7k\x19\x84\x8d\xe0\x9a\x98\xca\xd6\x95\xacY\xf4\x987\xae\x95\x17E\x91\x8f\x959\x1ca\xafk\xc2\x8fI=h\xe5\xfb\xbe\xbff'\x9a\xbf\xdb\x85WV\x1ajB\xd0\x05MGS\xc6\xd5k\x05h\xfa@\xff-\x08\x82n\xbe\xcf\xcc\x22\xbd\xb7n\xfa\xaa\x15hW\xaaZq\xba\x003\x0d`\xc6\x81\xac\xf9\x1f\x93\x172\xd7\xd4\xdd\xb2\x0b2\x08\xf7\xb2\x81\x0e\x9eQ\x14u\x87\x5c\xa5\x94(\x16\x8b]\xc5[i\x1fg\x19O\xa7\x98f\xe04\xb1\xdf\xc4\xff\xac,\xa8_\xe6c7b.\xf8\x9e\xb0\xc9X~\xf6\xd9g\xa8\xd5j\x08\x82\x00\xc5b\xb1{\xe3\xa6\x02\x1d\xc71\x8b7\xea\xa5@\xd3k\xb5\xe7K)W\xd1\x07Y\x8a\xb3\xfb\xc0v\x006\xc7Q\xf4\xf5\x7fe\xfd\x80s\x1d\x07\xd1\x98\xaf\x94\xc2\xd1\xa3G1??\xbf\x06\xc3\xf5\xbf\xf5a}'gU\xaf\xe6\xa1\xcf3=8\xeb\xda\xcd\x18`\x07`;\xfb1\x03\xf0W\xba\x03tN? \x8f\xa3\xb2<E)\x85c\xc7\x8eaii\x09\x85B\xa1[$\x99\xdb\xde\xdc\x01zH6K\xb4\xe7\xda\x95\xaf\xb9\x86=rh\xc7\x80^\xadG\xf3\xb0c\xc7W\x12\x03\xd2\x8b\xa0t\x14\x84\x07\x05|\xf3\xb9*\x22\xc2\x89\x13'\xb0\xb4\xb4\xd4UPV\xf6\xa2!D\x1b`\xbdk2\x0d`\xa7\x9f:>d\xe1\xbf\x0dA\xbd\x8a/\xfd\xfft\xb1\xd8/\x15\xfd\xb9\x19@)E\xf7\xdcs\x0fMOO\xffR\x18\x86\xdb\xb2\x1el\xd3\xf8\xe8\xban{\xf7\xee\xdd\x07\x9f\x7f\xfe\xf9\xd0\xfc\x8cR\x0a\xb5Z-\xb3\xe9a\x06P\xfdS+/\xcb\xeb\xb2\x98K{\xf7\x0cR\xbdfU\xbff\x06\xe4\xba\xee\x9aa\xae/\x9d\x0du]\x97n\xbc\xf1\xc6\xe1\x9bn\xba\xe9/\xee\xbb\xef\xbe\xef{\x9e\xb7*\x8f\xb73\x10\xc7q0;;\xfbi\xbb\xdd\xfe\xfd\x03\x07\x0e\xbc\x9c\xee\x04\x00`\xadTS\xf9f\xe7\xc9\xf4~3n\xf4b0\xcd\xef\xd7J\xd7\x01\xd8\x0c\x9e\xb6\xe2\xcc^p/\xef\xd7\xff^\xaf\x19\xf4e\x18\x80\xe28\xe6[o\xbd\xf5\x8f\xee\xb8\xe3\x8e\xef\x0f\x0d\x0d\xa9F\xa3\x81v\xbb\xcdI\x92\x90\xa9\xb8R\xa9\x84r\xb9\xccccct\xcb-\xb7\x5c\x16\x04\xc1?\xbf\xf4\xd2K\xbf\xa6\x94\xfa0\xf56\xb2\xb3\x17\xf3\x86\xcd\xe0\xe9\xfb\xfe*\xceg=\xcf5\xcf\xd7\x99\x8f\x867=\x92\xa8\x8d\x95\x15GL\x03\xda\x15p\xaf\xe0\xfdefA\x0c\x00###\x0f\x0c\x0d\x0d\xa1R\xa9\xe0\xcc\x993bqq\xd1\xa9T*\xa2Z\xad\x8aj\xb5*\x1a\x8d\x86>\x9cF\xa3!\x8a\xc5bt\xfd\xf5\xd7\x0f\xed\xdd\xbb\xf7\xbb\x00|\xb3\x09c\xe3\xb6\x9d\xbfk\x18\x1a\x04:z\xc1\x97\xcd\xffd).+\xf5\xec\x95~f\x15s_j\x1a\xca\xcc\xc3I\x92 \x0cC\x98\x8f\xf2\xd8\x94B\xaa\x14ff\xe1y\x9e\xe3\xba\xeev\x00\x13\xe9\x1a\xac\x8b\xac\xac\x02\xc8\x84 \xbd\xf5\xf5\x1cg\xbf\xfc\xdf\x0c\xbcY\x06\xcc\xca\x82L\xe5g\x1d\xfa\x1a6\x92~\xff\x5c\xeb\x80t\xd6\x86\xf4\xb6\xb6\xf9\x1b#\xb0R*\x88\xa2\xa8\x04`X\x1b\xc0\xe6]\xb2\x8a/\x93>\xee\x15\xf4\xec\xe0\x99\x95\xfd\xd8\x8f\x9bf%\x0cYF0\x13\x04s\xdc\xf1+\xcd\x824\x87`\x06/\x22B\xa7\xd3\xe9>\xd4&\x84@\xa9T\xb2so\x81\xf4\xe9Mm\x14=\xad\xd0\x0b~\xd6\xcb\xdfM\x083\x99O\x93\xfb1\xab\xdfu\xab\xd6\xd4xJ\xa95\x8d\x1c\xb3\x803\xe6R\xbf\xba:\xc0l\xdb\x01@\xa5RA\x14E\x90R\xa2T*\xa1P(\xc0\xf7}\x04A\xb0\x8a\x00[/\x83\xc9b.\xed\x0ax\xbdQ\x12\xb3\xf253\xa0A\xa9cM\xbc\xe9`|6\xf4\xf3\x97f\x00s\xa6~nn\x0e\x00044\xb4\x0a\xbb\xa5\x94\xab\xf0;K\x81\xe6t\x99\xd9<\xd1\x87~4\xc8\xf4\xb8,\xfc6w\x80\xe9\xfd&\xfc\xf4\x9b\xe1\xd1\xd7c>\x90\xddo\x04q\xc3\xa3\x89\xe7\xf3\xdd\x05\xadV\x0b333\x08\xc3\xb0\xabh\xad\x08\xad|\xad\xc0^9\xb3\xc9\xe1\xd8\xf4\x83\x09?Y\x8d\xfa,C\xda\xd8?(oo\x1bR\xc7\x1d\xbb\xfd\xb8Q\xfe\xcb\xcd\xca!3g;\xfa\x5c\x9b\xfd\xf1$I077\x878\x8e\x11\x04\xc1\x9a\xe2KJ\xd95B?\xf8\xd1;\xc4\xc4oS\x81\xfd\x9eD\xb4\x15\x97u~\xbf5L(3\xfb\xca&\xfd\xac\x93\x8d\x0dQ6k<\x05\xc0urC\xca\x07\x00~\xd0\xfaC\x18\x86h\xb7\xdb\x99s7\xa6\x01\xfaM\x0f\x98m\xc3,\x05f\xe5\xd9Y\xbb\xc8\xc6~\xfb\xfc~\xf9\xba6P/\xf2MC\xd8Y\xc7\x00\xed\xc2\x09\x80\xb7;\xc0]\xc0wvJ\xfc\xb1\xf0\x9cM\x00\x13a\xe5\xbf\xd4\xbd)\xb0\x82#D=<\xf5\x1f\x8c\x7fx\x12\xf8\xd9\x03\x00=\x9d\xda\xce\xee\x1c\xd9\xe4\x99\xf6\xfe\xf5pW\xc7\x11\x9d\x01\xd9\xf8o\xc3\xcfz)\xa4.\x92l\xf81\xf9\xfa~\xdekfs\xd6$\xf5\xba4\xc8@\x06H\xc7\x88i\x1c\xc0\x83\xdb&\xee\xbd\xeb[\xd7\xfd\xeb\x96+\x7f\x99T\x14B\x85!\x5c\xc7\x81\xe7\xadd-A\xb1\x80Ri\x18\x85\xb1Q\xb4]\x817\x9fx\xec\x9e?\x7f\xed\xcd\x1f<\x0d<6\x08~\x9b\xf8\x9f\xf1&\xaa\xcc\xe2G+Os6\xfag\xd6\x8d\xdb\x06\xb1\xd70\x8b\xafA\xd3E\x9b\x8e6w\x80Y#l\x985\xb6\xf1\xff\xc6\xa2\xe7\xef\x9c\x9c\xf8\xab\xed{\xbeMq\x12\xc7\xcb\x95%\xd5\xaaUU\xabVU\x9dzM\x85\xcbu\x95\xb4\x9a\x8a\xdbM\xc5\xad&\x17F6%\xb7\xfd\xed\xdf\xc5\x0f\xee\xbe\xe2a\x00\x97g\x05?3\x00\x9a\xdeo\xc3O\x96\xe7fU\xaf\xf6\xee\xc9\xaa|\xb3\xd2G3p\xeb\xf3\x07Q~\xafXbr\xffg\xdb|\xb2M\xc6\x87Cui\xe0\xf9\xdb\xdb\xcbun-.8\x9djED\x8d\x9a\x88\x9b\x0d\xa1:M\xc1a(\x10F\x82\xe2HP\x92PR;\xe3\xb0\xeb\xd2/\xdc\xf4+\xc1\xe5\xc0\xaf\x82\xc8\xefU\xbe\x9b\xca\xd3\x81\xb9\xdf\x0d\xdb\xd4\x83i\x88~\x85\x93)Y\xd9\x8f\xf6\xdcA\xd60;bf6\xb7^\x01xVY\x90\x02\x5c\x06\x83\xa3\x88\x92(\x82Jb\xb8\xae\x07\xcf\xf3! \x80\xb0\x03t\x5cP(\x818J\x9f~PL \x97\x81\xad)\x8d\xb0\xa0\xa9d\xbb\x002\x03\xb0\xe6\xfc\xd7\xbbi\x13s\xcd\xdc}\x90\xec\xc7\x86 \x00k\xb8\x9fAw\x809\x01a\x16b\xe7\xfa^>3\x08\x13\xeb\xec\x93\x08\x9c*&(\x14\x10\xd6\xeb\xa8\x9c\x9e\x87$\x02\x8d\x8c\xa28q\x09\xa8T\x04X\xadDo\xc7!&P\x02\x04\x00\xa4^2kj@+\xdfn\x5c\xaf\xb7\x03t\xcems?\x1b\x09zv\x0c\xd8\xe8\xf9\xe6p\x80yM\xe7\xda\xf7v3\x12z\x023H8\x88\xa3\x0eN\xbd\xf7.:K\x8b\x18\x1d\x1dE\xf1\x92K\xe1\x07\x05\xc8B\x01\x9e\x0c@R\x82e\x00\xb8r\x85\xb7Y=\x89\xc0v\xe7\xc8.\xbe\x06\x9a\x1c\xcb\x98\x5c\xd3\xb5\xc3F\xbcWC\xd6FwO\x16\x1c\x9a\xfde\x9d\xfb\x9f7\x08\xe2\xd4\x0a\x95\x13Gq\xf8\xb5W\x90,71\xb6y\x0c\x85R\x09\xbe\x94\xf0\xa4\x84\xe7K\x08)\xc1\xd2\x07\xa4\x04<\x0f`]:|Q\x93e\xe1\xbf>\xf4\xc5\xf73\x84\x86\x1e\x13\x82\xec\xc7?\x07\xc9`t\xc04\xe7\xff\xcff<\xc6~\x04\xf5\x5c\x94\x9f\xcd\x051\xa3\xf1\xd9i\x1c\xabU\x90\x84\x11\x82\xe2\x0ai\xe6\xf9>|\x19\xc0\x97\x12\xbe\x94\x80\xf4\xc1\x81\x0f\xf8\x12H\x1b\xf0+\x07\xafj\xa2(\xa5\xd6`\xffF<p\xbd\xc6\xf9\xa0i\x9f\x09\x19z\xf7\x9dM\xe1d?\xa0}>\xde\xcb\xba\x16\x82\x98\x11\xb6Z`\xdf\x87\xefy\xf0\xdd\x95\xfc\xdf\xf7%\xbc@\xc2\x95\x01\x9c\x14~\xc8\x93P\xbe\x04H\xe0\x8b\xf7\xd1}\xb1\x034qe{\xff\xa0\xf8k\x92^6\xf5\xbc\xd1\x9b7\xb9\x9bs\xc9Zt\x06t\xde\xfa\xe7\xebF|\xcf\x85\xeby\xf0\xa4\x0fOJ\xf8\xbe\x84\x94\x01\x5c\xe9\x83\xa5\x5c\x81\x1f\xd7[\x09\xdf=.V\xdf\xbc\xa6\x9d\xfbq?Y1\xc0\xae~7\xaa|\xbd\x1b5{y6\x9ekS\xe2gK\xbe\xadg\x00\xee\xb2\xa1\x8c\xb5m?\xe9\xc3\x93\x01<\xdf\x07I\x09%}P\x10\x00\xaec\x9d\xb9v\xbb\x9a\xc1w\x83\x1e\xc8v\xfbp\x83\x0a\xec&\x04v\xdf`\xd0\xef\xef\xd5\xdf0\x99\xd7\xf5\xd6\x1a\xb8#\xa6?\xc6\x04\x90\xb3\xe2\xfd^\x8a\xfd+\x10\xb4\x82\xffn \x81\xc0\x07\xf9\x12\xe4\x07`!\xc0\xc4`\xfeb\x09\xfd\xc5i\xa5\xcb\x9e\xe7\x91\xdd\xbb\xdd\xc8\x967\xe9\x83~\x9e\xa7\xc7Y\xcck\x11B\x90\xfe\xee\x0d\xb0\x96l+\xb1\x17[;\x80\xf2\xb9\x17\xdb\x9f\x11\x03\xc0\x82\x04d\xa1\x04\x8a\x22\x0e|\x8f\x82b\x09~\xb1\x08\xbfP\x84+\x0b\xe0\xa0\x00\x0e$H\xca\x15V\x0e\x82\xc9uV}\x81\x10\x82\x83 \x00\x11Q\xa9TB\x10\x04\xab\xb8\x9f\x8c\x0bg\xfb\x86\x88\x88\xd2\x9d\xc3f\xfa8\x80\xe2\xcc\xc5Y\x08\xc1\x1a\xba\x06\xe1l\xf4t\x9en\xab\x12\x11\x0a\x85\x02\x13\x11o\x04z\xd2u\xcc\xeb\xe1\x9eT\x84\xfe\xc46\xc1\x9f\xb6:\xe1bat\x8c\x87\xc6\xc6Q\x1a\xdd\xcc\xc1\xc8&\x04\xc3\xa3\xf0\xcbe\xa0\x5c\x86\x0a\x0a\xe0\xa0\x04\xe5\xb8H\x1c\x8f\x85\x0cp\xfc\x83\xff\x8dN\x00K\x00\xbb\x00\xd0\xe9t\x0e;\x8e\x83\x91\x91\x11.\x14\x0a(\x16\x8b\xf0<o\xcd\x8b1\xf4\xc3\x17\x00xqqQ\xcd\xce\xce.\xe8\x0b\x8d\xa2\xe8\x9dZ\xad\x86\x91\x91\x11\x04A\xd0}o\xa7}\xbe\xb9F\xb3\xd9\xe4\x99\x99\x99E\x00!\xad\xd0\x22\xf5\xa5\xa5\xa5\xe3\xe9\x9b\x0d\x99\x99\xd9>\xd7^\x87\x88p\xfa\xf4i5;;\xbb\xa8\xf5\x14\x04AT\xaf\xd7\x8f4\x9bM\xacw\xbe\xb1\x0e\x13\x11/,,D\xc7\x8e\x1d[\xea\xd5^q,\xc0\x14;\x19\xb1Jb\x9e\x90\xce\x1d\x97\x5c\xfeM*o\x19\xc7\xf0\xf8\x04\xca\xe3\x13\xf07\x8fCm\x1e\x03\xc66\x81G6\x81\x0b%\xc4B\xe0\xfd\xbf\xfeK\xfa\xc9\xb3?{w\x06\xf4\x0a\x81\x8f\x01\xa8\x8d\x8f\x8f\x9f\x18\x1f\x1f\xff\xedm\xdb\xb6\xb9ccc\x5c*\x952\xdfL\x92\x1e<??\xef\xec\xdb\xb7\xef\xc4+\xaf\xbc\xf2o\x00f\x01\x9c\x89\xe3\xf8\xc3\xa9\xa9\xa9\xfb.\xbd\xf4\xd2\xd1>\xe7\x93R\x8ak\xb5\x9a\xd8\xbf\x7f\x7f\xe3\xa9\xa7\x9ez6\x8e\xe3\x0f\x88h\x01@499\xb98::\xfa\xdd\xc9\xc9I\xa1!(\xcb\x88\xfaZ\xa6\xa7\xa7\xc5\xa3\x8f>:\xfd\xce;\xef\xbc\x00\xe0\x08\x80\xea\xa1C\x87\x92\xad[\xb7\xb6\xca\xe5\xf2=\x13\x13\x13\xd4o\x9d$IxffF\xec\xdb\xb7o\xfa\x8d7\xde8\x00`\x0e@\xa5_?@\xbd\xc8\x00\x9a\xc9O\xda\xff}8\xfa\xe6\xe9\xc5{\xcbC\xe5)8\x8e\xe7z\x9ep<\x0f\xe4\xb9\x10\xae\x0br]09<\x7f\xf2\xd3\xd6\xab\x1f\xce\x1e\xfeO\xd0\x8b\x00\x9fd\xa0\x16\x04\x01=\xf7\xdcs\xaf)\xa5~svv\xf6\x07\xe3\xe3\xe3\xbf\x08\xa0\xb02e\x22\xd6L\xb0U*\x95\xce[o\xbd5\xff\xec\xb3\xcf\xbe\x98^\xe8\x92\x10\x02\x87\x0e\x1d\xfa|\xff\xfe\xfd\xdf9~\xfc\xf8\x8f\xa6\xa6\xa6\xbe\xe58\xceP\xfa\xac0\xd9\x05\xd0\xf2\xf2r|\xf8\xf0\xe1\xa5g\x9ey\xe6\xd5v\xbb\xfd\x1e\x11\x9da\xe6v\xb9\x5c\xa6\xa7\x9f~\xfa\xa7I\x92x\xef\xbd\xf7\xde\xefm\xda\xb4i\x9bRJ\x12\x91\xc8\x18C\xe4\x85\x85\x85\xce\xeb\xaf\xbf~\xe4\xc0\x81\x03\x07\x00\xcc\x03\xa8\x01H:\x9d\x0e\x9ex\xe2\x89\x9f\xd6\xebu\xf1\xee\xbb\xef~ottt;3\xfb\x1aElH\xfa\xfc\xf3\xcf[o\xbe\xf9\xe6'/\xbc\xf0\xc2\x01\x00\xc7\xd2ux\xa3-\xe0\xad[\x81+\xdb\xc0\x16\x06$\x7f\x91\xea\x10\x01\xcc\x00/\x01\x1d\x80\xea\x00\x7f\x0e\xe0(\x80\xc5\xb4\xaf\xa3eljjjW\x18\x86\x971s!}|\x88\xf5\xdb\xac\x00P\xadV\x0b\xa3(ZN\xcf=\x06\xe0$\x80\xc8X\xa3011q%\x11}#\x8e\xe32\x00\xc7\xe0\x91\x98\x88\xa8\xd5j\xc5\xcb\xcb\xcb\xcd\xd4\xcb\xe6\x01\x1c\x07\xd0\xb4\xeeg\xf2\xb2\xcb.\xbb2\x8a\xa2I\xa5T\xc1x\x04\x8a\xd2kA\xa5R\x09\x93$i\xa4\xd7r\x14\xc0g\x00\xec\x91\xeb\xc9\xf4\x9e&\x999\xd0\xfe\x9b\xde\x9b\x02@KKK\x1d\xa5T#%&?\xe9\xb1\xce\xba\x06\xa0\x14\xa2dzxvjg|6\x02\xd0N\x0f\xa5' \x1a\x8d\x86\x8e3\xd28\xd0c\x9d8=\xbf\x85\xb5o\x19\xd7\xcf|\x15\xb02\xb6(2\xd6\xa0\xd4\xf0\x9dt\x8d\xd8\xbaF}?^\xba\xce\x86\xee\x07\x00\xca\xe52\xea\xf5:\x0c\xbd\x04\xc6:Y\xbd\xf18\xbd\x96v\xc6=\xf5O\x9e\xcf\xc7\x5c\xd0\xd7a\x9d\xaf\xd3\xb5\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4\x92K.\xb9\xe4r\xf1\xca\xff\x01xH\x1fwM~\x81c\x00\x00\x00\x00IEND\xaeB`\x82"
+qt_resource_name = b"\x00\x06\x07\x03}\xc3\x00i\x00m\x00a\x00g\x00e\x00s\x00\x12\x0a v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x002\x00.\x00p\x00n\x00g\x00\x12\x0a\x22v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x004\x00.\x00p\x00n\x00g\x00\x12\x0a#v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x003\x00.\x00p\x00n\x00g\x00\x12\x0a%v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x005\x00.\x00p\x00n\x00g\x00\x12\x0a&v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x000\x00.\x00p\x00n\x00g\x00\x12\x0a)v\x87\x00i\x00c\x00o\x00n\x00_\x00s\x00i\x00g\x00n\x00a\x00l\x00_\x000\x001\x00.\x00p\x00n\x00g"
+qt_resource_struct = b"\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\x00\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00<\x00\x00\x00\x00\x00\x00\x00\x00\x14\x8a\x00\x00\x00f\x00\x00\x00\x00\x00\x00\x00\x00,\x99\x00\x00\x00\x90\x00\x00\x00\x00\x00\x00\x00\x00C\x04\x00\x00\x00\xba\x00\x00\x00\x00\x00\x00\x00\x00]\x1c\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x00\x00\x00o\x85"
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
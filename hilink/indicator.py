@@ -1,6 +1,45 @@
 from PySide import QtCore, QtGui
-from PySide.phonon import Phonon
-from hilink.settings import SettingsDialog
+from hilink import resources
+from hilink.traffic import formatRate
+
+
+# signal level -> QIcon, filled on first use
+_icons = {}
+
+
+def _phonon():
+    """Phonon is slow to import and needed only to play a sound"""
+    from PySide.phonon import Phonon
+    return Phonon
+
+
+def signalIcon(level):
+    if not _icons:
+        resources.loadIcons()
+        for i in range(6):
+            _icons[i] = QtGui.QIcon("://images/icon_signal_0{}.png".format(i))
+    return _icons.get(level, _icons[0])
+
+
+def sparklineIcon(level, rates):
+    """Signal icon with download rate sparkline along its bottom"""
+    pixmap = signalIcon(level).pixmap(64, 64)
+    if len(rates) < 2:
+        return QtGui.QIcon(pixmap)
+
+    width, height = pixmap.width(), pixmap.height()
+    peak = max(rates) or 1.0
+    step = float(width - 1) / (len(rates) - 1)
+    line = QtGui.QPolygonF([
+        QtCore.QPointF(i * step, height - 3 - rate / peak * height / 3)
+        for i, rate in enumerate(rates)])
+
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtGui.QPen(QtGui.QColor("#2a82da"), 4))
+    painter.drawPolyline(line)
+    painter.end()
+    return QtGui.QIcon(pixmap)
 
 
 class ModemIndicator(QtGui.QSystemTrayIcon):
@@ -9,19 +48,27 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
     # store last message count
     _lastMessageCount = 0
 
-    # status, messages, params
-    _status = [""] * 3
+    # status, messages, params, traffic
+    _status = [""] * 4
+
+    # draw download rate over signal icon
+    sparkline = False
+
+    _toolTip = None
+    _level = None
+
+    # created on the first notification
+    player = None
 
     def __init__(self, modem):
         super(ModemIndicator, self).__init__()
         self._modem = modem
+        # recent download rates, oldest first
+        self._rates = []
         self.signalLevelChanged(0)
         menu = self.createMenu()
         self.setContextMenu(menu)
 
-        self.player = Phonon.createPlayer(Phonon.MusicCategory)
-        self.player.stateChanged.connect(self._playerLog)
-
     def createMenu(self):
         menu = QtGui.QMenu()
 
@@ -33,11 +80,18 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
         self.rebootAction.triggered.connect(self._modem.reboot)
         self.rebootAction.setVisible(False)
 
+        # read from sms cache, no request to modem
+        self.messagesMenu = menu.addMenu("Messages")
+        self.messagesMenu.aboutToShow.connect(self.fillMessagesMenu)
+
         menu.addSeparator()
 
         self.settingsAction = menu.addAction("Settings")
         self.settingsAction.triggered.connect(self.showSettingsDialog)
 
+        self.diagnosticsAction = menu.addAction("Diagnostics")
+        self.diagnosticsAction.triggered.connect(self.showDiagnostics)
+
         menu.addSeparator()
 
         quitAction = QtGui.QAction("Quit", menu)
@@ -47,10 +101,29 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
         return menu
 
     def showSettingsDialog(self):
-        dialog = SettingsDialog(self._modem.ip, self._modem.interval)
+        from hilink.settings import SettingsDialog
+        dialog = SettingsDialog(self._modem.ip, self._modem.intervals,
+                                self._modem.adaptive)
         if dialog.exec_() == SettingsDialog.Accepted:
             self._modem.ip = dialog.ip
-            self._modem.interval = dialog.interval
+            self._modem.intervals = dialog.intervals
+            self._modem.adaptive = dialog.adaptive
+
+    def fillMessagesMenu(self):
+        self.messagesMenu.clear()
+        cache = self._modem.poller.smsCache
+        messages = cache.latest(self._modem.ip) if cache is not None else []
+        for phone, date, content in messages:
+            if len(content) > 40:
+                content = content[:40] + "..."
+            self.messagesMenu.addAction(
+                "%s %s: %s" % (date, phone, content)).setEnabled(False)
+        if not messages:
+            self.messagesMenu.addAction("No messages").setEnabled(False)
+
+    def showDiagnostics(self):
+        QtGui.QMessageBox.information(None, "Diagnostics",
+                                      self._modem.diagnostics())
 
     def quit(self):
         self.hide()
@@ -62,12 +135,29 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
         else:
             self._modem.disconnect()
 
+    def commandFinished(self, command, succeeded, error):
+        if not succeeded:
+            self.showMessage("%s failed" % command.capitalize(), error,
+                             QtGui.QSystemTrayIcon.Warning)
+
     def signalLevelChanged(self, level):
-        iconName = "://images/icon_signal_00.png"
-        if level in range(1, 6):
-            iconName = "://images/icon_signal_0{}.png".format(level)
+        if level != self._level:
+            self._level = level
+            self._updateIcon()
+
+    def throughputChanged(self, upload, download, history):
+        self._status[3] = "Download: %s\nUpload: %s" % (formatRate(download),
+                                                      formatRate(upload))
+        self._updateToolTip()
+        if self.sparkline:
+            self._rates = [rate for _, rate in history]
+            self._updateIcon()
 
-        self.setIcon(QtGui.QIcon(iconName))
+    def _updateIcon(self):
+        if self.sparkline:
+            self.setIcon(sparklineIcon(self._level, self._rates))
+        else:
+            self.setIcon(signalIcon(self._level))
 
     def needNotify(self, messageCount):
         if messageCount > 0:
@@ -77,6 +167,7 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
         else:
             self._status[1] = ""
         self._lastMessageCount = messageCount
+        self._updateToolTip()
 
     def statusChanged(self, status, operator):
         if status == "No HiLink Detected":
@@ -100,6 +191,7 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
             self._status[0] = "%s\n%s" % (operator, status)
         else:
             self._status[0] = status
+        self._updateToolTip()
 
     def signalParamsChanged(self, params):
         tip = []
@@ -107,13 +199,88 @@ class ModemIndicator(QtGui.QSystemTrayIcon):
             tip.append(value)
 
         self._status[2] = "\n".join(tip)
-        self.setToolTip("\n".join(filter(None, self._status)))
+        self._updateToolTip()
+
+    def _updateToolTip(self):
+        toolTip = "\n".join(filter(None, self._status))
+        if toolTip != self._toolTip:
+            self._toolTip = toolTip
+            self.setToolTip(toolTip)
 
     def _playSound(self):
+        Phonon = _phonon()
+        if self.player is None:
+            resources.loadSounds()
+            self.player = Phonon.createPlayer(Phonon.MusicCategory)
+            self.player.stateChanged.connect(self._playerLog)
+
         source = Phonon.MediaSource("://sounds/unread_message.wav")
         self.player.setCurrentSource(source)
         self.player.play()
 
     def _playerLog(self, newState, oldState):
-        if newState == Phonon.ErrorState:
+        if newState == _phonon().ErrorState:
             print(self.player.errorString())
+
+
+class FleetIndicator(QtGui.QSystemTrayIcon):
+    """Tray indicator for many modems, shows the worst of them"""
+
+    def __init__(self, fleet):
+        super(FleetIndicator, self).__init__()
+        self._fleet = fleet
+        self.fleetChanged(0, 0, len(fleet.states))
+        self.setContextMenu(self.createMenu())
+
+    def createMenu(self):
+        menu = QtGui.QMenu()
+
+        # filled on demand, rebuilding it every tick is too expensive
+        self.modemsMenu = menu.addMenu("Modems")
+        self.modemsMenu.aboutToShow.connect(self.fillModemsMenu)
+
+        menu.addSeparator()
+
+        quitAction = QtGui.QAction("Quit", menu)
+        quitAction.triggered.connect(self.quit)
+        menu.addAction(quitAction)
+
+        return menu
+
+    def fillModemsMenu(self):
+        self.modemsMenu.clear()
+        # offline and weak modems first
+        states = sorted(self._fleet.states,
+                        key=lambda state: (state.online, state.level))
+        for state in states:
+            modemMenu = self.modemsMenu.addMenu(
+                "%s: %s" % (state.ip, state.status))
+            modemMenu.setIcon(signalIcon(state.level))
+            if not state.online:
+                modemMenu.setEnabled(False)
+                continue
+
+            modemMenu.addAction(state.operator).setEnabled(False)
+            modemMenu.addAction("Signal: %d/5" % state.level).setEnabled(False)
+            if state.unread:
+                modemMenu.addAction(
+                    "New Messages: %d" % state.unread).setEnabled(False)
+            modemMenu.addSeparator()
+
+            rebootAction = modemMenu.addAction("Reboot")
+            rebootAction.triggered.connect(
+                lambda ip=state.ip: self._fleet.reboot(ip))
+
+    def commandFinished(self, ip, command, succeeded, error):
+        if not succeeded:
+            self.showMessage("%s %s failed" % (command.capitalize(), ip),
+                             error, QtGui.QSystemTrayIcon.Warning)
+
+    def fleetChanged(self, worstLevel, offline, total):
+        self.setIcon(signalIcon(worstLevel))
+        self.setToolTip("Modems: %d\nOffline: %d\nWorst signal: %d/5" %
+                        (total, offline, worstLevel))
+
+    def quit(self):
+        self.hide()
+        self._fleet.finish()
@@ -1,17 +1,12 @@
 from __future__ import print_function
 from PySide import QtCore
-from xml.etree import ElementTree
 from collections import OrderedDict
-import socket
-
-
-try:
-    from urllib2 import build_opener, URLError
-    from urlparse import urljoin
-except ImportError:  # >= 3.x
-    from urllib.error import URLError
-    from urllib.parse import urljoin
-    from urllib.request import build_opener
+from hilink.client import ModemClient, STATUS, SIGNAL, changedFields
+from hilink.commands import CommandQueue, CONNECT, DISCONNECT, REBOOT
+from hilink.transport import TransportError
+from hilink.poller import ModemPoller
+from hilink.recording import Recorder, ReplayTransport
+import time
 
 
 class Modem(QtCore.QObject):
@@ -20,19 +15,50 @@ class Modem(QtCore.QObject):
     statusChanged = QtCore.Signal(str, str)
     signalParamsChanged = QtCore.Signal(OrderedDict)
     unreadMessagesCountChanged = QtCore.Signal(int)
+    # number of new messages stored in sms cache
+    messagesSynced = QtCore.Signal(int)
+    # smoothed upload and download rates, bytes per second, and the recent
+    # (upload, download) rates for sparklines, oldest first
+    throughputChanged = QtCore.Signal(float, float, list)
+    # command, succeeded, error message
+    commandFinished = QtCore.Signal(str, bool, str)
+    _commandRequested = QtCore.Signal(str)
     _intervalChanged = QtCore.Signal(int)
+    _ipChanged = QtCore.Signal(str)
+    _finishRequested = QtCore.Signal()
     finished = QtCore.Signal()
 
-    def __init__(self, ip, interval):
+    def __init__(self, ip, interval, poolSize=len(ModemClient.sections),
+                 intervals=None, adaptive=True, historyPath=None):
         super(Modem, self).__init__()
-        self._opener = build_opener()
+        self._ip = ip
+        self._client = ModemClient(ip, poolSize)
+        # smsCache, broadcaster, exporter and capabilityCache are set on it
+        self.poller = ModemPoller(self._client, intervals, adaptive,
+                                  historyPath)
+        self._scheduler = self.poller.scheduler
+        # last snapshot sent to listeners
+        self._emitted = None
 
         self._requestTimer = QtCore.QTimer(self)
+        self._requestTimer.setSingleShot(True)
         self._requestTimer.timeout.connect(self._updateInfo)
 
-        self.ip = ip
-        self.interval = interval
+        self._diagnosticsLog = None
+        self._dumpTimer = QtCore.QTimer(self)
+        self._dumpTimer.timeout.connect(self.dumpDiagnostics)
+
+        # commands are run on the monitor thread, not on the caller's one
+        self._commands = CommandQueue()
+        self._commandRequested.connect(self._runCommand)
+
+        if interval:
+            self.interval = interval
         self._intervalChanged.connect(self._updateTimerInterval)
+        # the client is only touched by the monitor thread
+        self._ipChanged.connect(self._changeIp)
+        # closes files the monitor thread may be writing to
+        self._finishRequested.connect(self._finish)
 
     @property
     def ip(self):
@@ -40,181 +66,194 @@ class Modem(QtCore.QObject):
 
     @ip.setter
     def ip(self, value):
+        if value == self._ip:
+            return
         self._ip = value
-        self._baseUrl = "http://{}".format(value)
+        self._ipChanged.emit(value)
 
-    def _updateTimerInterval(self, value):
+    @property
+    def poolSize(self):
+        return self._client.poolSize
+
+    def connectionStats(self):
+        """Number of new and reused keep-alive connections"""
+        return self._client.connectionStats()
+
+    def tokenStats(self):
+        """Number of token cache hits and refreshes"""
+        return self._client.tokenStats()
+
+    def diagnostics(self):
+        """Per endpoint request statistics as text"""
+        text = self._client.stats.format()
+        capabilities = self.poller.capabilities
+        if capabilities is not None and capabilities.unsupported:
+            text += "\nNot supported: " + ", ".join(
+                sorted(capabilities.unsupported))
+        return text
+
+    def diagnosticsData(self):
+        return self._client.stats.toDict()
+
+    def setDiagnosticsLog(self, path, interval=300):
+        """Append diagnostics to path every interval seconds"""
+        self._diagnosticsLog = path
         # QTimer uses milliseconds
-        self._requestTimer.setInterval(value * 1000)
+        self._dumpTimer.setInterval(interval * 1000)
+
+    def dumpDiagnostics(self):
+        if not self._diagnosticsLog:
+            return
+        with open(self._diagnosticsLog, "a") as log:
+            log.write("%s %s\n%s\n\n" % (
+                time.strftime("%Y-%m-%d %H:%M:%S"), self.ip,
+                self.diagnostics()))
+
+    def record(self, path):
+        """Append every raw response of the modem to the log at path"""
+        self._client.recorder = Recorder(path)
+
+    def replay(self, path, speed=1.0):
+        """Answer requests from the log at path instead of the modem"""
+        self._client.setTransport(ReplayTransport(path, speed))
+        self._scheduler.speed = speed
+        self._intervalChanged.emit(self.interval)
+
+    def _changeIp(self, value):
+        self._client.ip = value
+        self.poller.deviceChanged()
+        if self._requestTimer.isActive():
+            self._scheduleNext()
+
+    def _updateTimerInterval(self, value):
+        self._scheduler.reset()
+        if self._requestTimer.isActive():
+            self._scheduleNext()
 
     @QtCore.Property(int, notify=_intervalChanged)
     def interval(self):
-        return self._interval
+        """Interval of signal and status requests"""
+        return self._scheduler.intervals[SIGNAL]
 
     @interval.setter
     def setInterval(self, value):
-        self._interval = value
+        intervals = dict(self._scheduler.intervals)
+        intervals[SIGNAL] = intervals[STATUS] = value
+        self._scheduler.intervals = intervals
         self._intervalChanged.emit(value)
 
-    def finish(self):
-        self.finished.emit()
-
-    def connect_(self):
-        msg = """<?xml version="1.0" encoding="UTF-8"?><request><dataswitch>1</dataswitch></request>"""
-
-        self._post("/api/dialup/mobile-dataswitch", msg)
-
-    def disconnect(self):
-        msg = """<?xml version="1.0" encoding="UTF-8"?><request><dataswitch>0</dataswitch></request>"""
-
-        self._post("/api/dialup/mobile-dataswitch", msg)
-
-    def reboot(self):
-        msg = """<?xml version="1.0" encoding="UTF-8"?><request><Control>1</Control></request>"""
-        self._post("/api/device/control", msg)
+    @property
+    def intervals(self):
+        """Seconds between requests of every endpoint"""
+        return dict(self._scheduler.intervals)
 
-    def _post(self, section, msg):
-        response = self._opener.open(urljoin(self._baseUrl, section),
-                                     data=msg.encode()).read()
+    @intervals.setter
+    def intervals(self, value):
+        self._scheduler.intervals = dict(value)
+        self._intervalChanged.emit(self.interval)
 
-    def _getXml(self, section):
-        try:
-            response = self._opener.open(urljoin(self._baseUrl, section),
-                                         timeout=1).read()
-        except (URLError, socket.timeout):
-            return ElementTree.Element("")
-        else:
-            return ElementTree.fromstring(response)
+    @property
+    def adaptive(self):
+        return self._scheduler.adaptive
 
-    def _getTokens(self):
-        """Get access tokens"""
-        try:
-            xml = self._getXml("/api/webserver/SesTokInfo")
-        except (URLError, socket.timeout):
-            return ("", "")
-        else:
-            return (xml.findtext("SesInfo", ""), xml.findtext("TokInfo", ""))
-
-    def _updateTokens(self):
-        session, postToken = self._getTokens()
-        self._opener.addheaders = [("__RequestVerificationToken", postToken),
-                                   ("Cookie", session)]
-
-    def getSignalLevel(self, xml):
-        return int(xml.findtext("SignalIcon") or "0")
-
-    def getNetworkTypeEx(self, xml):
-        types = {"0": "No service", "1": "GSM", "2": "GPRS", "3": "EDGE",
-                 "21": "IS-95A", "22": "IS-95B", "23": "CDMA 1X",
-                 "24": "EVDO Rev.0", "25": "EVDO Rev.A",
-                 "26": "EVDO Rev.B", "27": "Hybrid CDMA 1X",
-                 "28": "Hybrid EVDO Rev.0", "29": "Hybrid EVDO Rev.A",
-                 "30": "Hybrid EVDO Rev.B", "31": "eHPRD Rel.0",
-                 "32": "eHPRD Rel.A", "33": "eHPRD Rel.B",
-                 "34": "Hybrid eHPRD Rel.0", "35": "Hybrid eHPRD Rel.A",
-                 "36": "Hybrid eHPRD Rel.B", "41": "WCDMA", "42": "HSDPA",
-                 "43": "HSUPA", "44": "HSPA", "45": "HSPA+", "46": "DC-HSPA+",
-                 "61": "TD-SCDMA", "62": "TD-HSDPA", "63": "TD-HSUPA",
-                 "64": "TD-HSPA", "65": "TD-HSPA+", "81": "802.16e",
-                 "101": "LTE"}
-        res = xml.findtext("CurrentNetworkTypeEx", "0")
-        return types[res] if res != "" else None
-
-    def getNetworkTypeCur(self, xml):
-        types = {"0": "No service", "1": "GSM", "2": "GPRS", "3": "EDGE",
-                 "4": "WCDMA", "5": "HSDPA", "6": "HSUPA", "7": "HSPA",
-                 "8": "TD-SCDMA", "9": "HSPA+", "10": "EVDO Rev.0",
-                 "11": "EVDO Rev.A", "12": "EVDO Rev.B",
-                 "13": "1XRTT", "14": "UMB", "15": "1XEVDV",
-                 "16": "3XRTT", "17": "HSPA+ 64QAM", "18": "HSPA+ MIMO"}
-        res = xml.findtext("CurrentNetworkType")
-        return types[res]
-
-    def getNetworkType(self, xml):
-        return self.getNetworkTypeEx(xml) or self.getNetworkTypeCur(xml)
-
-    def getStatus(self, xml):
-        states = {"900": "Connecting...", "901": "Connected",
-                  "902": "Disconnected", "903": "Disconnecting..."}
-        return states[xml.findtext("ConnectionStatus", "902")]
-
-    def getOperator(self, xml):
-        shortName = xml.find("ShortName")
-        if shortName is not None:
-            return shortName.text
-        else:
-            fullName = xml.find("FullName")
-            if fullName is not None:
-                return fullName.text
-        return ""
-
-    def getSignalParams(self, xml):
-        params = ["rssi", "rsrp", "rsrq", "rscp", "ecio", "sinr",
-                  "cell_id", "pci"]
-        values = OrderedDict()
-
-        for key in params:
-            value = xml.findtext(key, "")
-            if value:
-                values[key] = "{key}: {val}".format(key=key.upper(),
-                                                    val=value)
-        return values
-
-    def getUnreadMessageCount(self, xml):
-        """Get number of unreaded messages"""
-        unreadMessage = xml.find("UnreadMessage")
-        if unreadMessage is not None:
-            return int(unreadMessage.text)
-        else:
-            return 0
+    @adaptive.setter
+    def adaptive(self, value):
+        self._scheduler.adaptive = value
+        self._intervalChanged.emit(self.interval)
 
-    def monitorMessages(self):
-        """Monitor count of unreaded messages"""
-        try:
-            notifyXml = self._getXml("/api/monitoring/check-notifications")
-            messageCount = self.getUnreadMessageCount(notifyXml)
-        except URLError:
-            self.unreadMessagesCountChanged.emit(0)
-        else:
-            self.unreadMessagesCountChanged.emit(messageCount)
+    def requestsPerMinute(self):
+        return self._scheduler.requestsPerMinute()
 
-    def monitorStatus(self):
-        """Monitor connection status"""
-        try:
-            statusXml = self._getXml("/api/monitoring/status")
-            plmnXml = self._getXml("/api/net/current-plmn")
-        except (URLError, socket.timeout):
-            self.levelChanged.emit(0)
-            self.statusChanged.emit("Modem offline", "")
-        else:
-            signalLevel = self.getSignalLevel(statusXml)
-            self.levelChanged.emit(signalLevel)
+    def finish(self):
+        """Stop monitoring, finished is emitted once everything is closed"""
+        self._finishRequested.emit()
+
+    def _finish(self):
+        self._requestTimer.stop()
+        self._dumpTimer.stop()
+        self.dumpDiagnostics()
+        self.poller.close()
+        if self._client.recorder is not None:
+            self._client.recorder.close()
+        self.finished.emit()
 
-            status = self.getStatus(statusXml)
-            networkType = self.getNetworkType(statusXml)
-            operator = self.getOperator(plmnXml)
+    def connect_(self):
+        self.request(CONNECT)
 
-            # fix space if we don't have op name
-            op = networkType
-            if operator:
-                op = "%s %s" % (operator, networkType)
-            self.statusChanged.emit(status, op)
+    def disconnect(self):
+        self.request(DISCONNECT)
 
-    def monitorSignalParams(self):
-        """Monitor signal parameters"""
+    def reboot(self):
+        self.request(REBOOT)
+
+    def request(self, command):
+        """Queue command without blocking, False if it is already queued
+
+        Result is reported by commandFinished.
+        """
+        if not self._commands.put(command):
+            return False
+        self._commandRequested.emit(command)
+        return True
+
+    def _runCommand(self, command):
+        if not self._commands.take(command):
+            # cancelled by opposite command
+            return
         try:
-            signalXml = self._getXml("/api/device/signal")
-        except (URLError, socket.timeout):
-            self.signalParamsChanged.emit({})
+            self._client.command(command)
+        except TransportError as e:
+            succeeded, error = False, str(e)
         else:
-            params = self.getSignalParams(signalXml)
-            self.signalParamsChanged.emit(params)
+            succeeded, error = True, ""
+        finally:
+            self._commands.done(command)
+            # show the new state without waiting for the next tick
+            self._scheduler.expedite(STATUS)
+            if self._requestTimer.isActive():
+                self._requestTimer.start(0)
+        self.commandFinished.emit(command, succeeded, error)
+
+    def _emitSnapshot(self, snapshot):
+        """Emit signals of fields changed since the last snapshot"""
+        changed = changedFields(self._emitted, snapshot)
+        self._emitted = snapshot
+
+        if "unread" in changed:
+            self.unreadMessagesCountChanged.emit(snapshot["unread"])
+        if "level" in changed:
+            self.levelChanged.emit(snapshot["level"])
+        if "status" in changed or "operator" in changed:
+            self.statusChanged.emit(snapshot["status"], snapshot["operator"])
+        if "params" in changed:
+            self.signalParamsChanged.emit(snapshot["params"])
 
     def monitor(self):
-        self._requestTimer.start()
+        self._requestTimer.start(0)
+        if self._diagnosticsLog:
+            self._dumpTimer.start()
+
+    def _scheduleNext(self):
+        delay = max(0, self.poller.nextTick() - time.time())
+        # QTimer uses milliseconds
+        self._requestTimer.start(int(delay * 1000))
 
     def _updateInfo(self):
-        self._updateTokens()
-        self.monitorMessages()
-        self.monitorStatus()
-        self.monitorSignalParams()
+        try:
+            self._poll()
+        finally:
+            # a failed tick must not stop polling
+            self._scheduleNext()
+
+    def _poll(self):
+        result = self.poller.tick()
+        if result is None:
+            return
+        self._emitSnapshot(self.poller.snapshot)
+        if result.throughputChanged:
+            throughput = self.poller.throughput
+            self.throughputChanged.emit(throughput.upload,
+                                        throughput.download,
+                                        throughput.history())
+        if result.newMessages:
+            self.messagesSynced.emit(result.newMessages)
@@ -0,0 +1,71 @@
+import re
+from xml.sax.saxutils import unescape
+
+
+# leaf element with text or empty <Tag/>, closing tag of a well-formed
+# document always matches the opening one
+_FIELD = re.compile(r"<([A-Za-z_][\w.-]*)(?:>([^<]*)</|\s*/>)")
+_ROOT = re.compile(r"<([A-Za-z_][\w.-]*)[\s>/]")
+
+
+class FlatResponse(dict):
+    """FlatResponse - fields of a flat HiLink document
+
+    Mimics the part of ElementTree.Element used to read responses: `tag`,
+    `findtext` and `len`. Empty tag means that modem didn't answer. Lists
+    parsed by parseRecords are kept in `records`.
+    """
+    __slots__ = ("tag", "records")
+
+    def __init__(self, tag="", fields=()):
+        super(FlatResponse, self).__init__(fields)
+        self.tag = tag
+        self.records = ()
+
+    def findtext(self, key, default=None):
+        return self.get(key, default)
+
+
+def parseFlat(data):
+    """Parse <response> or <error> document without building a tree
+
+    Only leaf elements are collected, nested documents are flattened.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", "replace")
+
+    start = data.find("?>") + 2 if data.startswith("<?") else 0
+    root = _ROOT.search(data, start)
+    if root is None:
+        return FlatResponse()
+
+    response = FlatResponse(root.group(1), _FIELD.findall(data, root.end()))
+    if "&" in data:
+        for key, text in response.items():
+            response[key] = _unescape(text)
+    return response
+
+
+def parseRecords(data, tag):
+    """Parse document with a list of <tag> records, like sms-list
+
+    Every record becomes a dict in `records` of the returned response,
+    the rest of document is parsed as by parseFlat.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", "replace")
+
+    record = re.compile(r"<%s>(.*?)</%s>" % (tag, tag), re.S)
+    records = [dict((key, _unescape(text))
+                    for key, text in _FIELD.findall(match.group(1)))
+               for match in record.finditer(data)]
+
+    response = parseFlat(record.sub("", data))
+    response.records = records
+    return response
+
+
+def _unescape(text):
+    if "&" in text:
+        return unescape(text, {"&quot;": '"', "&apos;": "'"})
+    return text
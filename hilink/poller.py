@@ -0,0 +1,179 @@
+"""Polling of a single modem for the tray and the daemon, doesn't import Qt"""
+from multiprocessing.pool import ThreadPool
+from hilink.client import ModemClient, NOTIFICATIONS, SIGNAL, TRAFFIC, \
+    SECTION_FIELDS, OFFLINE, emptySnapshot
+from hilink.breaker import CircuitBreaker
+from hilink.capabilities import discover, firmwareKey
+from hilink.history import SignalHistory
+from hilink.scheduler import EndpointScheduler, DEFAULT_INTERVALS
+from hilink.sms import syncInbox
+from hilink.traffic import ThroughputMeter
+from hilink.transport import TransportError
+import time
+
+
+class PollResult(object):
+    """What a single tick of ModemPoller has changed"""
+    __slots__ = ("sections", "throughputChanged", "newMessages")
+
+    def __init__(self, sections, throughputChanged=False, newMessages=0):
+        self.sections = sections
+        self.throughputChanged = throughputChanged
+        self.newMessages = newMessages
+
+
+class ModemPoller(object):
+    """ModemPoller - requests due endpoints of a modem and keeps its state
+
+    Every tick requests the endpoints the scheduler says are due, merges
+    them into `snapshot`, feeds history and throughput, publishes the
+    snapshot to `exporter` and `broadcaster`, syncs `smsCache` and probes
+    the firmware once. While the circuit breaker is open the modem is only
+    probed. The caller runs tick() at nextTick().
+    """
+
+    def __init__(self, client, intervals=None, adaptive=True,
+                 historyPath=None):
+        self.client = client
+        # endpoints of a tick are requested concurrently
+        self._pool = ThreadPool(len(ModemClient.sections))
+        self.snapshot = None
+        self.polls = 0
+        self.history = SignalHistory(historyPath)
+        self.throughput = ThroughputMeter()
+
+        allIntervals = dict(DEFAULT_INTERVALS)
+        allIntervals.update(intervals or {})
+        self.scheduler = EndpointScheduler(allIntervals, adaptive)
+        # stops polling an unplugged or rebooting modem
+        self.breaker = CircuitBreaker()
+
+        # hilink.sms.SmsCache filled once unread count changes
+        self.smsCache = None
+        # hilink.broadcast.SnapshotBroadcaster for local consumers
+        self.broadcaster = None
+        # hilink.export.ColumnarWriter of polled snapshots
+        self.exporter = None
+        # hilink.capabilities.CapabilityCache of probed firmwares
+        self.capabilityCache = None
+        # probed once the modem answers
+        self.capabilities = None
+        # unread count at the last inbox sync
+        self._syncedUnread = None
+
+    def deviceChanged(self):
+        """Forget what was learned about the modem, it may be another one"""
+        self.capabilities = None
+        self._syncedUnread = None
+        self.scheduler.setUnsupported(())
+        self.scheduler.reset()
+        self.breaker.succeeded()
+
+    def nextTick(self):
+        """Time of the next tick"""
+        if self.breaker.isOpen:
+            return self.breaker.nextProbe
+        return self.scheduler.nextDue()
+
+    def tick(self):
+        """Poll due endpoints, PollResult or None if nothing was polled"""
+        if self.breaker.isOpen and not self._probe():
+            return None
+        sections = self.scheduler.due()
+        if not sections:
+            return None
+
+        started = time.time()
+        responses = self.client.fetchAll(self._pool, sections)
+        if any(len(xml) for xml in responses.values()):
+            self.breaker.succeeded()
+        elif self.breaker.failed():
+            # report it once and stop polling until probe succeeds
+            self.snapshot = emptySnapshot()
+            self._publish(time.time())
+            return PollResult(sections)
+        self.snapshot = self.client.getSnapshot(responses, self.snapshot)
+
+        now = time.time()
+        for section in sections:
+            value = tuple(self.snapshot[field]
+                          for field in SECTION_FIELDS[section])
+            self.scheduler.update(section, value, now)
+        result = PollResult(sections)
+        if SIGNAL in sections:
+            self.history.append(now, self.snapshot["values"])
+        if TRAFFIC in sections:
+            result.throughputChanged = self._updateThroughput(now)
+        self.polls += 1
+        self._publish(now)
+        self.client.stats.recordTick(time.time() - started)
+        if NOTIFICATIONS in sections:
+            result.newMessages = self._syncMessages()
+        if self.capabilities is None and self.snapshot["status"] != OFFLINE:
+            self._discoverCapabilities()
+        return result
+
+    def close(self):
+        self._pool.close()
+        self.client.close()
+        self.history.close()
+        if self.exporter is not None:
+            self.exporter.close()
+        if self.broadcaster is not None:
+            self.broadcaster.close()
+
+    def _probe(self):
+        """Probe modem while breaker is open, True if polling can resume"""
+        if not self.breaker.probeDue():
+            return False
+        if not self.client.reachable():
+            self.breaker.probeFailed()
+            return False
+        self.breaker.probeSucceeded()
+        # anything may have changed while the modem was away
+        self.scheduler.reset()
+        return True
+
+    def _publish(self, now):
+        if self.exporter is not None:
+            self.exporter.append(now, self.snapshot)
+        if self.broadcaster is not None:
+            self.broadcaster.publish(dict(
+                self.snapshot, ip=self.client.ip, time=now,
+                upload=self.throughput.upload,
+                download=self.throughput.download))
+
+    def _updateThroughput(self, now):
+        """Feed traffic counters, True if the rates have changed"""
+        traffic = self.snapshot["traffic"]
+        if traffic is None:
+            return False
+        rates = (self.throughput.upload, self.throughput.download)
+        self.throughput.update(now, *traffic)
+        return rates != (self.throughput.upload, self.throughput.download)
+
+    def _syncMessages(self):
+        """Fetch new messages into sms cache, returns number of new ones"""
+        unread = self.snapshot["unread"]
+        if self.smsCache is None or unread == self._syncedUnread:
+            return 0
+        try:
+            new = syncInbox(self.client, self.smsCache)
+        except TransportError:
+            return 0
+        self._syncedUnread = unread
+        return new
+
+    def _discoverCapabilities(self):
+        """Probe firmware once, skip endpoints it doesn't have"""
+        key = firmwareKey(self.client.getDeviceInformation())
+        cache = self.capabilityCache
+        capabilities = None
+        if key is not None and cache is not None:
+            capabilities = cache.load(key)
+        if capabilities is None:
+            capabilities = discover(self.client, key)
+            if cache is not None:
+                cache.save(capabilities)
+        self.capabilities = capabilities
+        self.scheduler.setUnsupported(capabilities.unsupported)
@@ -0,0 +1,183 @@
+"""Recording of raw modem responses and their replay without network"""
+from array import array
+from bisect import bisect_right
+from hilink.transport import TransportError, TransportTimeout
+import os
+import struct
+import threading
+import time
+import zlib
+
+
+MAGIC = b"HLRC\x01"
+# time, latency, flags, length of "METHOD path", length of data
+_RECORD = struct.Struct("<dfBHI")
+
+# record flags
+COMPRESSED = 1
+# request failed, data is the error message
+FAILED = 2
+TIMED_OUT = 4
+
+
+class Recorder(object):
+    """Recorder - appends raw responses to a length-prefixed log
+
+    Every record is a fixed size header followed by "METHOD path" and the
+    response. With `compress` responses are zlib compressed when that makes
+    them smaller. The log is only ever appended to, so a recording cut short
+    stays readable up to its last complete record.
+    """
+
+    def __init__(self, path, compress=True):
+        self.path = path
+        self.compress = compress
+        new = not os.path.exists(path) or not os.path.getsize(path)
+        self._file = open(path, "ab")
+        if new:
+            self._file.write(MAGIC)
+        self._lock = threading.Lock()
+
+    def write(self, t, latency, method, section, data, flags=0):
+        key = ("%s %s" % (method, section)).encode("utf-8")
+        if self.compress:
+            packed = zlib.compress(data)
+            if len(packed) < len(data):
+                data, flags = packed, flags | COMPRESSED
+        record = _RECORD.pack(t, latency, flags, len(key), len(data))
+        with self._lock:
+            self._file.write(record + key + data)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def _readRecord(source):
+    """Next (time, latency, flags, key, data) of source, None at the end"""
+    header = source.read(_RECORD.size)
+    if len(header) < _RECORD.size:
+        return None
+    t, latency, flags, keySize, dataSize = _RECORD.unpack(header)
+    key = source.read(keySize)
+    data = source.read(dataSize)
+    if len(data) < dataSize:
+        # interrupted recording
+        return None
+    if flags & COMPRESSED:
+        data = zlib.decompress(data)
+    return (t, latency, flags, key.decode("utf-8"), data)
+
+
+def _openLog(path):
+    source = open(path, "rb")
+    if source.read(len(MAGIC)) != MAGIC:
+        source.close()
+        raise ValueError("%s is not a hilink recording" % path)
+    return source
+
+
+def readRecords(path):
+    """Iterate over (time, latency, flags, "METHOD path", data) of a log"""
+    source = _openLog(path)
+    try:
+        while True:
+            record = _readRecord(source)
+            if record is None:
+                return
+            yield record
+    finally:
+        source.close()
+
+
+class ReplayTransport(object):
+    """ReplayTransport - answers requests from a recording, without network
+
+    Drop-in replacement of ConnectionPool. Its clock starts at the first
+    record with the first request and runs `speed` times faster than real
+    time. A request is answered with the latest response recorded for it at
+    that clock, after the recorded latency (divided by speed); recorded
+    failures are raised again. Only an index of the log is kept in memory.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.host = path
+        self.speed = float(speed)
+        self.timeout = 1
+        self.created = 0
+        self.reused = 0
+
+        self._file = _openLog(path)
+        self._lock = threading.Lock()
+        self._started = None
+        # "METHOD path" -> (record times, record offsets)
+        self._index = {}
+        self.start = self.end = None
+        self._buildIndex()
+
+    def _buildIndex(self):
+        source = self._file
+        size = os.fstat(source.fileno()).st_size
+        while True:
+            offset = source.tell()
+            header = source.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                break
+            t, _, _, keySize, dataSize = _RECORD.unpack(header)
+            key = source.read(keySize).decode("utf-8")
+            source.seek(dataSize, os.SEEK_CUR)
+            if source.tell() > size:
+                # interrupted recording
+                break
+
+            times, offsets = self._index.setdefault(key, (array("d"),
+                                                          array("L")))
+            times.append(t)
+            offsets.append(offset)
+            if self.start is None:
+                self.start = t
+            self.end = t
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused}
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def clock(self):
+        """Time of the recording being replayed now"""
+        if self._started is None:
+            return self.start
+        return self.start + (time.time() - self._started) * self.speed
+
+    @property
+    def finished(self):
+        return self.start is None or self.clock() > self.end
+
+    def reachable(self, timeout=None):
+        return not self.finished
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        """Recorded response to request at the replay clock"""
+        with self._lock:
+            if self._started is None:
+                self._started = time.time()
+        if self.finished:
+            raise TransportError("%s %s: end of recording" % (method, path))
+
+        key = "%s %s" % (method, path)
+        if key not in self._index:
+            raise TransportError("%s %s: not recorded" % (method, path))
+        times, offsets = self._index[key]
+        position = max(0, bisect_right(times, self.clock()) - 1)
+        with self._lock:
+            self._file.seek(offsets[position])
+            _, latency, flags, _, data = _readRecord(self._file)
+
+        time.sleep(latency / self.speed)
+        if flags & TIMED_OUT:
+            raise TransportTimeout(data.decode("utf-8"))
+        if flags & FAILED:
+            raise TransportError(data.decode("utf-8"))
+        return data
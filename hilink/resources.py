@@ -0,0 +1,30 @@
+import importlib
+import sys
+
+
+_loaded = set()
+
+
+def _load(name):
+    if name in _loaded:
+        return
+
+    # load resources based on interpreter version
+    if sys.hexversion >= 0x3000000:
+        importlib.import_module("hilink.%s3_rc" % name)
+    else:
+        importlib.import_module("hilink.%s_rc" % name)
+    _loaded.add(name)
+
+
+def loadIcons():
+    """Register embedded tray icons with Qt, once"""
+    _load("icons")
+
+
+def loadSounds():
+    """Register embedded notification sound with Qt, once
+
+    It is most of the resource data, so it is left until it is played.
+    """
+    _load("sounds")
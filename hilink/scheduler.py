@@ -0,0 +1,85 @@
+import time
+from hilink.client import NOTIFICATIONS, STATUS, PLMN, SIGNAL, TRAFFIC
+
+
+# settings names of polled endpoints
+ENDPOINT_NAMES = (
+    (SIGNAL, "signal"),
+    (STATUS, "status"),
+    (PLMN, "operator"),
+    (NOTIFICATIONS, "messages"),
+    (TRAFFIC, "traffic"))
+
+# seconds between requests
+DEFAULT_INTERVALS = {SIGNAL: 2, STATUS: 2, PLMN: 60, NOTIFICATIONS: 30,
+                     TRAFFIC: 2}
+
+
+class EndpointScheduler(object):
+    """EndpointScheduler - decides which endpoints are due for a request
+
+    Every endpoint has its own interval. In adaptive mode an endpoint whose
+    value has changed is polled `fastFactor` times its interval, and a stable
+    one backs off step by step up to `slowFactor` times its interval.
+    Intervals are divided by `speed`, which is above 1 while replaying a
+    recording faster than real time.
+    """
+    speed = 1.0
+
+    def __init__(self, intervals, adaptive=True, fastFactor=0.5,
+                 slowFactor=4.0, backoff=1.5):
+        self.intervals = dict(intervals)
+        self.adaptive = adaptive
+        self.fastFactor = fastFactor
+        self.slowFactor = slowFactor
+        self.backoff = backoff
+
+        self._factors = dict.fromkeys(self.intervals, 1.0)
+        self._values = {}
+        self._due = dict.fromkeys(self.intervals, 0)
+        # endpoints the firmware doesn't have
+        self._unsupported = frozenset()
+
+    def setUnsupported(self, sections):
+        """Never request sections"""
+        self._unsupported = frozenset(sections)
+
+    def reset(self):
+        """Make every endpoint due now"""
+        self._factors = dict.fromkeys(self.intervals, 1.0)
+        self._due = dict.fromkeys(self.intervals, 0)
+
+    def expedite(self, section, now=None):
+        """Make section due now, e.g. to show the result of a command"""
+        self._due[section] = time.time() if now is None else now
+
+    def due(self, now=None):
+        now = time.time() if now is None else now
+        return tuple(section for section, due in self._due.items()
+                     if due <= now and section not in self._unsupported)
+
+    def nextDue(self):
+        """Time of the next request"""
+        return min(due for section, due in self._due.items()
+                   if section not in self._unsupported)
+
+    def update(self, section, value, now=None):
+        """Record polled value of section and schedule next request"""
+        now = time.time() if now is None else now
+        factor = 1.0
+        if self.adaptive and section in self._values:
+            if self._values[section] != value:
+                factor = self.fastFactor
+            else:
+                factor = min(self._factors[section] * self.backoff,
+                             self.slowFactor)
+        self._values[section] = value
+        self._factors[section] = factor
+        self._due[section] = now + self.intervals[section] * factor / \
+            self.speed
+
+    def requestsPerMinute(self):
+        """Current request rate according to adapted intervals"""
+        return sum(60.0 * self.speed / (self.intervals[section] * factor)
+                   for section, factor in self._factors.items()
+                   if section not in self._unsupported)
@@ -1,11 +1,13 @@
 from PySide import QtGui
+from hilink.scheduler import ENDPOINT_NAMES
 
 
 class SettingsDialog(QtGui.QDialog):
-    def __init__(self, ip, interval):
+    def __init__(self, ip, intervals, adaptive):
         super(SettingsDialog, self).__init__()
         self._ip = ip
-        self._interval = interval
+        self._intervals = dict(intervals)
+        self._adaptive = adaptive
 
         self.setupUi()
 
@@ -14,8 +16,12 @@ class SettingsDialog(QtGui.QDialog):
         return self._ip
 
     @property
-    def interval(self):
-        return self._interval
+    def intervals(self):
+        return self._intervals
+
+    @property
+    def adaptive(self):
+        return self._adaptive
 
     def setupUi(self):
         self.setWindowTitle("Settings")
@@ -25,9 +31,16 @@ class SettingsDialog(QtGui.QDialog):
         self._ipField.setText(self.ip)
         layout.addRow("IP:", self._ipField)
 
-        self._intervalField = QtGui.QLineEdit()
-        self._intervalField.setText(str(self.interval))
-        layout.addRow("Interval:", self._intervalField)
+        self._intervalFields = {}
+        for section, name in ENDPOINT_NAMES:
+            field = QtGui.QLineEdit()
+            field.setText(str(self.intervals[section]))
+            layout.addRow("%s interval:" % name.capitalize(), field)
+            self._intervalFields[section] = field
+
+        self._adaptiveField = QtGui.QCheckBox("Poll faster while changing")
+        self._adaptiveField.setChecked(self.adaptive)
+        layout.addRow("Adaptive:", self._adaptiveField)
 
         buttonBox = QtGui.QDialogButtonBox(QtGui.QDialogButtonBox.Ok | QtGui.QDialogButtonBox.Cancel)
         buttonBox.accepted.connect(self.onAccept)
@@ -38,5 +51,7 @@ class SettingsDialog(QtGui.QDialog):
 
     def onAccept(self):
         self._ip = self._ipField.text()
-        self._interval = int(self._intervalField.text())
+        for section, field in self._intervalFields.items():
+            self._intervals[section] = int(field.text())
+        self._adaptive = self._adaptiveField.isChecked()
         self.accept()
@@ -0,0 +1,85 @@
+import sqlite3
+import threading
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    modem TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    phone TEXT NOT NULL,
+    date TEXT NOT NULL,
+    content TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    PRIMARY KEY (modem, idx)
+);
+CREATE INDEX IF NOT EXISTS messages_date ON messages (modem, date);
+CREATE INDEX IF NOT EXISTS messages_phone ON messages (modem, phone, date);
+"""
+
+
+class SmsCache(object):
+    """SmsCache - local SQLite copy of modem inboxes
+
+    Shared between monitor and GUI threads, access is serialized.
+    """
+
+    def __init__(self, path=":memory:"):
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def knownIndexes(self, modem):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT idx FROM messages WHERE modem = ?", (modem,))
+            return set(row[0] for row in rows)
+
+    def add(self, modem, messages):
+        """Store messages as returned by ModemClient.getSmsPage"""
+        rows = [(modem, int(msg["Index"]), msg.get("Phone", ""),
+                 msg.get("Date", ""), msg.get("Content", ""),
+                 int(msg.get("Smstat") or 0)) for msg in messages]
+        with self._lock:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                    rows)
+
+    def latest(self, modem, limit=10):
+        """Newest messages as (phone, date, content) tuples"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT phone, date, content FROM messages WHERE modem = ? "
+                "ORDER BY date DESC LIMIT ?", (modem, limit)).fetchall()
+
+    def byPhone(self, modem, phone, limit=10):
+        with self._lock:
+            return self._db.execute(
+                "SELECT phone, date, content FROM messages "
+                "WHERE modem = ? AND phone = ? ORDER BY date DESC LIMIT ?",
+                (modem, phone, limit)).fetchall()
+
+
+def syncInbox(client, cache, pageSize=20):
+    """Fetch inbox messages missing in cache, returns number of new ones
+
+    The list is sorted newest first, so paging stops at the first page
+    holding an already known message.
+    """
+    known = cache.knownIndexes(client.ip)
+    new = []
+    page = 1
+    while True:
+        messages = client.getSmsPage(page, pageSize)
+        fresh = [msg for msg in messages if int(msg["Index"]) not in known]
+        new.extend(fresh)
+        if len(messages) < pageSize or len(fresh) < len(messages):
+            break
+        page += 1
+
+    cache.add(client.ip, new)
+    return len(new)
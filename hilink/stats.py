@@ -0,0 +1,114 @@
+from bisect import bisect_left
+import threading
+
+
+# upper bounds of latency histogram buckets in seconds, the last is +Inf
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# request outcomes
+OK = "ok"
+TIMEOUT = "timeout"
+ERROR = "error"
+API_ERROR = "api_error"
+PARSE_FAILURE = "parse_failure"
+OUTCOMES = (OK, TIMEOUT, ERROR, API_ERROR, PARSE_FAILURE)
+
+
+class Histogram(object):
+    """Counts of values per bucket, plus their sum"""
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, part):
+        """Upper bound of the bucket holding given part of values"""
+        if not self.count:
+            return 0.0
+        rank = part * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def toDict(self):
+        return {"buckets": list(BUCKETS), "counts": list(self.counts),
+                "sum": self.total, "count": self.count}
+
+
+class EndpointStats(object):
+    """Latency and outcomes of requests to a single endpoint"""
+    __slots__ = ("latency", "outcomes", "bytesSent", "bytesReceived")
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.bytesSent = 0
+        self.bytesReceived = 0
+
+    def toDict(self):
+        return {"latency": self.latency.toDict(),
+                "outcomes": dict(self.outcomes),
+                "bytes_sent": self.bytesSent,
+                "bytes_received": self.bytesReceived}
+
+
+class Instrumentation(object):
+    """Instrumentation - per endpoint request statistics of a modem"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.ticks = Histogram()
+        self._lock = threading.Lock()
+
+    def record(self, section, latency, sent, received, outcome):
+        with self._lock:
+            stats = self.endpoints.get(section)
+            if stats is None:
+                stats = self.endpoints[section] = EndpointStats()
+            stats.latency.add(latency)
+            stats.outcomes[outcome] += 1
+            stats.bytesSent += sent
+            stats.bytesReceived += received
+
+    def recordTick(self, duration):
+        with self._lock:
+            self.ticks.add(duration)
+
+    def toDict(self):
+        with self._lock:
+            return {"ticks": self.ticks.toDict(),
+                    "endpoints": dict((section, stats.toDict())
+                                      for section, stats
+                                      in self.endpoints.items())}
+
+    def format(self):
+        """Human readable report"""
+        with self._lock:
+            lines = ["Tick: %d, mean %.0f ms, p95 <= %.0f ms" % (
+                self.ticks.count, self.ticks.mean() * 1000,
+                self.ticks.quantile(0.95) * 1000)]
+            for section in sorted(self.endpoints):
+                stats = self.endpoints[section]
+                failures = ", ".join(
+                    "%s %d" % (outcome, stats.outcomes[outcome])
+                    for outcome in OUTCOMES[1:] if stats.outcomes[outcome])
+                lines.append("%s: %d, mean %.0f ms, p95 <= %.0f ms, %d B%s" % (
+                    section, stats.latency.count,
+                    stats.latency.mean() * 1000,
+                    stats.latency.quantile(0.95) * 1000,
+                    stats.bytesReceived,
+                    ", " + failures if failures else ""))
+        return "\n".join(lines)
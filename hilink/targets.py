@@ -0,0 +1,36 @@
+import socket
+import struct
+
+
+def expandTargets(specs):
+    """Expand ip addresses and subnets (192.168.8.0/24) to list of ips
+
+    Every spec may contain several comma separated targets.
+    """
+    targets = []
+    for spec in specs:
+        for target in spec.split(","):
+            target = target.strip()
+            if not target:
+                continue
+            if "/" not in target:
+                targets.append(target)
+                continue
+
+            network, bits = target.split("/")
+            bits = int(bits)
+            mask = (0xffffffff << (32 - bits)) & 0xffffffff
+            start = struct.unpack("!I", socket.inet_aton(network))[0] & mask
+            size = 1 << (32 - bits)
+            # skip network and broadcast addresses
+            hosts = range(size) if bits >= 31 else range(1, size - 1)
+            targets.extend(socket.inet_ntoa(struct.pack("!I", start + host))
+                           for host in hosts)
+    return targets
+
+
+def readTargets(path):
+    """Targets listed in a file, one or more per line, # starts a comment"""
+    with open(path) as targets:
+        return expandTargets(spec for line in targets
+                             for spec in line.split("#")[0].split())
@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+# wrong token, wrong session, wrong session token
+TOKEN_ERRORS = ("125001", "125002", "125003")
+
+
+def isTokenError(xml):
+    """Check if modem rejected request because of stale tokens"""
+    return xml.tag == "error" and xml.findtext("code") in TOKEN_ERRORS
+
+
+class TokenCache(object):
+    """TokenCache - session cookie and verification token with time to live
+
+    `fetch` is called without arguments and must return (session, token).
+    """
+
+    def __init__(self, fetch, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.refreshes = 0
+
+        self._fetch = fetch
+        self._headers = {}
+        self._expires = 0
+        self._lock = threading.Lock()
+
+    def stats(self):
+        return {"hits": self.hits, "refreshes": self.refreshes}
+
+    def headers(self):
+        """Cached request headers, refreshed once ttl is over"""
+        with self._lock:
+            if time.time() < self._expires:
+                self.hits += 1
+                return self._headers
+            return self._refresh()
+
+    def refresh(self, stale=None):
+        """Fetch new tokens
+
+        When `stale` headers are given, tokens are fetched only if nobody
+        replaced them yet, so concurrent failed requests refresh once.
+        """
+        with self._lock:
+            if stale is not None and stale is not self._headers:
+                return self._headers
+            return self._refresh()
+
+    def invalidate(self):
+        with self._lock:
+            self._expires = 0
+
+    def _refresh(self):
+        self.refreshes += 1
+        # don't hammer an unreachable modem, requests failing with token
+        # errors will refresh again
+        self._headers = {}
+        self._expires = time.time() + self.ttl
+
+        session, token = self._fetch()
+        self._headers = {"__RequestVerificationToken": token,
+                         "Cookie": session}
+        return self._headers
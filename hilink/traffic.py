@@ -0,0 +1,60 @@
+from array import array
+
+
+def formatRate(rate):
+    """Bytes per second as a human readable bit rate"""
+    bits = rate * 8
+    for unit in ("bit/s", "kbit/s", "Mbit/s"):
+        if bits < 1000:
+            return "%.0f %s" % (bits, unit) if unit == "bit/s" \
+                else "%.1f %s" % (bits, unit)
+        bits /= 1000.0
+    return "%.1f Gbit/s" % bits
+
+
+class ThroughputMeter(object):
+    """ThroughputMeter - upload and download rates from byte counters
+
+    Rates are smoothed with an exponentially weighted moving average whose
+    weight halves every `halfLife` seconds, so uneven polling intervals are
+    accounted for. The last `size` smoothed rates are kept for sparklines.
+    """
+
+    def __init__(self, halfLife=5.0, size=60):
+        self.halfLife = halfLife
+        self.upload = 0.0
+        self.download = 0.0
+
+        self._last = None
+        self._uploads = array("f", [0.0]) * size
+        self._downloads = array("f", [0.0]) * size
+        self._head = -1
+        self._count = 0
+
+    def update(self, t, upload, download):
+        """Feed counters of transferred bytes read at time t"""
+        last, self._last = self._last, (t, upload, download)
+        if last is None or t <= last[0]:
+            return
+        if upload < last[1] or download < last[2]:
+            # counters are reset on reconnect
+            return
+
+        elapsed = t - last[0]
+        # the first rate is taken as is
+        weight = 1 - 0.5 ** (elapsed / self.halfLife) if self._count else 1
+        self.upload += weight * ((upload - last[1]) / elapsed - self.upload)
+        self.download += weight * ((download - last[2]) / elapsed -
+                                   self.download)
+
+        self._head = (self._head + 1) % len(self._uploads)
+        self._count = min(self._count + 1, len(self._uploads))
+        self._uploads[self._head] = self.upload
+        self._downloads[self._head] = self.download
+
+    def history(self):
+        """Smoothed (upload, download) rates, oldest first"""
+        size = len(self._uploads)
+        start = self._head - self._count + 1
+        return [(self._uploads[i % size], self._downloads[i % size])
+                for i in range(start, start + self._count)]
@@ -0,0 +1,139 @@
+import socket
+import threading
+
+
+try:
+    from httplib import HTTPConnection, HTTPException
+except ImportError:  # >= 3.x
+    from http.client import HTTPConnection, HTTPException
+
+
+# requests that may be sent twice without effect on the modem
+IDEMPOTENT = ("GET", "HEAD")
+
+
+class TransportError(IOError):
+    """Request to the modem failed"""
+    # HTTP status of an answer other than 200
+    status = None
+
+
+class TransportTimeout(TransportError):
+    """Modem didn't answer in time"""
+
+
+class ConnectionPool(object):
+    """ConnectionPool - persistent HTTP/1.1 connections to a single host
+
+    Up to `size` idle connections are kept open and reused by the following
+    requests. A connection dropped by the modem while idle is replaced by a
+    new one transparently, unless a request that isn't idempotent (POST)
+    may have reached the modem already.
+    """
+
+    def __init__(self, host, size=4, timeout=1):
+        self.host = host
+        self.size = size
+        self.timeout = timeout
+        self.created = 0
+        self.reused = 0
+
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def stats(self):
+        return {"created": self.created, "reused": self.reused}
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def reachable(self, timeout=None):
+        """Cheap liveness check, no HTTP request is sent"""
+        return probe(self.host, timeout or self.timeout)
+
+    def request(self, method, path, body=None, headers=None, timeout=None):
+        """Send request and return response body"""
+        timeout = timeout or self.timeout
+        conn, reused = self._acquire(timeout)
+        sent = False
+        try:
+            conn.request(method, path, body, headers or {})
+            sent = True
+            return self._receive(conn, method, path)
+        except socket.timeout:
+            conn.close()
+            raise TransportTimeout("%s %s timed out" % (method, path))
+        except (socket.error, HTTPException) as e:
+            conn.close()
+            # don't reboot a modem twice
+            if not reused or sent and method not in IDEMPOTENT:
+                raise TransportError("%s %s: %s" % (method, path, e))
+
+        # modem closed idle keep-alive socket, retry once on a new one
+        conn = self._connect(timeout)
+        try:
+            conn.request(method, path, body, headers or {})
+            return self._receive(conn, method, path)
+        except socket.timeout:
+            conn.close()
+            raise TransportTimeout("%s %s timed out" % (method, path))
+        except (socket.error, HTTPException) as e:
+            conn.close()
+            raise TransportError("%s %s: %s" % (method, path, e))
+
+    def _receive(self, conn, method, path):
+        response = conn.getresponse()
+        data = response.read()
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+
+        if response.status != 200:
+            error = TransportError("%s %s: HTTP %d" % (method, path,
+                                                       response.status))
+            error.status = response.status
+            raise error
+        return data
+
+    def _acquire(self, timeout):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+
+        if conn is None:
+            return (self._connect(timeout), False)
+
+        with self._lock:
+            self.reused += 1
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return (conn, True)
+
+    def _release(self, conn):
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, timeout):
+        with self._lock:
+            self.created += 1
+        return HTTPConnection(self.host, timeout=timeout)
+
+
+def probe(host, timeout=1):
+    """Whether a TCP connection to host[:port] can be opened"""
+    address, port = host, 80
+    if ":" in host:
+        address, port = host.rsplit(":", 1)
+    try:
+        socket.create_connection((address, int(port)), timeout).close()
+    except socket.error:
+        return False
+    return True
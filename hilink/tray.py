@@ -1,25 +1,132 @@
 from PySide import QtCore, QtGui
 from hilink.modem import Modem
-from hilink.indicator import ModemIndicator
+from hilink.client import ModemClient, SIGNAL, STATUS
+from hilink.scheduler import ENDPOINT_NAMES, DEFAULT_INTERVALS
+from hilink.fleet import FleetMonitor
+from hilink.targets import expandTargets
+from hilink.indicator import ModemIndicator, FleetIndicator
+from hilink.sms import SmsCache
+from hilink import broadcast
+from hilink.capabilities import CapabilityCache
+from hilink.export import ColumnarWriter
+import os
+import socket
+import sys
 
 
 class Tray(QtCore.QObject):
     finished = QtCore.Signal()
 
-    def __init__(self, ip, interval):
+    def __init__(self, ip, interval, fleet=None, record=None, replay=None,
+                 speed=1.0):
         super(Tray, self).__init__()
-        modemIp, requestInterval = self.loadSettings(ip, interval)
-        self.setup(modemIp, requestInterval)
+        self._modem = None
+        self._fleet = None
+        modemIp, requestInterval, poolSize = self.loadSettings(ip, interval)
+        intervals, adaptive = self.loadIntervals(requestInterval, interval)
+
+        targets, concurrency = self.loadFleetSettings(fleet, ip)
+        if targets:
+            self.setupFleet(targets, requestInterval, concurrency)
+        else:
+            # replayed responses must not end up in the real history,
+            # export, inbox cache or with live consumers
+            historyPath = None if replay else self.loadHistoryPath()
+            self.setup(modemIp, poolSize, intervals, adaptive, historyPath)
+            if not replay:
+                self.loadDiagnosticsSettings()
+                self._modem.poller.smsCache = SmsCache(
+                    self.loadSmsCachePath())
+                self.setupBroadcast()
+                self.setupExport()
+                self._modem.poller.capabilityCache = CapabilityCache(
+                    self._createSettings)
+            if record:
+                self._modem.record(record)
+            if replay:
+                self._modem.replay(replay, speed)
+            settings = self._createSettings()
+            sparkline = settings.value("traffic/sparkline", False)
+            self._trayIndicator.sparkline = str(sparkline).lower() == "true"
 
     def loadSettings(self, ip, interval):
         settings = self._createSettings()
         modemIp = ip or settings.value("general/ip", "192.168.8.1")
         requestInterval = interval or int(settings.value("general/interval", 5))
-        return (modemIp, requestInterval)
+        poolSize = int(settings.value("general/poolSize", len(ModemClient.sections)))
+        return (modemIp, requestInterval, poolSize)
+
+    def loadIntervals(self, requestInterval, interval):
+        settings = self._createSettings()
+        intervals = {}
+        for section, name in ENDPOINT_NAMES:
+            default = DEFAULT_INTERVALS[section]
+            if section in (SIGNAL, STATUS):
+                default = requestInterval
+            intervals[section] = int(settings.value("intervals/" + name,
+                                                    default))
+
+        # command line overrides saved settings
+        if interval:
+            intervals[SIGNAL] = intervals[STATUS] = interval
+
+        adaptive = str(settings.value("intervals/adaptive", True)).lower()
+        return (intervals, adaptive == "true")
+
+    def loadHistoryPath(self):
+        """File keeping signal history between restarts, None keeps it in memory"""
+        settings = self._createSettings()
+        return settings.value("history/file", "") or None
+
+    def loadSmsCachePath(self):
+        settings = self._createSettings()
+        default = os.path.join(os.path.dirname(settings.fileName()),
+                               "sms.sqlite")
+        path = settings.value("sms/cache", default)
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        return path
+
+    def loadDiagnosticsSettings(self):
+        settings = self._createSettings()
+        log = settings.value("diagnostics/log", "")
+        if log:
+            interval = int(settings.value("diagnostics/interval", 300))
+            self._modem.setDiagnosticsLog(log, interval)
+
+    def setupBroadcast(self):
+        """Publish snapshots on a local socket, empty broadcast/socket disables"""
+        if not broadcast.supported():
+            return
+        settings = self._createSettings()
+        path = settings.value("broadcast/socket", broadcast.defaultPath())
+        if not path:
+            return
+        try:
+            self._modem.poller.broadcaster = broadcast.SnapshotBroadcaster(path)
+        except (socket.error, OSError) as e:
+            sys.stderr.write("hilink-tray: no local broadcast: %s\n" % e)
+
+    def setupExport(self):
+        """Stream snapshots to a columnar file set by export/file"""
+        settings = self._createSettings()
+        path = settings.value("export/file", "")
+        if path:
+            self._modem.poller.exporter = ColumnarWriter(path, self._modem.ip)
 
-    def setup(self, ip, interval):
+    def loadFleetSettings(self, fleet, ip):
+        settings = self._createSettings()
+        # a single modem given on the command line wins over saved targets
+        targets = fleet or ([] if ip else
+                            [settings.value("fleet/targets", "")])
+        concurrency = int(settings.value("fleet/concurrency", 32))
+        return (expandTargets(targets), concurrency)
+
+    def setup(self, ip, poolSize, intervals, adaptive, historyPath):
         self._monitorThread = QtCore.QThread()
-        self._modem = Modem(ip, interval)
+        self._modem = Modem(ip, None, poolSize, intervals, adaptive,
+                            historyPath)
         self._modem.moveToThread(self._monitorThread)
 
         self._modem.finished.connect(self._monitorThread.quit)
@@ -35,6 +142,25 @@ class Tray(QtCore.QObject):
             self._trayIndicator.signalParamsChanged, QtCore.Qt.QueuedConnection)
         self._modem.unreadMessagesCountChanged.connect(
             self._trayIndicator.needNotify, QtCore.Qt.QueuedConnection)
+        self._modem.throughputChanged.connect(
+            self._trayIndicator.throughputChanged, QtCore.Qt.QueuedConnection)
+        self._modem.commandFinished.connect(
+            self._trayIndicator.commandFinished, QtCore.Qt.QueuedConnection)
+
+    def setupFleet(self, targets, interval, concurrency):
+        self._monitorThread = QtCore.QThread()
+        self._fleet = FleetMonitor(targets, interval, concurrency)
+        self._fleet.moveToThread(self._monitorThread)
+
+        self._fleet.finished.connect(self._monitorThread.quit)
+        self._monitorThread.finished.connect(self.quit)
+        self._monitorThread.started.connect(self._fleet.monitor)
+
+        self._trayIndicator = FleetIndicator(self._fleet)
+        self._fleet.updated.connect(
+            self._trayIndicator.fleetChanged, QtCore.Qt.QueuedConnection)
+        self._fleet.commandFinished.connect(
+            self._trayIndicator.commandFinished, QtCore.Qt.QueuedConnection)
 
     def show(self):
         self._trayIndicator.show()
@@ -46,8 +172,21 @@ class Tray(QtCore.QObject):
 
     def saveSettings(self):
         settings = self._createSettings()
+        if self._fleet is not None:
+            settings.setValue("general/interval", self._fleet.interval)
+            settings.setValue("fleet/targets", ",".join(self._fleet.targets))
+            settings.setValue("fleet/concurrency", self._fleet.concurrency)
+            return
+
+        settings.remove("fleet/targets")
         settings.setValue("general/ip", self._modem.ip)
         settings.setValue("general/interval", self._modem.interval)
+        settings.setValue("general/poolSize", self._modem.poolSize)
+
+        intervals = self._modem.intervals
+        for section, name in ENDPOINT_NAMES:
+            settings.setValue("intervals/" + name, intervals[section])
+        settings.setValue("intervals/adaptive", self._modem.adaptive)
 
     def _createSettings(self):
         return QtCore.QSettings(QtCore.QSettings.IniFormat, QtCore.QSettings.UserScope, "HiLink Tray", "hilink")